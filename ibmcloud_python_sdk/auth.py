@@ -1,10 +1,23 @@
+import threading
+import time
 from ibmcloud_python_sdk.utils import constants
 from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.config import sdk
 from ibmcloud_python_sdk.utils import common
 from jwt import decode
 
 cfg = params()
+config = sdk()
 headers = {}
+# Last response returned by IAM, used to get the refresh token and the
+# token expiration.
+token_info = {}
+
+# Required headers for IAM token requests
+headers_auth = {
+    'Content-Type': 'application/x-www-form-urlencoded',
+    'Accept': 'application/json',
+}
 
 
 def decode_token():
@@ -15,6 +28,11 @@ def decode_token():
     """
     try:
         token = get_headers()["Authorization"]
+        # Claims of the managed token are decoded once when it's retrieved
+        claims = tokens.claims
+        if token == tokens.token and claims:
+            return claims
+
         return decode(token.split(" ")[1], verify=False)
 
     except Exception as error:
@@ -36,17 +54,14 @@ def get_token(url, key):
     payload = ("grant_type=urn:ibm:params:oauth:grant-type:"
                "apikey&apikey={}".format(key))
 
-    # Required headers
-    headers_auth = {
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Accept': 'application/json',
-    }
-
     try:
         # Retrieve data
         data = common.query_wrapper("auth", "POST", "/identity/token",
                                     headers_auth, payload)["data"]
 
+        token_info.clear()
+        token_info.update(data)
+
         # Concatenate token type and token value
         return data['token_type'] + ' ' + data['access_token']
 
@@ -56,6 +71,193 @@ def get_token(url, key):
         raise
 
 
+def refresh_token(url, token):
+    """Generate JWT IAM token from a refresh token
+
+    :param url: IAM URL
+    :type url: string
+    :param token: Refresh token returned with the previous IAM token
+    :type token: string
+    :return: IAM token
+    :rtype: string
+    """
+    # Payload for refreshing token
+    payload = "grant_type=refresh_token&refresh_token={}".format(token)
+
+    # IAM requires the default client credentials for this grant type
+    headers_refresh = dict(headers_auth)
+    headers_refresh["Authorization"] = "Basic Yng6Yng="
+
+    try:
+        # Retrieve data
+        data = common.query_wrapper("auth", "POST", "/identity/token",
+                                    headers_refresh, payload)["data"]
+
+        token_info.clear()
+        token_info.update(data)
+
+        # Concatenate token type and token value
+        return data['token_type'] + ' ' + data['access_token']
+
+    # If an error happens while refreshing token
+    except Exception as error:
+        print("Error refreshing token. {}".format(error))
+        raise
+
+
+class TokenManager():
+    """Keep an IAM token valid for the lifetime of the process
+
+    The token is refreshed in the background once it is about to expire,
+    callers keep getting the current token meanwhile. A caller only waits
+    when there is no token yet or when it has already expired. A single
+    request is sent to IAM whatever the number of threads asking for a
+    token.
+    """
+
+    def __init__(self, key=None, url=constants.AUTH_URL,
+                 margin=constants.TOKEN_REFRESH_MARGIN):
+        self.key = key
+        self.url = url
+        self.margin = margin
+        self.token = None
+        self.expires = 0
+        self.refresh_token = None
+        self.claims = {}
+        self.account_id = None
+        self.iam_id = None
+        self.lock = threading.Lock()
+        self.refreshing = False
+        self.refreshing_lock = threading.Lock()
+
+    def get_token(self):
+        """Retrieve the current IAM token
+
+        :return: IAM token
+        :rtype: string
+        """
+        token = self.token
+        now = time.time()
+        if token is None or now >= self.expires:
+            return self.refresh()
+
+        if now >= self.expires - self.margin:
+            self.refresh_in_background()
+
+        return token
+
+    def refresh(self, force=False):
+        """Retrieve a new IAM token unless another thread just did it
+
+        :param force: Retrieve a new token even if the current one is valid
+        :type force: bool, optional
+        :return: IAM token
+        :rtype: string
+        """
+        with self.lock:
+            if (not force and self.token is not None
+                    and time.time() < self.expires - self.margin):
+                return self.token
+
+            token = None
+            token_info.clear()
+            if self.refresh_token:
+                try:
+                    token = refresh_token(self.url, self.refresh_token)
+                except Exception:
+                    # Fallback to the API key grant
+                    token = None
+            if token is None:
+                token = get_token(self.url, self.key or cfg["key"])
+
+            claims = self.decode(token)
+            self.refresh_token = token_info.get("refresh_token")
+            self.claims = claims
+            self.account_id = claims.get("account", {}).get("bss")
+            self.iam_id = claims.get("iam_id")
+            self.expires = self.expiration(token, claims)
+            self.token = token
+
+            if self.account_id:
+                common.remember_account(token, self.account_id)
+
+            return token
+
+    def refresh_in_background(self):
+        """Refresh the IAM token from a background thread"""
+        with self.refreshing_lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+
+        thread = threading.Thread(target=self._background_refresh,
+                                  daemon=True)
+        thread.start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh(force=True)
+        except Exception as error:
+            # The current token is still valid, next call will retry
+            print("Error refreshing token in background. {}".format(error))
+        finally:
+            with self.refreshing_lock:
+                self.refreshing = False
+
+    def decode(self, token):
+        """Decode the claims of a token
+
+        :param token: IAM token
+        :type token: string
+        :return: JSON JWT information or an empty dict if the token can't
+            be decoded
+        :rtype: dict
+        """
+        try:
+            return decode(token.split(" ")[1], verify=False)
+        except Exception:
+            return {}
+
+    def expiration(self, token, claims=None):
+        """Retrieve the expiration time of a token
+
+        The "exp" claim of the JWT is used, then the expiration returned by
+        IAM, then the default token lifetime.
+
+        :param token: IAM token
+        :type token: string
+        :param claims: Claims already decoded from the token
+        :type claims: dict, optional
+        :return: Expiration as a UNIX timestamp
+        :rtype: float
+        """
+        if claims is None:
+            claims = self.decode(token)
+
+        exp = claims.get("exp")
+        if exp:
+            return float(exp)
+
+        if token_info.get("expiration"):
+            return float(token_info["expiration"])
+
+        return time.time() + constants.TOKEN_LIFETIME
+
+    def reset(self):
+        """Forget the current token"""
+        with self.lock:
+            self.token = None
+            self.expires = 0
+            self.refresh_token = None
+            self.claims = {}
+            self.account_id = None
+            self.iam_id = None
+
+
+tokens = TokenManager(margin=(config or {}).get(
+    "token_refresh_margin", constants.TOKEN_REFRESH_MARGIN))
+
+
 def get_headers():
     """Generates the headers used for authenticated HTTP request.
 
@@ -66,8 +268,7 @@ def get_headers():
         headers["Content-Type"] = "application/json"
         headers["Accept"] = "application/json"
         headers["User-Agent"] = constants.USER_AGENT
-        headers["Authorization"] = get_token(constants.AUTH_URL, cfg["key"])
 
-        return headers
+    headers["Authorization"] = tokens.get_token()
 
     return headers
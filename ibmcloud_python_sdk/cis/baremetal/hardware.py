@@ -1,5 +1,6 @@
 from ibmcloud_python_sdk.utils import softlayer as sl
 from ibmcloud_python_sdk.utils.common import resource_not_found
+from ibmcloud_python_sdk.utils.common import resolve
 from ibmcloud_python_sdk.utils.common import resource_error
 from ibmcloud_python_sdk.utils.common import check_args
 
@@ -35,18 +36,8 @@ class Hardware():
         :return: Baremetal server information
         :rtype: dict
         """
-        by_name = self.get_baremetal_by_name(baremetal)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_baremetal_by_id(baremetal)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(baremetal, self.get_baremetal_by_id,
+                       self.get_baremetal_by_name)
 
     def get_baremetal_by_id(self, id):
         """Retrieve specific baremetal by ID
@@ -1,13 +1,161 @@
 from ibmcloud_python_sdk.utils import constants
-from os import environ, path
+from contextlib import contextmanager
+from contextvars import ContextVar
+from os import environ, path, stat
+import threading
 import yaml
 
+lock = threading.Lock()
+# Parsed clouds.yaml files keyed by path and configuration name, along with
+# the modification time of the file when it has been parsed.
+loaded = {}
+watcher = {}
+# Region overriding the configured one for the current thread or task
+current_region = ContextVar("current_region", default=None)
 
-def params():
+
+def _creds_file():
     creds = "{}/.ibmcloud/clouds.yaml".format(environ.get('HOME'))
     if "IC_CONFIG_FILE" in environ:
         creds = environ.get("IC_CONFIG_FILE")
 
+    return creds
+
+
+def _mtime(creds):
+    try:
+        return stat(creds).st_mtime
+    except OSError:
+        return None
+
+
+def params():
+    """Retrieve the cloud configuration
+
+    clouds.yaml or the environment variables are only read the first time,
+    next calls return the cached configuration. Use reload() or watch() to
+    pick up changes.
+
+    :return: Cloud configuration
+    :rtype: dict
+    """
+    key = (_creds_file(), environ.get("IC_CONFIG_NAME"))
+    entry = loaded.get(key)
+    if entry is None:
+        return _regional(reload())
+
+    return _regional(dict(entry[1]))
+
+
+@contextmanager
+def region(name):
+    """Send the requests done within the block to another region
+
+    The region is only overridden for the current thread or asyncio task,
+    so several regions could be queried at the same time.
+
+    :param name: Region name such as "eu-de"
+    :type name: str
+    """
+    token = current_region.set(name)
+    try:
+        yield name
+    finally:
+        current_region.reset(token)
+
+
+def _regional(option):
+    name = current_region.get()
+    if not option or not name or option.get("region") == name:
+        return option
+
+    option["region"] = name
+    option["is_url"] = "{}.{}".format(name, constants.IS_URL)
+    option["pi_url"] = "{}.{}".format(name, constants.PI_URL)
+
+    return option
+
+
+def reload():
+    """Read the cloud configuration again if the file has changed
+
+    The environment variables are always read again when there is no
+    configuration file.
+
+    :return: Cloud configuration
+    :rtype: dict
+    """
+    creds = _creds_file()
+    key = (creds, environ.get("IC_CONFIG_NAME"))
+    mtime = _mtime(creds)
+
+    with lock:
+        entry = loaded.get(key)
+        # Without configuration file the environment variables are read
+        # again, they can't be watched
+        if entry is not None and mtime is not None and entry[0] == mtime:
+            return dict(entry[1])
+
+        option = _load(creds)
+        if option is not None:
+            loaded[key] = (mtime, option)
+
+    return dict(option) if option is not None else option
+
+
+def watch(interval=constants.CONFIG_WATCH_INTERVAL):
+    """Reload the cloud configuration in the background when it changes
+
+    The modification time of the loaded files is checked every `interval`
+    seconds.
+
+    :param interval: Seconds between two checks
+    :type interval: int, optional
+    """
+    with lock:
+        if watcher.get("thread"):
+            return
+        stop = threading.Event()
+        thread = threading.Thread(target=_watch, args=(interval, stop),
+                                  daemon=True)
+        watcher["thread"] = thread
+        watcher["stop"] = stop
+
+    thread.start()
+
+
+def unwatch():
+    """Stop watching the cloud configuration"""
+    with lock:
+        stop = watcher.pop("stop", None)
+        watcher.pop("thread", None)
+
+    if stop:
+        stop.set()
+
+
+def _watch(interval, stop):
+    while not stop.wait(interval):
+        for (creds, name), (mtime, option) in list(loaded.items()):
+            if _mtime(creds) == mtime:
+                continue
+            try:
+                option = _load(creds, name)
+            except Exception as error:
+                print("Error reloading config file: {}. {}".format(
+                    creds, error))
+                continue
+            with lock:
+                if option is not None:
+                    loaded[(creds, name)] = (_mtime(creds), option)
+                else:
+                    loaded.pop((creds, name), None)
+
+
+def _load(creds, name=None):
+    if name is None:
+        name = environ.get("IC_CONFIG_NAME")
+
     option = {}
     option["auth_url"] = constants.AUTH_URL
     option["dns_url"] = constants.DNS_URL
@@ -45,8 +193,8 @@ def params():
     if "default" in config["clouds"]:
         cloud = config["clouds"][config["clouds"]["default"]]
     else:
-        if "IC_CONFIG_NAME" in environ:
-            cloud = config["clouds"][environ.get("IC_CONFIG_NAME")]
+        if name:
+            cloud = config["clouds"][name]
         else:
             raise Exception("Configuration name should be defined.")
 
@@ -86,3 +234,9 @@ def sdk():
         return options
 
     return False
+
+
+# Watch clouds.yaml changes only when requested in sdk.yaml
+sdk_options = sdk()
+if sdk_options and sdk_options.get("config_watch_interval"):
+    watch(sdk_options["config_watch_interval"])
@@ -6,8 +6,10 @@ from ibmcloud_python_sdk.resource import resource_instance
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Dns():
 
     def __init__(self):
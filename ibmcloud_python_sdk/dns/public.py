@@ -3,8 +3,10 @@ import SoftLayer
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Dns():
     """Public dns class
     """
@@ -5,8 +5,10 @@ from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.resource import resource_instance
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Policy():
 
     def __init__(self):
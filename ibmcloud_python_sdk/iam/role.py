@@ -1,13 +1,18 @@
 import json
+from functools import partial
 
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.resource import resource_instance
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Role():
 
     def __init__(self):
@@ -43,18 +48,9 @@ class Role():
         :return: System role information
         :rtype: dict
         """
-        by_name = self.get_system_role_by_name(account, role)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "role_not_found":
-                    by_id = self.get_system_role_by_id(account, role)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(role, partial(self.get_system_role_by_id, account),
+                       partial(self.get_system_role_by_name, account),
+                       code="role_not_found")
 
     def get_system_role_by_id(self, account, id):
         """Retrieve specific system role by ID
@@ -143,18 +139,9 @@ class Role():
         :return: Service role information
         :rtype: dict
         """
-        by_name = self.get_service_role_by_name(account, service, role)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "role_not_found":
-                    by_id = self.get_service_role_by_id(account, service, role)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        by_id = partial(self.get_service_role_by_id, account, service)
+        by_name = partial(self.get_service_role_by_name, account, service)
+        return resolve(role, by_id, by_name, code="role_not_found")
 
     def get_service_role_by_id(self, account, service, id):
         """Retrieve specific service role by ID
@@ -214,6 +201,7 @@ class Role():
             print("Error fetching role from service {} with name {}."
                   " {}".format(service, name, error))
 
+    @invalidate
     def create_role(self, **kwargs):
         """Create role
 
@@ -265,6 +253,7 @@ class Role():
         except Exception as error:
             print("Error creating role. {}".format(error))
 
+    @invalidate
     def delete_role(self, role):
         """Delete role
 
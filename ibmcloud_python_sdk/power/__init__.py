@@ -3,7 +3,7 @@ from ibmcloud_python_sdk.utils import constants
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import decode_token
 from ibmcloud_python_sdk.resource import resource_instance
-from ibmcloud_python_sdk.auth import get_token
+from ibmcloud_python_sdk.auth import tokens
 
 cfg = params()
 ri = resource_instance.ResourceInstance()
@@ -25,7 +25,7 @@ def get_power_headers(**kwargs):
     # Build dict of argument and assign default value when needed
     args = {
         'region': kwargs.get('region', cfg["region"]),
-        'account': kwargs.get('account', decode_token()['account']['bss']),
+        'account': kwargs.get('account'),
         'instance': kwargs.get('instance'),
     }
 
@@ -34,6 +34,9 @@ def get_power_headers(**kwargs):
         if args['instance']:
             ri_info = ri.get_resource_instance(args['instance'])
         else:
+            # Token claims are only needed the first time
+            if not args['account']:
+                args['account'] = decode_token()['account']['bss']
             # Automatically detect if power-iaas service exists.
             regex = "crn:v1:bluemix:public:power-iaas:{}:a/{}".format(
                 args['region'], args['account'])
@@ -50,10 +53,9 @@ def get_power_headers(**kwargs):
         power_headers["Content-Type"] = "application/json"
         power_headers["Accept"] = "application/json"
         power_headers["User-Agent"] = constants.USER_AGENT
-        power_headers["Authorization"] = get_token(
-            constants.AUTH_URL, cfg["key"])
         power_headers['CRN'] = ri_info
 
-        return power_headers
+    # Token is refreshed by the token manager before it expires
+    power_headers["Authorization"] = tokens.get_token()
 
     return power_headers
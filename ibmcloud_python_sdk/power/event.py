@@ -2,8 +2,10 @@ from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.power import instance
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Event():
 
     def __init__(self):
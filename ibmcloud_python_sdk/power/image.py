@@ -1,13 +1,19 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.power import instance
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Image():
 
     def __init__(self):
@@ -30,6 +36,23 @@ class Image():
         except Exception as error:
             print("Error fetching images. {}".format(error))
 
+    def iter_images(self):
+        """Iterate over image list
+
+        :return: Generator of images
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for images
+            path = ("/pcloud/v1/images")
+
+            # Yield data page by page
+            yield from query_items("power", path, headers(), "images",
+                                   limit=None, query=qw)
+
+        except Exception as error:
+            print("Error fetching images. {}".format(error))
+
     def get_image(self, image):
         """Retrieve specific image by name or by ID
 
@@ -38,18 +61,7 @@ class Image():
         :return: Image information
         :rtype: dict
         """
-        by_name = self.get_image_by_name(image)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_image_by_id(image)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(image, self.get_image_by_id, self.get_image_by_name)
 
     def get_image_by_id(self, id):
         """Retrieve specific image by ID
@@ -78,13 +90,10 @@ class Image():
         :rtype: dict
         """
         try:
-            # Retrieve images
-            data = self.get_images()
-            if "errors" in data:
-                return data
-
-            # Loop over images until filter match
-            for image in data['images']:
+            # Loop over images page by page until filter match
+            for image in self.iter_images():
+                if "errors" in image:
+                    return image
                 if image["name"] == name:
                     # Return data
                     return image
@@ -119,6 +128,32 @@ class Image():
             print("Error fetching images for cloud instance {}. {}".format(
                 instance, error))
 
+    def iter_instance_images(self, instance):
+        """Iterate over images for a cloud instance
+
+        :param instance: Cloud instance ID
+        :type instance: str
+        :return: Generator of images per instance
+        :rtype: generator
+        """
+        try:
+            ci_info = self.instance.get_instance(instance)
+            if "errors" in ci_info:
+                yield ci_info
+                return
+
+            # Connect to api endpoint for images
+            path = ("/pcloud/v1/cloud-instances/{}/images".format(
+                ci_info["name"]))
+
+            # Yield data page by page
+            yield from query_items("power", path, headers(), "images",
+                                   limit=None, query=qw)
+
+        except Exception as error:
+            print("Error fetching images for cloud instance {}. {}".format(
+                instance, error))
+
     def get_instance_image(self, instance, image):
         """Retrieve specific image by name or by ID for a cloud instance
 
@@ -129,18 +164,9 @@ class Image():
         :return: Image information
         :rtype: dict
         """
-        by_name = self.get_instance_image_by_name(image)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_image_by_id(image)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        by_id = partial(self.get_instance_image_by_id, instance)
+        by_name = partial(self.get_instance_image_by_name, instance)
+        return resolve(image, by_id, by_name)
 
     def get_instance_image_by_id(self, instance, id):
         """Retrieve specific image by ID for a cloud instance
@@ -185,13 +211,10 @@ class Image():
             if "errors" in ci_info:
                 return ci_info
 
-            # Retrieve images for a cloud instance
-            data = self.get_instance_images(ci_info["name"])
-            if "errors" in data:
-                return data
-
-            # Loop over images until filter match
-            for image in data['images']:
+            # Loop over images page by page until filter match
+            for image in self.iter_instance_images(ci_info["name"]):
+                if "errors" in image:
+                    return image
                 if image["name"] == name:
                     # Return data
                     return image
@@ -203,6 +226,7 @@ class Image():
             print("Error fetching image with name {} for cloud instance {}."
                   "{}".format(name, instance, error))
 
+    @invalidate
     def create_instance_image(self, **kwargs):
         """Create image for a cloud instance
 
@@ -334,6 +358,7 @@ class Image():
             print("Error exporting image {} for cloud instance {}. {}".format(
                 args['image'], args['instance'], error))
 
+    @invalidate
     def delete_instance_image(self, instance, image):
         """Delete cloud instance image
 
@@ -4,8 +4,10 @@ from ibmcloud_python_sdk.utils.common import query_wrapper as qw
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Key():
 
     def __init__(self):
@@ -1,13 +1,19 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.power import instance
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Network():
 
     def __init__(self):
@@ -39,6 +45,33 @@ class Network():
             print("Error fetching Power Virtual Instance list for cloud"
                   " instance {}. {}".format(instance, error))
 
+    def iter_networks(self, instance):
+        """Iterate over network list from cloud instance
+
+        :param instance: Cloud instance ID
+        :type instance: str
+        :return: Generator of networks
+        :rtype: generator
+        """
+        try:
+            # Check if cloud instance exists and retrieve information
+            ci_info = self.instance.get_instance(instance)
+            if "errors" in ci_info:
+                yield ci_info
+                return
+
+            # Connect to api endpoint for cloud-instances
+            path = ("/pcloud/v1/cloud-instances/{}/networks".format(
+                ci_info["name"]))
+
+            # Yield data page by page
+            yield from query_items("power", path, headers(), "networks",
+                                   limit=None, query=qw)
+
+        except Exception as error:
+            print("Error fetching Power Virtual Instance list for cloud"
+                  " instance {}. {}".format(instance, error))
+
     def get_network(self, instance, network):
         """Retrieve specific network by name or by ID
 
@@ -49,18 +82,8 @@ class Network():
         :return: Network information
         :rtype: dict
         """
-        by_name = self.get_pvm_by_name(instance, network)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_by_id(instance, network)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(network, partial(self.get_network_by_id, instance),
+                       partial(self.get_network_by_name, instance))
 
     def get_network_by_id(self, instance, id):
         """Retrieve specific network by ID
@@ -105,13 +128,10 @@ class Network():
             if "errors" in ci_info:
                 return ci_info
 
-            # Retrieve networks
-            data = self.get_networks(ci_info["name"])
-            if "errors" in data:
-                return data
-
-            # Loop over networks until filter match
-            for network in data['networks']:
+            # Loop over networks page by page until filter match
+            for network in self.iter_networks(ci_info["name"]):
+                if "errors" in network:
+                    return network
                 if network["name"] == name:
                     # Return data
                     return network
@@ -191,6 +211,7 @@ class Network():
             print("Error fetching port with ID {} from network {} for cloud"
                   " instance {}. {}".format(id, network, instance, error))
 
+    @invalidate
     def create_network(self, **kwargs):
         """Create network
 
@@ -254,6 +275,7 @@ class Network():
             print("Error creating network for cloud instance {}. {}".format(
                 args['instance'], error))
 
+    @invalidate
     def create_port(self, **kwargs):
         """Create network
 
@@ -311,6 +333,7 @@ class Network():
             print("Error creating port in network {} for cloud instance {}."
                   " {}".format(args['network'], args['instance'], error))
 
+    @invalidate
     def delete_network(self, instance, network):
         """Delete network from cloud instance
 
@@ -347,6 +370,7 @@ class Network():
             print("Error deleting network {} from cloud instance {}."
                   " {}".format(network, instance, error))
 
+    @invalidate
     def delete_port(self, instance, network, port):
         """Delete port from network
 
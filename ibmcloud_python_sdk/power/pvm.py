@@ -1,13 +1,19 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.power import instance
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Pvm():
 
     def __init__(self):
@@ -39,6 +45,33 @@ class Pvm():
             print("Error fetching Power Virtual Instance list for cloud"
                   " instance {}. {}".format(instance, error))
 
+    def iter_pvms(self, instance):
+        """Iterate over Power Virtual Instance list for specific cloud instance
+
+        :param instance: Cloud instance ID
+        :type instance: str
+        :return: Generator of PVMs
+        :rtype: generator
+        """
+        try:
+            # Check if cloud instance exists and retrieve information
+            ci_info = self.instance.get_instance(instance)
+            if "errors" in ci_info:
+                yield ci_info
+                return
+
+            # Connect to api endpoint for cloud-instances
+            path = ("/pcloud/v1/cloud-instances/{}/pvm-instances".format(
+                ci_info["name"]))
+
+            # Yield data page by page
+            yield from query_items("power", path, headers(), "pvmInstances",
+                                   limit=None, query=qw)
+
+        except Exception as error:
+            print("Error fetching Power Virtual Instance list for cloud"
+                  " instance {}. {}".format(instance, error))
+
     def get_pvm(self, instance, pvm):
         """Retrieve specific Power Virtual Instance by name or by ID
 
@@ -49,18 +82,8 @@ class Pvm():
         :return: PVM information
         :rtype: dict
         """
-        by_name = self.get_pvm_by_name(instance, pvm)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_by_id(instance, pvm)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(pvm, partial(self.get_pvm_by_id, instance),
+                       partial(self.get_pvm_by_name, instance))
 
     def get_pvm_by_id(self, instance, id):
         """Retrieve specific Power Virtual Instance by ID
@@ -105,13 +128,10 @@ class Pvm():
             if "errors" in ci_info:
                 return ci_info
 
-            # Retrieve pvms
-            data = self.get_pvms(ci_info["name"])
-            if "errors" in data:
-                return data
-
-            # Loop over pvms until filter match
-            for pvm in data['pvmInstances']:
+            # Loop over pvms page by page until filter match
+            for pvm in self.iter_pvms(ci_info["name"]):
+                if "errors" in pvm:
+                    return pvm
                 if pvm["serverName"] == name:
                     # Return data
                     return pvm
@@ -168,18 +188,9 @@ class Pvm():
         :return: PVM network information
         :rtype: dict
         """
-        by_name = self.get_pvm_network_by_name(instance, pvm, network)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_network_by_id(instance, pvm, network)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(network,
+                       partial(self.get_pvm_network_by_id, instance, pvm),
+                       partial(self.get_pvm_network_by_name, instance, pvm))
 
     def get_pvm_network_by_id(self, instance, pvm, id):
         """Retrieve specific network from Power Virtual Instance by ID
@@ -315,6 +326,7 @@ class Pvm():
                                                   args['network'],
                                                   args['instance'], error))
 
+    @invalidate
     def delete_pvm(self, instance, pvm):
         """Delete Power Virtual Instance
 
@@ -352,6 +364,7 @@ class Pvm():
             print("Error deleting Power Virtual Instance {} from cloud"
                   " instance {}. {}".format(pvm, instance, error))
 
+    @invalidate
     def delete_pvm_network(self, instance, pvm, network):
         """Delete Power Virtual Instance network
 
@@ -1,11 +1,17 @@
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.power import instance
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Sanpshot():
 
     def __init__(self):
@@ -31,6 +37,26 @@ class Sanpshot():
             print("Error fetching snapshot list for cloud instance {}."
                   " {}".format(instance, error))
 
+    def iter_snapshots(self, instance):
+        """Iterate over snapshot list for a specific cloud instance
+
+        :param instance: Cloud instance ID
+        :type instance: str
+        :return: Generator of snapshots
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for cloud-instances
+            path = ("/pcloud/v1/cloud-instances/{}/snapshots".format(instance))
+
+            # Yield data page by page
+            yield from query_items("power", path, headers(), "snapshots",
+                                   limit=None, query=qw)
+
+        except Exception as error:
+            print("Error fetching snapshot list for cloud instance {}."
+                  " {}".format(instance, error))
+
     def get_snapshot(self, instance, snapshot):
         """Retrieve specific snapshot by name or by ID
 
@@ -41,18 +67,8 @@ class Sanpshot():
         :return: Snapshot information
         :rtype: dict
         """
-        by_name = self.get_snapshot_by_name(instance, snapshot)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_snapshot_by_id(instance, snapshot)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(snapshot, partial(self.get_snapshot_by_id, instance),
+                       partial(self.get_snapshot_by_name, instance))
 
     def get_snapshot_by_id(self, instance, id):
         """Retrieve specific snapshot by ID
@@ -87,13 +103,10 @@ class Sanpshot():
         :rtype: dict
         """
         try:
-            # Retrieve snapshots
-            data = self.get_snapshots(instance)
-            if "errors" in data:
-                return data
-
-            # Loop over snapshots until filter match
-            for snapshot in data['snapshots']:
+            # Loop over snapshots page by page until filter match
+            for snapshot in self.iter_snapshots(instance):
+                if "errors" in snapshot:
+                    return snapshot
                 if snapshot["name"] == name:
                     # Return data
                     return snapshot
@@ -105,6 +118,7 @@ class Sanpshot():
             print("Error fetching snapshot with name {} for cloud instance {}."
                   " {}".format(name, instance, error))
 
+    @invalidate
     def delete_snapshot(self, instance, snapshot):
         """Delete cloud instance
 
@@ -1,6 +1,10 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.power import get_power_headers as headers
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -8,8 +12,10 @@ from ibmcloud_python_sdk.utils.common import resource_created
 from ibmcloud_python_sdk.power import instance
 from ibmcloud_python_sdk.power import pvm
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Volume():
 
     def __init__(self):
@@ -42,6 +48,33 @@ class Volume():
             print("Error fetching volume list for cloud instance {}."
                   " {}".format(instance, error))
 
+    def iter_volumes(self, instance):
+        """Iterate over volume list from cloud instance
+
+        :param instance: Cloud instance ID
+        :type instance: str
+        :return: Generator of volumes
+        :rtype: generator
+        """
+        try:
+            # Check if cloud instance exists and retrieve information
+            ci_info = self.instance.get_instance(instance)
+            if "errors" in ci_info:
+                yield ci_info
+                return
+
+            # Connect to api endpoint for cloud-instances
+            path = ("/pcloud/v1/cloud-instances/{}/volumes".format(
+                ci_info["name"]))
+
+            # Yield data page by page
+            yield from query_items("power", path, headers(), "volumes",
+                                   limit=None, query=qw)
+
+        except Exception as error:
+            print("Error fetching volume list for cloud instance {}."
+                  " {}".format(instance, error))
+
     def get_volume(self, instance, volume):
         """Retrieve specific volume by name or by ID
 
@@ -52,18 +85,8 @@ class Volume():
         :return: Volume information
         :rtype: dict
         """
-        by_name = self.get_volume_by_name(instance, volume)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_volume_by_id(instance, volume)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(volume, partial(self.get_volume_by_id, instance),
+                       partial(self.get_volume_by_name, instance))
 
     def get_volume_by_id(self, instance, id):
         """Retrieve specific volume by ID
@@ -108,13 +131,10 @@ class Volume():
             if "errors" in ci_info:
                 return ci_info
 
-            # Retrieve volumes
-            data = self.get_volumes(ci_info["name"])
-            if "errors" in data:
-                return data
-
-            # Loop over volumes until filter match
-            for volume in data['volumes']:
+            # Loop over volumes page by page until filter match
+            for volume in self.iter_volumes(ci_info["name"]):
+                if "errors" in volume:
+                    return volume
                 if volume["name"] == name:
                     # Return data
                     return volume
@@ -171,18 +191,9 @@ class Volume():
         :return: PVM volume information
         :rtype: dict
         """
-        by_name = self.get_pvm_volume_by_name(instance, pvm, volume)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_pvm_volume_by_id(instance, pvm, volume)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(volume,
+                       partial(self.get_pvm_volume_by_id, instance, pvm),
+                       partial(self.get_pvm_volume_by_name, instance, pvm))
 
     def get_pvm_volume_by_id(self, instance, pvm, id):
         """Retrieve specific volume from Power Virtual Instance by ID
@@ -263,6 +274,7 @@ class Volume():
                   " Instance {} for cloud instance {}. {}".format(
                       name, pvm, instance, error))
 
+    @invalidate
     def create_volume(self, **kwargs):
         """Create volume
 
@@ -562,6 +574,7 @@ class Volume():
                   " {} for cloud instance {}. {}".format(
                       args["volume"], args['pvm'], args['instance'], error))
 
+    @invalidate
     def delete_volume(self, instance, volume):
         """Delete volume from cloud instance
 
@@ -2,11 +2,18 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
+from ibmcloud_python_sdk.utils.common import set_query
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class ResourceBinding():
 
     def __init__(self):
@@ -22,8 +29,30 @@ class ResourceBinding():
             # Connect to api endpoint for resource_bindings
             path = "/v2/resource_bindings"
 
-            # Return data
-            return qw("rg", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("rg", path, headers(), "resources", query=qw)
+
+        except Exception as error:
+            print("Error fetching resource bindings. {}".format(error))
+            raise
+
+    def iter_resource_bindings(self, name=None):
+        """Iterate over resource binding list page by page
+
+        :param name: Filter resource bindings by name on the API side
+        :type name: str, optional
+        :return: Generator of resource bindings
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for resource_bindings
+            path = "/v2/resource_bindings"
+            if name:
+                path = set_query(path, name=name)
+
+            # Yield data page by page
+            yield from query_items("rg", path, headers(), "resources",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching resource bindings. {}".format(error))
@@ -37,18 +66,8 @@ class ResourceBinding():
         :return: Resource binding information
         :rtype: dict
         """
-        by_name = self.get_resource_binding_by_name(binding)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_resource_binding_by_id(binding)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(binding, self.get_resource_binding_by_id,
+                       self.get_resource_binding_by_name)
 
     def get_resource_binding_by_id(self, id):
         """Retrieve specific resource binding by ID
@@ -79,13 +98,10 @@ class ResourceBinding():
         :rtype: dict
         """
         try:
-            # Retrieve resource bindings
-            data = self.get_resource_bindings()
-            if "errors" in data:
-                return data
-
-            # Loop over bindings until filter match
-            for resource in data['resources']:
+            # Loop over bindings filtered by the API until filter match
+            for resource in self.iter_resource_bindings(name=name):
+                if "errors" in resource:
+                    return resource
                 if resource["name"] == name:
                     # Return data
                     return resource
@@ -98,6 +114,7 @@ class ResourceBinding():
                 name, error))
             raise
 
+    @invalidate
     def create_binding(self, **kwargs):
         """Create resource binding
 
@@ -144,6 +161,7 @@ class ResourceBinding():
             print("Error create resource binding. {}".format(error))
             raise
 
+    @invalidate
     def delete_binding(self, binding):
         """Delete resource binding
 
@@ -3,11 +3,17 @@ import re
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_items
+from ibmcloud_python_sdk.utils.common import set_query
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class ResourceGroup():
 
     def __init__(self):
@@ -30,6 +36,28 @@ class ResourceGroup():
             print("Error fetching resource groups. {}".format(error))
             raise
 
+    def iter_resource_groups(self, name=None):
+        """Iterate over resource group list
+
+        :param name: Filter resource groups by name on the API side
+        :type name: str, optional
+        :return: Generator of resource groups
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for resource_groups
+            path = "/v2/resource_groups"
+            if name:
+                path = set_query(path, name=name)
+
+            # Yield data page by page
+            yield from query_items("rg", path, headers(), "resources",
+                                   limit=None, query=qw)
+
+        except Exception as error:
+            print("Error fetching resource groups. {}".format(error))
+            raise
+
     def get_default_resource_group(self):
         """Retrieve the default resource group
 
@@ -53,18 +81,8 @@ class ResourceGroup():
         :return: Resource group information
         :rtype: dict
         """
-        by_name = self.get_resource_group_by_name(group)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_resource_group_by_id(group)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(group, self.get_resource_group_by_id,
+                       self.get_resource_group_by_name)
 
     def get_resource_group_by_id(self, id):
         """Retrieve specific resource group by ID
@@ -95,13 +113,10 @@ class ResourceGroup():
         :rtype: dict
         """
         try:
-            # Retrieve resource groups
-            data = self.get_resource_groups()
-            if "errors" in data:
-                return data
-
-            # Loop over resources until filter match
-            for resource in data['resources']:
+            # Loop over resources filtered by the API until filter match
+            for resource in self.iter_resource_groups(name=name):
+                if "errors" in resource:
+                    return resource
                 if resource["name"] == name:
                     # Return data
                     return resource
@@ -221,6 +236,7 @@ class ResourceGroup():
                 name, error))
             raise
 
+    @invalidate
     def create_group(self, **kwargs):
         """Create resource group
 
@@ -256,6 +272,7 @@ class ResourceGroup():
             print("Error create resource group. {}".format(error))
             raise
 
+    @invalidate
     def delete_group(self, group):
         """Delete resource group
 
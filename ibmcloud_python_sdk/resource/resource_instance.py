@@ -2,19 +2,26 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.utils.common import check_args
 from urllib.parse import quote
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class ResourceInstance():
 
     def __init__(self):
         self.cfg = params()
         self.rg = resource_group.ResourceGroup()
 
+    @invalidate
     def create_resource_instance(self, **kwargs):
         """Create resource instance
 
@@ -102,7 +109,29 @@ class ResourceInstance():
                 path = ("/v2/resource_instances?resource_group={}"
                         "&type=service_instance".format(resource_group))
 
-            return qw("rg", "GET", path, headers())["data"]
+            return query_all("rg", path, headers(), "resources", query=qw)
+
+        except Exception as error:
+            print("Error fetching resource instances. {}".format(error))
+            raise
+
+    def iter_resource_instances(self, resource_group=None):
+        """Iterate over resource instance list page by page
+
+        :param resource_group: Filter resource instance by resource group
+        :type resource_group: str, optional
+        :return: Generator of resource instances
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for resource instances
+            path = ("/v2/resource_instances?type=service_instance")
+            if resource_group:
+                path = ("/v2/resource_instances?resource_group={}"
+                        "&type=service_instance".format(resource_group))
+
+            yield from query_items("rg", path, headers(), "resources",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching resource instances. {}".format(error))
@@ -116,19 +145,8 @@ class ResourceInstance():
         :return: Resource instance information
         :rtype: dict
         """
-        by_name = self.get_resource_instance_by_name(resource_instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_guid = self.get_resource_instance_by_guid(
-                        resource_instance)
-                    if "errors" in by_guid:
-                        return by_guid
-                    return by_guid
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(resource_instance, self.get_resource_instance_by_guid,
+                       self.get_resource_instance_by_name)
 
     def get_resource_instance_by_guid(self, guid):
         """Retrieve specific resoure instance by GUID
@@ -178,6 +196,7 @@ class ResourceInstance():
                 name, error))
             raise
 
+    @invalidate
     def delete_resource_instance(self, instance):
         """Delete a resource instance
 
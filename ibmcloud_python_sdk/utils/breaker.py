@@ -0,0 +1,119 @@
+import threading
+import time
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+config = sdk()
+breakers = {}
+lock = threading.Lock()
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because its endpoint is failing"""
+
+
+class CircuitBreaker():
+    """Fail fast while a service endpoint is failing
+
+    The circuit opens after `threshold` consecutive failures, requests are
+    then refused right away. Once `reset_timeout` seconds have elapsed a
+    single probe request is let through: its success closes the circuit,
+    its failure opens it again.
+    """
+
+    def __init__(self, name, threshold=constants.BREAKER_THRESHOLD,
+                 reset_timeout=constants.BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened = None
+        self.probing = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Retrieve the state of the circuit
+
+        :return: "closed", "open" or "half-open"
+        :rtype: str
+        """
+        with self.lock:
+            if self.opened is None:
+                return "closed"
+            if (self.probing or time.monotonic() - self.opened
+                    >= self.reset_timeout):
+                return "half-open"
+
+            return "open"
+
+    def allow(self):
+        """Check if a request could be sent
+
+        :raise CircuitOpenError: The endpoint is failing
+        """
+        with self.lock:
+            if self.opened is None:
+                return
+            if (not self.probing and time.monotonic() - self.opened
+                    >= self.reset_timeout):
+                # Let a single request probe the endpoint
+                self.probing = True
+                return
+
+        raise CircuitOpenError("Circuit open for {} after {} failures."
+                               .format(self.name, self.failures))
+
+    def success(self):
+        """Record a successful request"""
+        with self.lock:
+            self.failures = 0
+            self.opened = None
+            self.probing = False
+
+    def failure(self):
+        """Record a failed request"""
+        with self.lock:
+            self.failures += 1
+            self.probing = False
+            if self.opened is not None or self.failures >= self.threshold:
+                self.opened = time.monotonic()
+
+    def record(self, status):
+        """Record a request from the HTTP status of its response
+
+        :param status: HTTP status
+        :type status: int
+        """
+        if status in constants.BREAKER_STATUSES:
+            self.failure()
+        else:
+            self.success()
+
+
+def breaker(conn_type, host):
+    """Retrieve the circuit breaker of a connection type and host
+
+    :param conn_type: Connection type such as "iaas", "rg", "power", etc...
+    :type conn_type: str
+    :param host: Host to connect to
+    :type host: str
+    :return: Circuit breaker or None if disabled
+    :rtype: CircuitBreaker
+    """
+    key = (conn_type, host)
+    if key not in breakers:
+        with lock:
+            if key not in breakers:
+                options = config or {}
+                threshold = options.get("breaker_threshold",
+                                        constants.BREAKER_THRESHOLD)
+                breakers[key] = None
+                if threshold:
+                    breakers[key] = CircuitBreaker(
+                        "{} ({})".format(host, conn_type), threshold,
+                        options.get("breaker_reset_timeout",
+                                    constants.BREAKER_RESET_TIMEOUT))
+
+    return breakers[key]
@@ -0,0 +1,158 @@
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+config = sdk()
+
+
+def is_rate_limited(data):
+    """Check if a result is an error due to the API rate limit
+
+    :param data: Result of an SDK method
+    :type data: dict
+    :return: Whether the rate limit has been exceeded
+    :rtype: bool
+    """
+    if not isinstance(data, dict) or "errors" not in data:
+        return False
+    if data.get("status_code") == 429:
+        return True
+
+    return any(isinstance(error, dict)
+               and error.get("code") in constants.RATE_LIMIT_CODES
+               for error in data["errors"] or [])
+
+
+class Throttle():
+    """Slow down every worker once the API rate limit is exceeded
+
+    Calls are paused for an exponential backoff with jitter when a call is
+    rate limited, the backoff is reset by the next successful call. An
+    optional rate spreads the calls over time.
+    """
+
+    def __init__(self, rate=None, backoff=constants.BULK_BACKOFF,
+                 max_backoff=constants.BULK_MAX_BACKOFF):
+        self.interval = 1.0 / rate if rate else 0
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.paused_until = 0
+        self.next_call = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call could be done"""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.paused_until, self.next_call)
+            self.next_call = start + self.interval
+
+        if start > now:
+            time.sleep(start - now)
+
+    def limited(self):
+        """Record a rate limited call"""
+        with self.lock:
+            delay = min(self.backoff * 2 ** self.failures, self.max_backoff)
+            self.failures += 1
+            until = time.monotonic() + random.uniform(delay / 2, delay)
+            self.paused_until = max(self.paused_until, until)
+
+    def succeeded(self):
+        """Record a successful call"""
+        with self.lock:
+            self.failures = 0
+
+
+def _call(func, args, throttle, retries):
+    for attempt in range(retries + 1):
+        throttle.wait()
+        try:
+            data = func(*args)
+        except Exception as error:
+            return {"errors": [{"code": "exception",
+                                "message": str(error)}],
+                    "exception": error}
+
+        if not is_rate_limited(data) or attempt == retries:
+            break
+        throttle.limited()
+
+    if not is_rate_limited(data):
+        throttle.succeeded()
+
+    return data
+
+
+def starmap(func, items, concurrency=None, rate=None, retries=None):
+    """Call a function for every tuple of arguments using a thread pool
+
+    Results are returned in the order of the arguments. An exception
+    raised by a call doesn't stop the other ones, it's returned as an
+    error dict with the exception under the "exception" key. Calls
+    rejected by the API rate limit are retried after a backoff which
+    pauses every worker.
+
+    :param func: Function to call such as Instance().get_instance
+    :type func: function
+    :param items: Arguments of every call
+    :type items: list
+    :param concurrency: Maximum number of calls running at the same time
+    :type concurrency: int, optional
+    :param rate: Maximum number of calls started per second
+    :type rate: float, optional
+    :param retries: Number of retries of a rate limited call
+    :type retries: int, optional
+    :return: Result of every call
+    :rtype: list
+    """
+    options = config or {}
+    if concurrency is None:
+        concurrency = options.get("bulk_concurrency",
+                                  constants.BULK_CONCURRENCY)
+    if rate is None:
+        rate = options.get("bulk_rate")
+    if retries is None:
+        retries = options.get("bulk_retries", constants.BULK_RETRIES)
+
+    items = [tuple(args) for args in items]
+    if not items:
+        return []
+
+    throttle = Throttle(rate, options.get("bulk_backoff",
+                                          constants.BULK_BACKOFF))
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items)),
+                            thread_name_prefix="ibmcloud-bulk") as pool:
+        # Workers see the context variables of the caller
+        futures = [pool.submit(contextvars.copy_context().run, _call, func,
+                               args, throttle, retries) for args in items]
+
+        return [future.result() for future in futures]
+
+
+def map(func, items, concurrency=None, rate=None, retries=None):
+    """Call a function for every item using a thread pool
+
+    Same as starmap() for functions taking a single argument.
+
+    :param func: Function to call such as Instance().get_instance
+    :type func: function
+    :param items: Argument of every call such as instance IDs
+    :type items: list
+    :param concurrency: Maximum number of calls running at the same time
+    :type concurrency: int, optional
+    :param rate: Maximum number of calls started per second
+    :type rate: float, optional
+    :param retries: Number of retries of a rate limited call
+    :type retries: int, optional
+    :return: Result of every call
+    :rtype: list
+    """
+    return starmap(func, [(item,) for item in items], concurrency, rate,
+                   retries)
@@ -1,56 +1,481 @@
+import hashlib
+import json
+import re
+import sqlite3
+import zlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from os import environ, makedirs, path
 from pymemcache.client import base
 from pymemcache.client import hash
 from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
 
 
 config = sdk()
+clients = {}
+lock = threading.RLock()
 
 
-def client():
+def _node(node):
+    host, port = node.split(":")
+
+    return host, int(port)
+
+
+def _new_client():
     """Create and configure memcached client
 
-    :return: memcached client
+    :return: memcached client or False if memcached is not configured
     :rtype: map
     """
-    if config:
-        # Check if memcached is configured in sdk.yaml file
-        if config.get("memcached") and len(config.get("memcached")) > 0:
-            cache = []
-            for node in config.get("memcached"):
-                cache.append([node.split(":")[0], node.split(":")[1]])
+    # Check if memcached is configured in sdk.yaml file
+    if not config or not config.get("memcached"):
+        return False
+
+    options = {
+        "connect_timeout": config.get("memcached_connect_timeout",
+                                      constants.MEMCACHED_CONNECT_TIMEOUT),
+        "timeout": config.get("memcached_timeout",
+                              constants.MEMCACHED_TIMEOUT),
+        "max_pool_size": config.get("memcached_pool_size",
+                                    constants.MEMCACHED_POOL_SIZE),
+        # Errors during get are reported as a cache miss
+        "ignore_exc": True,
+    }
+
+    nodes = [_node(node) for node in config.get("memcached")]
+    if len(nodes) > 1:
+        return hash.HashClient(nodes, use_pooling=True, **options)
+
+    return base.PooledClient(nodes[0], **options)
+
+
+def client():
+    """Retrieve the memcached client shared by the whole process
+
+    The client is created the first time it's needed and keeps a pool of
+    connections per memcached node.
+
+    :return: memcached client or False if memcached is not configured
+    :rtype: map
+    """
+    if "client" not in clients:
+        with lock:
+            if "client" not in clients:
+                clients["client"] = _new_client()
+
+    return clients["client"]
+
+
+class MemcachedBackend():
+    """Cache items into memcached servers configured in sdk.yaml
+
+    Items larger than the memcached item size limit are split into chunks
+    stored under their own keys, the item key then holds the list of
+    chunks.
+    """
+
+    def __init__(self, chunk_size=constants.MEMCACHED_CHUNK_SIZE):
+        self.client = client()
+        self.chunk_size = chunk_size
+
+    def _key(self, key):
+        # memcached keys are limited to 250 characters without whitespace
+        if len(key) > 250 or any(c.isspace() for c in key):
+            return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+        return key
+
+    def get(self, key):
+        value = self.client.get(self._key(key))
+        if value is None or not value.startswith(constants.CACHE_CHUNKS_MAGIC):
+            return value
+
+        # Chunked item, every chunk is needed
+        keys = value[len(constants.CACHE_CHUNKS_MAGIC):].decode().split(",")
+        chunks = self.client.get_many(keys)
+        if len(chunks) != len(keys):
+            return None
+
+        return b"".join(chunks[chunk] for chunk in keys)
+
+    def set(self, key, value, ttl):
+        if len(value) <= self.chunk_size:
+            self.client.set(self._key(key), value, expire=int(ttl))
+            return
+
+        # Chunk keys are unique so readers never mix chunks of two versions
+        prefix = uuid.uuid4().hex
+        chunks = {}
+        for index in range(0, len(value), self.chunk_size):
+            chunk = "chunk:{}:{}".format(prefix, index // self.chunk_size)
+            chunks[chunk] = value[index:index + self.chunk_size]
+        self.client.set_many(chunks, expire=int(ttl))
+
+        manifest = ",".join(chunks).encode()
+        self.client.set(self._key(key),
+                        constants.CACHE_CHUNKS_MAGIC + manifest,
+                        expire=int(ttl))
 
-            if len(config.get("memcached")) > 1:
-                nodes = map(lambda x: (x[0], int(x[1])), cache)
+    def delete(self, key):
+        self.client.delete(self._key(key))
 
-                return hash.HashClient(nodes)
 
-            node = config.get("memcached")[0]
-            node = (node.split(":")[0], int(node.split(":")[1]))
+class MemoryBackend():
+    """Cache items into the process memory
 
-            return base.Client(node)
+    The least recently used item is evicted once `maxsize` items are
+    stored.
+    """
+
+    def __init__(self, maxsize=constants.CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                return None
+            value, expires = item
+            if time.monotonic() >= expires:
+                del self.items[key]
+                return None
+            self.items.move_to_end(key)
+
+            return value
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.items[key] = (value, time.monotonic() + ttl)
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+
+class DiskBackend():
+    """Cache items into a local SQLite database
+
+    Useful for command line tools which are started over and over again.
+    """
+
+    def __init__(self, filename=None):
+        if not filename:
+            filename = "{}/.ibmcloud/{}".format(environ.get('HOME'),
+                                                constants.CACHE_FILE)
+        folder = path.dirname(filename)
+        if folder:
+            makedirs(folder, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(filename, check_same_thread=False)
+        with self.lock, self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS cache ("
+                            "key TEXT PRIMARY KEY, value BLOB, "
+                            "expires REAL)")
+            # Drop what has expired since the last run
+            self.db.execute("DELETE FROM cache WHERE expires <= ?",
+                            (time.time(),))
+
+    def get(self, key):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT value, expires FROM cache WHERE key = ?",
+                (key,)).fetchone()
+        if row is None or row[1] <= time.time():
+            return None
+
+        return bytes(row[0])
+
+    def set(self, key, value, ttl):
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (key, sqlite3.Binary(value), time.time() + ttl))
+
+    def delete(self, key):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+
+def _new_backend():
+    """Create the cache backend configured in sdk.yaml
+
+    :return: Cache backend or False if caching is not configured
+    :rtype: object
+    """
+    if not config:
+        return False
+
+    name = config.get("cache_backend")
+    # Keep memcached as default backend when it's configured
+    if not name and config.get("memcached"):
+        name = "memcached"
+
+    if name == "memcached":
+        if not client():
+            raise Exception("memcached cache backend requires memcached "
+                            "servers to be defined.")
+        return MemcachedBackend(config.get("memcached_chunk_size",
+                                           constants.MEMCACHED_CHUNK_SIZE))
+    elif name == "memory":
+        return MemoryBackend(config.get("cache_maxsize",
+                                        constants.CACHE_MAXSIZE))
+    elif name == "disk":
+        return DiskBackend(config.get("cache_file"))
+    elif name:
+        raise Exception("Unknown cache backend: {}.".format(name))
 
     return False
 
 
+def backend():
+    """Retrieve the cache backend shared by the whole process
+
+    :return: Cache backend or False if caching is not configured
+    :rtype: object
+    """
+    if "backend" not in clients:
+        with lock:
+            if "backend" not in clients:
+                clients["backend"] = _new_backend()
+
+    return clients["backend"]
+
+
+def rules():
+    """Retrieve the TTL rules applied to the cached requests
+
+    Rules from the cache_rules option of sdk.yaml come first, then the
+    default rules. Each rule is a compiled regular expression matched
+    against the beginning of the request path along with its TTL.
+
+    :return: List of (pattern, ttl) tuples
+    :rtype: list
+    """
+    if "rules" not in clients:
+        with lock:
+            if "rules" not in clients:
+                options = (config or {}).get("cache_rules") or []
+                compiled = []
+                for rule in options:
+                    compiled.append((re.compile(rule["pattern"]),
+                                     int(rule["ttl"])))
+                for pattern, ttl in constants.CACHE_RULES:
+                    compiled.append((re.compile(pattern), ttl))
+                clients["rules"] = compiled
+
+    return clients["rules"]
+
+
+def get_ttl(path):
+    """Retrieve the TTL applied to a request path
+
+    :param path: Path used by within the query
+    :type path: str
+    :return: TTL in seconds, 0 means the path should not be cached
+    :rtype: int
+    """
+    for pattern, ttl in rules():
+        if pattern.match(path):
+            return ttl
+
+    # Set expire to 60 secondes if not defined in sdk.yaml
+    return (config or {}).get("cache_ttl", 60)
+
+
+def get_stale_ttl():
+    """Retrieve how long an expired item could still be served
+
+    :return: Seconds an item is kept after it expired
+    :rtype: int
+    """
+    return (config or {}).get("cache_stale_ttl", constants.CACHE_STALE_TTL)
+
+
+def get_keep_ttl(ttl, etag=None):
+    """Retrieve how long an entry is kept by the cache backend
+
+    Entries are kept after they expired to be served while refreshed in the
+    background, and even longer when they have an ETag to revalidate them
+    with a conditional request.
+
+    :param ttl: Seconds the response is fresh
+    :type ttl: int
+    :param etag: ETag of the response
+    :type etag: str, optional
+    :return: Seconds the entry is kept
+    :rtype: int
+    """
+    keep = ttl + get_stale_ttl()
+    if etag:
+        keep += (config or {}).get("cache_revalidate_ttl",
+                                   constants.CACHE_REVALIDATE_TTL)
+
+    return keep
+
+
+def pack(data, ttl, etag=None):
+    """Wrap a response body into a cache entry
+
+    :param data: Response body
+    :type data: bytes
+    :param ttl: Seconds the response is fresh
+    :type ttl: int
+    :param etag: ETag of the response
+    :type etag: str, optional
+    :return: Cache entry
+    :rtype: bytes
+    """
+    header = {"expires": time.time() + ttl}
+    if etag:
+        header["etag"] = etag
+
+    # Large bodies such as collections are compressed
+    threshold = (config or {}).get("cache_compress_threshold",
+                                   constants.CACHE_COMPRESS_THRESHOLD)
+    if threshold and len(data) >= threshold:
+        data = zlib.compress(data)
+        header["encoding"] = "zlib"
+
+    return b"".join([constants.CACHE_ENTRY_MAGIC,
+                     json.dumps(header).encode("utf-8"), b"\n", data])
+
+
+def unpack(item):
+    """Unwrap a cache entry
+
+    Items stored by previous versions of the SDK are raw response bodies,
+    they are considered fresh.
+
+    :param item: Cache entry
+    :type item: bytes
+    :return: Entry with the response body as "data"
+    :rtype: dict
+    """
+    if not item.startswith(constants.CACHE_ENTRY_MAGIC):
+        return {"data": item}
+
+    header, data = item[len(constants.CACHE_ENTRY_MAGIC):].split(b"\n", 1)
+    entry = json.loads(header.decode("utf-8"))
+    if entry.pop("encoding", None) == "zlib":
+        data = zlib.decompress(data)
+    entry["data"] = data
+
+    return entry
+
+
+def is_fresh(entry, grace=0):
+    """Check if a cache entry has not expired yet
+
+    :param entry: Cache entry
+    :type entry: dict
+    :param grace: Seconds the entry is still considered fresh after it
+        expired
+    :type grace: int, optional
+    :return: Whether the entry is fresh
+    :rtype: bool
+    """
+    return time.time() < entry.get("expires", float("inf")) + grace
+
+
+def get_generation(collection):
+    """Retrieve the current generation of a collection
+
+    The generation is part of the keys of every cached item and list of the
+    collection, so that changing it invalidates all of them at once even
+    with backends which can't list their keys.
+
+    :param collection: Collection key
+    :type collection: str
+    :return: Generation
+    :rtype: str
+    """
+    key = "generation:{}".format(collection)
+    generation = get_item(key)
+    if generation is None:
+        # Concurrent requests of this process must agree on the generation
+        with lock:
+            generation = get_item(key)
+            if generation is None:
+                return new_generation(collection)
+
+    return generation.decode("utf-8")
+
+
+def new_generation(collection):
+    """Start a new generation of a collection
+
+    :param collection: Collection key
+    :type collection: str
+    :return: Generation
+    :rtype: str
+    """
+    generation = uuid.uuid4().hex
+    set_item("generation:{}".format(collection), generation.encode("utf-8"),
+             constants.CACHE_GENERATION_TTL)
+
+    return generation
+
+
 def get_item(item_key):
-    """Retrieve object from memcache
+    """Retrieve object from cache
+
+    A cache which is down or too slow is handled as a cache miss.
 
     :param item_key: Item key to retrieve
     :type item_key: str
     :return: Item value
-    :rtype: str
+    :rtype: bytes
     """
-    return client().get(item_key)
+    try:
+        return backend().get(item_key)
+    except Exception as error:
+        print("Error fetching item from cache. {}".format(error))
+        return None
+
 
+def set_item(item_key, item_value, ttl=None):
+    """Store object into cache
 
-def set_item(item_key, item_value):
-    """Store object into memcached
+    A cache which is down or too slow is ignored, the item is just not
+    cached.
 
     :param item_key: Item key to store
     :type item_key: str
     :param item_value: Item value to store
-    :type item_value: str
+    :type item_value: bytes
+    :param ttl: Seconds before the item expires
+    :type ttl: int, optional
     """
     if config:
-        # Set expire to 60 secondes if not defined in sdk.yaml
-        client().set(item_key, item_value, expire=config.get("cache_ttl", 60))
+        if ttl is None:
+            # Set expire to 60 secondes if not defined in sdk.yaml
+            ttl = config.get("cache_ttl", 60)
+        # memcached would keep an item with a TTL of 0 forever
+        if ttl <= 0:
+            return
+        try:
+            backend().set(item_key, item_value, ttl)
+        except Exception as error:
+            print("Error storing item into cache. {}".format(error))
+
+
+def delete_item(item_key):
+    """Remove object from cache
+
+    :param item_key: Item key to remove
+    :type item_key: str
+    """
+    try:
+        backend().delete(item_key)
+    except Exception as error:
+        print("Error removing item from cache. {}".format(error))
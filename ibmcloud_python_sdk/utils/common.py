@@ -1,9 +1,55 @@
 import base64
-import http.client
+import hashlib
 import json
+import re
 from jwt import decode
+from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import metrics
+from ibmcloud_python_sdk.utils import pool
+from ibmcloud_python_sdk.utils import resolver
+from ibmcloud_python_sdk.utils import retry
+from ibmcloud_python_sdk.utils.singleflight import SingleFlight
+
+
+# VPC IDs are prefixed UUIDs such as r006-<uuid> or 0717-<uuid>
+ID_REGEX = re.compile(
+    r"^(?:[0-9a-z]{4}[-_])?"
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+    # Resource group and account IDs are dash-less GUIDs
+    r"|^[0-9a-f]{32}$"
+    # SoftLayer IDs are integers
+    r"|^[0-9]+$"
+    r"|^crn:", re.IGNORECASE)
+
+
+# Concurrent identical GET requests and background refreshes
+flights = SingleFlight()
+
+# Base64 encoded BSS ID per token, filled by the token manager when a token
+# is retrieved so the JWT is not decoded on each request.
+accounts = {}
+
+
+def remember_account(token, account):
+    """Store the BSS ID of a token encoded to base64
+
+    :param token: Authorization header value
+    :type token: str
+    :param account: BSS ID
+    :type account: str
+    """
+    # Only a few tokens are alive at the same time, forget the old ones
+    if len(accounts) >= constants.ACCOUNTS_MAXSIZE:
+        accounts.clear()
+
+    accounts[token] = base64.b64encode(account.encode("utf-8")).decode()
 
 
 def _account_id(headers):
@@ -14,16 +60,78 @@ def _account_id(headers):
     :return: BSS ID encoded to base64
     :rtype: str
     """
-    auth = headers.get("Authorization")
+    auth = (headers or {}).get("Authorization")
     if auth:
-        # Split the Bearer token and decode the JWT
-        jwt = decode(auth.split(" ")[1], verify=False)
-
-        # Encode BSS ID to base64
-        encoded = base64.b64encode(jwt["account"]["bss"].encode("utf-8"))
+        encoded = accounts.get(auth)
+        if encoded is None:
+            if auth.startswith("Bearer "):
+                # Token not retrieved by the token manager, split the
+                # Bearer token and decode the JWT
+                jwt = decode(auth.split(" ")[1], verify=False)
+                account = jwt["account"]["bss"]
+            else:
+                # SoftLayer basic authentication, the user is the account
+                account = hashlib.sha256(auth.encode("utf-8")).hexdigest()
+            remember_account(auth, account)
+            encoded = accounts[auth]
 
         # Returns base64 string
-        return encoded.decode()
+        return encoded
+
+
+def _caller(headers):
+    """Hash the authorization of a request
+
+    Requests are only coalesced when they are sent with the same
+    credentials.
+
+    :param headers: Headers to parse
+    :type headers: dict
+    :return: SHA-256 of the Authorization header
+    :rtype: str
+    """
+    auth = (headers or {}).get("Authorization") or ""
+
+    return hashlib.sha256(auth.encode("utf-8")).hexdigest()
+
+
+def get_host(cfg, conn_type, headers=None):
+    """Retrieve the host of a connection type
+
+    SoftLayer basic authentication is added to the headers when needed.
+
+    :param cfg: Cloud configuration
+    :type cfg: dict
+    :param conn_type: Define which URL should be used for the connection
+        such as "iaas", "auth", "cis", or "rg" (resource group)
+    :type conn_type: str
+    :param headers: Headers to send with the query
+    :type headers: dict, optional
+    :return: Host to connect to
+    :rtype: str
+    """
+    host = None
+    if conn_type == "iaas":
+        host = cfg["is_url"]
+    elif conn_type == "rg":
+        host = cfg["rg_url"]
+    elif conn_type == "auth":
+        host = cfg["auth_url"]
+    elif conn_type == "dns":
+        host = cfg["dns_url"]
+    elif conn_type == "em":
+        host = cfg["em_url"]
+    elif conn_type == "sl":
+        if headers and cfg["cis_username"] and cfg["cis_apikey"]:
+            header = base64.encodebytes(
+                ('%s:%s' % (cfg["cis_username"], cfg["cis_apikey"]))
+                .encode('utf8')).decode('utf8').replace('\n', '')
+            headers["Authorization"] = "Basic {}".format(header)
+        host = cfg["sl_url"]
+    elif conn_type == "power":
+        host = cfg["pi_url"]
+
+    return host
 
 
 def query_wrapper(conn_type, method, path, headers=None, payload=None):
@@ -47,56 +155,399 @@ def query_wrapper(conn_type, method, path, headers=None, payload=None):
     """
     cfg = params()
     timeout = cfg["http_timeout"]
-
-    if conn_type == "iaas":
-        conn = http.client.HTTPSConnection(cfg["is_url"], timeout=timeout)
-    elif conn_type == "rg":
-        conn = http.client.HTTPSConnection(cfg["rg_url"], timeout=timeout)
-    elif conn_type == "auth":
-        conn = http.client.HTTPSConnection(cfg["auth_url"], timeout=timeout)
-    elif conn_type == "dns":
-        conn = http.client.HTTPSConnection(cfg["dns_url"], timeout=timeout)
-    elif conn_type == "em":
-        conn = http.client.HTTPSConnection(cfg["em_url"], timeout=timeout)
-    elif conn_type == "sl":
-        if headers and cfg["cis_username"] and cfg["cis_apikey"]:
-            header = base64.encodebytes(
-                ('%s:%s' % (cfg["cis_username"], cfg["cis_apikey"]))
-                .encode('utf8')).decode('utf8').replace('\n', '')
-            headers["Authorization"] = "Basic {}".format(header)
-        conn = http.client.HTTPSConnection(cfg["sl_url"], timeout=timeout)
-    elif conn_type == "power":
-        conn = http.client.HTTPSConnection(cfg["pi_url"], timeout=timeout)
-
-    if cache.client():
-        if method == "GET" and conn_type != "auth":
-            obj = "{}{}".format(_account_id(headers), path)
+    host = get_host(cfg, conn_type, headers)
+
+    # Keep-alive connections are shared per connection type and host
+    conn = pool.get_pool(conn_type, host, timeout)
+    # Request information given to the hooks
+    info = {"conn_type": conn_type, "method": method, "path": path,
+            "template": path_template(path), "host": host}
+
+    # Only GET requests against the APIs are cached, never tokens
+    obj = None
+    ttl = None
+    entry = None
+    collection = None
+    if cache.backend() and conn_type != "auth":
+        collection = "{}{}{}".format(_account_id(headers), host,
+                                     _collection(path))
+    if collection and method == "GET":
+        ttl = cache.get_ttl(path)
+        if ttl > 0:
+            obj = "{}:{}{}{}".format(cache.get_generation(collection),
+                                     _account_id(headers), host, path)
             item = cache.get_item(obj)
             if item is not None:
-                return {"data": json.loads(item.decode("utf-8"))}
-            else:
-                pass
+                entry = cache.unpack(item)
+                if cache.is_fresh(entry):
+                    metrics.emit("on_cache_hit", dict(info, state="fresh"))
+                    return {"data": json.loads(
+                        entry["data"].decode("utf-8"))}
+                if cache.is_fresh(entry, cache.get_stale_ttl()):
+                    # Serve the stale item while a single caller refreshes
+                    # it in the background
+                    metrics.emit("on_cache_hit", dict(info, state="stale"))
+                    flights.do_in_background(
+                        obj, _send, conn, method, path, headers, obj, ttl,
+                        None, entry, info)
+                    return {"data": json.loads(
+                        entry["data"].decode("utf-8"))}
+            info["state"] = "miss"
+            metrics.emit("on_cache_miss", info)
+
+    if method == "GET":
+        # Identical concurrent requests of the same caller are sent only
+        # once, the cache key keeps requests apart across invalidations
+        key = "{}:{}".format(_caller(headers), obj or host + path)
+        res, data = flights.do(key, _send, conn, method, path, headers, obj,
+                               ttl, payload, entry, info)
+    else:
+        res, data = _send(conn, method, path, headers, payload=payload,
+                          info=info)
 
-    conn.request(method, path, payload, headers)
+    if res is None:
+        # Cached item revalidated by the API
+        return {"data": json.loads(data)}
 
-    # Get and read response data
-    res = conn.getresponse()
-    data = res.read()
+    if collection and method != "GET":
+        # Forget every cached item and list of the modified collection
+        cache.new_generation(collection)
 
     if not data:
         # Return empty data and HTTP response this is mostly
         # due to DELETE request which doesn't return any data
         return {"data": None, "response": res}
     else:
-        if cache.client():
-            obj = "{}{}".format(_account_id(headers), path)
-            # Store item into caching system
-            cache.set_item(obj, data)
-
         # Return data and HTTP response
         return {"data": json.loads(data), "response": res}
 
 
+def _send(conn, method, path, headers, obj=None, ttl=None, payload=None,
+          entry=None, info=None):
+    """Send the request and store the response into the cache
+
+    When an expired cache entry has an ETag, the request is conditional
+    and the cached body is used if the API answers it has not changed.
+
+    :param conn: Connection pool
+    :type conn: ConnectionPool
+    :param method: HTTP method
+    :type method: str
+    :param path: Path used by within the query
+    :type path: str
+    :param headers: Headers sent during the query
+    :type headers: dict
+    :param obj: Cache key, the response is not cached if not defined
+    :type obj: str, optional
+    :param ttl: Seconds the response is fresh
+    :type ttl: int, optional
+    :param payload: Body sent during the query
+    :type payload: str, optional
+    :param entry: Expired cache entry
+    :type entry: dict, optional
+    :param info: Request information given to the hooks
+    :type info: dict, optional
+    :return: HTTP response and its body, the response is None when the
+        cached body has been revalidated
+    :rtype: tuple
+    """
+    etag = (entry or {}).get("etag")
+    if etag:
+        headers = dict(headers or {})
+        headers["If-None-Match"] = etag
+
+    # Throttled or failed requests are sent again when it's safe, the
+    # hooks are called for every attempt
+    res, data = retry.policy().request(conn, method, path, payload, headers,
+                                       info)
+
+    if etag and res.status == 304:
+        # Not modified, the cached body is fresh again
+        cache.set_item(obj, cache.pack(entry["data"], ttl, etag),
+                       cache.get_keep_ttl(ttl, etag))
+        return None, entry["data"]
+
+    if obj and data and res.status == 200:
+        # Store item into caching system
+        etag = res.getheader("ETag")
+        cache.set_item(obj, cache.pack(data, ttl, etag),
+                       cache.get_keep_ttl(ttl, etag))
+
+    return res, data
+
+
+def path_template(path):
+    """Replace the identifiers of a path by a placeholder
+
+    The query string is dropped, e.g. /v1/instances/{id}/volume_attachments
+    for /v1/instances/<id>/volume_attachments?version=2021-06-15.
+
+    :param path: Path used by within the query
+    :type path: str
+    :return: Path template
+    :rtype: str
+    """
+    return "/".join("{id}" if segment and is_id(segment) else segment
+                    for segment in urlsplit(path).path.split("/"))
+
+
+def _collection(path):
+    """Retrieve the collection a path belongs to
+
+    The collection is the beginning of the path up to the first
+    identifier, e.g. /v1/instances for /v1/instances/<id>/volume_attachments.
+
+    :param path: Path used by within the query
+    :type path: str
+    :return: Collection path
+    :rtype: str
+    """
+    segments = []
+    for segment in urlsplit(path).path.split("/"):
+        if segment and is_id(segment):
+            break
+        segments.append(segment)
+
+    return "/".join(segments)
+
+
+def set_query(path, **kwargs):
+    """Add or replace query string parameters of a path
+
+    :param path: Path with or without query string
+    :type path: str
+    :return: Path with the updated query string
+    :rtype: str
+    """
+    url = urlsplit(path)
+    query = [(key, value) for key, value in parse_qsl(
+        url.query, keep_blank_values=True) if key not in kwargs]
+    query.extend(kwargs.items())
+
+    return urlunsplit(("", "", url.path, urlencode(query), ""))
+
+
+def _next_start(data):
+    """Retrieve the pagination token of the next page
+
+    VPC API returns a "next.href" URL when Resource Controller API returns
+    a "next_url" path, both of them carry a "start" token.
+
+    :param data: Page returned by the API
+    :type data: dict
+    :return: Token of the next page or None if it's the last page
+    :rtype: str
+    """
+    href = None
+    if isinstance(data.get("next"), dict):
+        href = data["next"].get("href")
+    elif data.get("next_url"):
+        href = data["next_url"]
+
+    if href:
+        start = parse_qs(urlsplit(href).query).get("start")
+        if start:
+            return start[0]
+
+    return None
+
+
+def query_pages(conn_type, path, headers=None, limit=constants.PAGE_LIMIT,
+                query=None):
+    """Execute HTTP GET queries following pagination and yield every page
+
+    :param conn_type: Define which URL should be used for the connection
+    :type conn_type: str
+    :param path: Path of the collection
+    :type path: str
+    :param headers: Headers to send with the queries
+    :type headers: dict, optional
+    :param limit: Number of resources per page, None to let the API decide
+    :type limit: int, optional
+    :param query: Function used to execute the queries, default to
+        query_wrapper()
+    :type query: function, optional
+    :return: Generator of pages
+    :rtype: generator
+    """
+    if query is None:
+        query = query_wrapper
+    if limit:
+        path = set_query(path, limit=limit)
+
+    seen = set()
+    while True:
+        data = query(conn_type, "GET", path, headers)["data"]
+        yield data
+
+        if not data or "errors" in data:
+            return
+
+        start = _next_start(data)
+        # Stop if the API hands back a token already followed
+        if not start or start in seen:
+            return
+
+        seen.add(start)
+        path = set_query(path, start=start)
+
+
+def query_items(conn_type, path, headers, key, limit=constants.PAGE_LIMIT,
+                query=None):
+    """Yield every resource of a paginated collection
+
+    If the API returns an error, the error is yielded and the iteration
+    stops.
+
+    :param conn_type: Define which URL should be used for the connection
+    :type conn_type: str
+    :param path: Path of the collection
+    :type path: str
+    :param headers: Headers to send with the queries
+    :type headers: dict
+    :param key: Key of the resource list within a page such as "instances"
+    :type key: str
+    :param limit: Number of resources per page, None to let the API decide
+    :type limit: int, optional
+    :param query: Function used to execute the queries, default to
+        query_wrapper()
+    :type query: function, optional
+    :return: Generator of resources
+    :rtype: generator
+    """
+    for page in query_pages(conn_type, path, headers, limit, query):
+        if not page:
+            return
+        if "errors" in page:
+            yield page
+            return
+
+        yield from page.get(key, [])
+
+
+def query_all(conn_type, path, headers, key, limit=constants.PAGE_LIMIT,
+              query=None):
+    """Retrieve every page of a collection merged into a single page
+
+    :param conn_type: Define which URL should be used for the connection
+    :type conn_type: str
+    :param path: Path of the collection
+    :type path: str
+    :param headers: Headers to send with the queries
+    :type headers: dict
+    :param key: Key of the resource list within a page such as "instances"
+    :type key: str
+    :param limit: Number of resources per page, None to let the API decide
+    :type limit: int, optional
+    :param query: Function used to execute the queries, default to
+        query_wrapper()
+    :type query: function, optional
+    :return: Collection with all the resources
+    :rtype: dict
+    """
+    result = None
+    for page in query_pages(conn_type, path, headers, limit, query):
+        if not page or "errors" in page:
+            return page
+
+        if result is None:
+            result = dict(page)
+            result[key] = list(page.get(key, []))
+        else:
+            result[key].extend(page.get(key, []))
+
+    result.pop("next", None)
+    result.pop("next_url", None)
+
+    return result
+
+
+def is_id(value):
+    """Check if a value looks like an identifier rather than a name
+
+    VPC IDs, UUIDs, GUIDs, CRNs and SoftLayer numeric IDs are recognized.
+
+    :param value: Resource name or identifier
+    :type value: str
+    :return: Whether the value looks like an identifier
+    :rtype: bool
+    """
+    return bool(ID_REGEX.match(str(value)))
+
+
+def _is_not_found(data, code):
+    """Check if an API result is a "not found" error
+
+    :param data: API result
+    :type data: dict
+    :param code: Error code meaning that the resource is not found
+    :type code: str
+    :return: Whether the resource is not found
+    :rtype: bool
+    """
+    errors = data.get("errors")
+    # SoftLayer errors from resource_error() are not wrapped in a list
+    if isinstance(errors, dict):
+        errors = [errors]
+
+    return any(error.get("code") == code for error in errors)
+
+
+def resolve(value, by_id, by_name, *fallbacks, code="not_found"):
+    """Retrieve a resource by name or by ID
+
+    If the value looks like an identifier the cheap lookup by ID is done
+    first, otherwise the lookup by name is done first. The next lookups are
+    only done if the resource is not found.
+
+    IDs found by name are kept in the resolution cache so the next lookup of
+    the same name is done by ID instead of listing the whole collection.
+
+    :param value: Resource name or identifier
+    :type value: str
+    :param by_id: Function retrieving the resource by ID
+    :type by_id: function
+    :param by_name: Function retrieving the resource by name
+    :type by_name: function
+    :param fallbacks: Functions used if the resource is still not found,
+        such as a lookup by address
+    :type fallbacks: function, optional
+    :param code: Error code meaning that the resource is not found
+    :type code: str, optional
+    :return: Resource information
+    :rtype: dict
+    """
+    if is_id(value):
+        lookups = [by_id, by_name]
+        key = None
+    else:
+        lookups = [by_name, by_id]
+        key = resolver.cache_key(by_name, value)
+
+    if key:
+        cached = resolver.names.get(key)
+        if cached is not None:
+            data = by_id(cached)
+            # Errors such as Power 404 bodies don't always have an
+            # "errors" key, only a resource with the same name is trusted
+            if (isinstance(data, dict) and "errors" not in data
+                    and data.get("name") == value):
+                return data
+            # Resource deleted or renamed behind our back
+            resolver.names.delete(key)
+
+    for lookup in lookups + list(fallbacks):
+        data = lookup(value)
+        if not isinstance(data, dict) or "errors" not in data:
+            if key and lookup is by_name and "id" in data:
+                resolver.names.set(key, data["id"])
+            return data
+        if not _is_not_found(data, code):
+            return data
+
+    return data
+
+
 def check_args(arguments, **kwargs):
     """Check that required arguments are passed to the function
 
@@ -11,3 +11,57 @@ PI_URL = "power-iaas.cloud.ibm.com"
 COS_DOMAIN = "cloud-object-storage.appdomain.cloud"
 HTTP_TIMEOUT = 60
 USER_AGENT = "IBM Cloud Python SDK"
+POOL_MAXSIZE = 10
+POOL_IDLE_TIMEOUT = 30
+PAGE_LIMIT = 100
+RESOLVE_CACHE_MAXSIZE = 1024
+RESOLVE_CACHE_TTL = 300
+TOKEN_LIFETIME = 3600
+TOKEN_REFRESH_MARGIN = 300
+ACCOUNTS_MAXSIZE = 16
+CONFIG_WATCH_INTERVAL = 10
+MEMCACHED_CONNECT_TIMEOUT = 1
+MEMCACHED_TIMEOUT = 1
+MEMCACHED_POOL_SIZE = 10
+CACHE_MAXSIZE = 1024
+CACHE_FILE = "cache.sqlite"
+# Default cache TTL per path pattern, near static data is kept longer
+CACHE_RULES = [
+    (r"/identity", 0),
+    (r"/v1/regions", 604800),
+    (r"/v1/(instance|volume|bare_metal_server|dedicated_host)/profiles",
+     86400),
+    (r"/v1/operating_systems", 86400),
+]
+CACHE_GENERATION_TTL = 2592000
+CACHE_STALE_TTL = 0
+CACHE_ENTRY_MAGIC = b"ics1:"
+CACHE_REVALIDATE_TTL = 3600
+CACHE_COMPRESS_THRESHOLD = 4096
+CACHE_CHUNKS_MAGIC = b"icc1:"
+# memcached refuses items larger than 1 MB by default
+MEMCACHED_CHUNK_SIZE = 1000000
+ACCEPT_ENCODING = "gzip, deflate"
+READ_CHUNK_SIZE = 65536
+BULK_CONCURRENCY = 16
+BULK_RETRIES = 3
+BULK_BACKOFF = 1
+BULK_MAX_BACKOFF = 60
+# Error codes returned by the APIs when the rate limit is exceeded
+RATE_LIMIT_CODES = ["too_many_requests", "rate_limit_exceeded",
+                    "rate_limited"]
+RETRY_ATTEMPTS = 4
+RETRY_BACKOFF = 0.5
+RETRY_MAX_BACKOFF = 30
+RETRY_MAX_AFTER = 300
+RETRY_STATUSES = [429, 502, 503, 504]
+# Methods which could be sent again without side effect
+IDEMPOTENT_METHODS = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]
+RATE_LIMIT_WINDOW_TTL = 10
+RATE_LIMIT_SHARED_COOLDOWN = 30
+CONNECT_TIMEOUT = 10
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30
+BREAKER_STATUSES = [500, 502, 503, 504]
+# Upper bounds in seconds of the request latency histogram buckets
+METRICS_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
@@ -0,0 +1,215 @@
+import threading
+from bisect import bisect_left
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+config = sdk()
+lock = threading.Lock()
+# Functions called with the request information on every event
+hooks = {
+    "before_request": [],
+    "after_response": [],
+    "on_cache_hit": [],
+    "on_cache_miss": [],
+}
+
+
+def register(event, func):
+    """Call a function on every occurrence of an event
+
+    Every hook receives a dict describing the request with the
+    "conn_type", "method", "path", "template" and "host" keys. The
+    before_request and after_response hooks are called for every HTTP
+    attempt, including the retried ones, and get the "attempt" number. The
+    same dict is given to both hooks of an attempt, after_response hooks
+    also get "status", "elapsed", "bytes_sent", "bytes_received" and
+    "error". Cache hooks get the cache "state", which is kept by the
+    requests sent after a cache miss.
+
+    :param event: Event name such as "before_request", "after_response",
+        "on_cache_hit" or "on_cache_miss"
+    :type event: str
+    :param func: Function called with the request information
+    :type func: function
+    """
+    if event not in hooks:
+        raise Exception("Unknown event: {}.".format(event))
+
+    with lock:
+        hooks[event] = hooks[event] + [func]
+
+
+def unregister(event, func):
+    """Stop calling a function on an event
+
+    :param event: Event name
+    :type event: str
+    :param func: Function registered for the event
+    :type func: function
+    """
+    with lock:
+        hooks[event] = [hook for hook in hooks[event] if hook != func]
+
+
+def emit(event, info):
+    """Call the hooks of an event
+
+    A failing hook is reported and ignored, it never fails the request.
+
+    :param event: Event name
+    :type event: str
+    :param info: Request information
+    :type info: dict
+    """
+    for hook in hooks[event]:
+        try:
+            hook(info)
+        except Exception as error:
+            print("Error running {} hook. {}".format(event, error))
+
+
+def _labels(**kwargs):
+    values = []
+    for key, value in kwargs.items():
+        value = (str(value).replace("\\", "\\\\").replace("\n", "\\n")
+                 .replace('"', '\\"'))
+        values.append('{}="{}"'.format(key, value))
+
+    return "{" + ",".join(values) + "}"
+
+
+class Metrics():
+    """Collect per endpoint request counters, latencies, bytes transferred
+    and cache hits
+
+    Requests are labelled with their path template so that identifiers
+    don't create a new series per resource.
+    """
+
+    def __init__(self, buckets=constants.METRICS_BUCKETS):
+        self.buckets = sorted(buckets)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget every collected metric"""
+        with self.lock:
+            self.requests = {}
+            self.latency = {}
+            self.bytes_sent = {}
+            self.bytes_received = {}
+            self.cache_hits = {}
+            self.cache_misses = {}
+
+    def after_response(self, info):
+        endpoint = (info["conn_type"], info["method"], info["template"])
+        status = info.get("status") or "error"
+        with self.lock:
+            key = endpoint + (status,)
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+            counts, total = self.latency.get(
+                endpoint, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect_left(self.buckets, info["elapsed"])] += 1
+            self.latency[endpoint] = (counts, total + info["elapsed"])
+
+            service = info["conn_type"]
+            self.bytes_sent[service] = (self.bytes_sent.get(service, 0)
+                                        + info.get("bytes_sent", 0))
+            self.bytes_received[service] = (
+                self.bytes_received.get(service, 0)
+                + info.get("bytes_received", 0))
+
+    def on_cache_hit(self, info):
+        key = (info["conn_type"], info["template"], info["state"])
+        with self.lock:
+            self.cache_hits[key] = self.cache_hits.get(key, 0) + 1
+
+    def on_cache_miss(self, info):
+        key = (info["conn_type"], info["template"])
+        with self.lock:
+            self.cache_misses[key] = self.cache_misses.get(key, 0) + 1
+
+    def hit_ratio(self):
+        """Retrieve the ratio of the cacheable requests served from cache
+
+        :return: Hit ratio between 0 and 1, None without cacheable request
+        :rtype: float
+        """
+        with self.lock:
+            hits = sum(self.cache_hits.values())
+            total = hits + sum(self.cache_misses.values())
+
+        return hits / total if total else None
+
+    def render(self):
+        """Export the metrics in Prometheus text format
+
+        :return: Metrics in Prometheus exposition format
+        :rtype: str
+        """
+        lines = []
+        with self.lock:
+            lines.append("# HELP ibmcloud_sdk_requests_total HTTP requests "
+                         "sent to the APIs.")
+            lines.append("# TYPE ibmcloud_sdk_requests_total counter")
+            for (service, method, path, status), value in sorted(
+                    self.requests.items(), key=str):
+                lines.append("ibmcloud_sdk_requests_total{} {}".format(
+                    _labels(service=service, method=method, path=path,
+                            status=status), value))
+
+            name = "ibmcloud_sdk_request_duration_seconds"
+            lines.append("# HELP {} HTTP request latency.".format(name))
+            lines.append("# TYPE {} histogram".format(name))
+            for (service, method, path), (counts, total) in sorted(
+                    self.latency.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + ["+Inf"], counts):
+                    cumulative += count
+                    lines.append("{}_bucket{} {}".format(name, _labels(
+                        service=service, method=method, path=path,
+                        le=bound), cumulative))
+                labels = _labels(service=service, method=method, path=path)
+                lines.append("{}_sum{} {}".format(name, labels, total))
+                lines.append("{}_count{} {}".format(name, labels,
+                                                    cumulative))
+
+            for name, values, description in [
+                    ("ibmcloud_sdk_request_bytes_total", self.bytes_sent,
+                     "Bytes sent to the APIs."),
+                    ("ibmcloud_sdk_response_bytes_total",
+                     self.bytes_received, "Bytes received from the APIs.")]:
+                lines.append("# HELP {} {}".format(name, description))
+                lines.append("# TYPE {} counter".format(name))
+                for service, value in sorted(values.items()):
+                    lines.append("{}{} {}".format(
+                        name, _labels(service=service), value))
+
+            lines.append("# HELP ibmcloud_sdk_cache_hits_total Requests "
+                         "served from cache.")
+            lines.append("# TYPE ibmcloud_sdk_cache_hits_total counter")
+            for (service, path, state), value in sorted(
+                    self.cache_hits.items()):
+                lines.append("ibmcloud_sdk_cache_hits_total{} {}".format(
+                    _labels(service=service, path=path, state=state),
+                    value))
+
+            lines.append("# HELP ibmcloud_sdk_cache_misses_total Cacheable "
+                         "requests sent to the APIs.")
+            lines.append("# TYPE ibmcloud_sdk_cache_misses_total counter")
+            for (service, path), value in sorted(self.cache_misses.items()):
+                lines.append("ibmcloud_sdk_cache_misses_total{} {}".format(
+                    _labels(service=service, path=path), value))
+
+        return "\n".join(lines) + "\n"
+
+
+collector = Metrics()
+
+# Built-in metrics are collected unless disabled in sdk.yaml
+if (config or {}).get("metrics", True):
+    register("after_response", collector.after_response)
+    register("on_cache_hit", collector.on_cache_hit)
+    register("on_cache_miss", collector.on_cache_miss)
@@ -0,0 +1,294 @@
+import atexit
+import http.client
+import select
+import threading
+import time
+import zlib
+from collections import deque
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import breaker
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import ratelimit
+
+
+config = sdk()
+pools = {}
+lock = threading.Lock()
+
+# Errors raised when a keep-alive socket has been closed by the remote side
+# while it was sitting in the pool.
+STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class HTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection with distinct connect and read timeouts"""
+
+    def __init__(self, host, connect_timeout=constants.CONNECT_TIMEOUT,
+                 timeout=constants.HTTP_TIMEOUT):
+        super().__init__(host, timeout=connect_timeout)
+        self.read_timeout = timeout
+
+    def connect(self):
+        super().connect()
+        self.sock.settimeout(self.read_timeout)
+
+
+class ConnectionPool():
+
+    def __init__(self, host, maxsize=constants.POOL_MAXSIZE,
+                 idle_timeout=constants.POOL_IDLE_TIMEOUT,
+                 timeout=constants.HTTP_TIMEOUT, limiter=None,
+                 breaker=None, connect_timeout=constants.CONNECT_TIMEOUT):
+        self.host = host
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.limiter = limiter
+        self.breaker = breaker
+        self.idle = deque()
+        self.lock = threading.Lock()
+
+    def new_connection(self):
+        """Open a new HTTPS connection to the pool host
+
+        :return: HTTPS connection
+        :rtype: HTTPSConnection
+        """
+        return HTTPSConnection(self.host, self.connect_timeout, self.timeout)
+
+    def get_connection(self):
+        """Retrieve an idle connection from the pool or open a new one
+
+        Idle connections expired or closed by the server are discarded.
+
+        :return: HTTPS connection and whether it has been reused
+        :rtype: tuple
+        """
+        with self.lock:
+            while self.idle:
+                conn, last_used = self.idle.pop()
+                if (time.monotonic() - last_used < self.idle_timeout
+                        and not is_dropped(conn)):
+                    return conn, True
+                conn.close()
+
+        return self.new_connection(), False
+
+    def put_connection(self, conn):
+        """Give a connection back to the pool
+
+        The connection is closed if the pool is already full.
+
+        :param conn: HTTPS connection
+        :type conn: http.client.HTTPSConnection
+        """
+        with self.lock:
+            if len(self.idle) < self.maxsize:
+                self.idle.append((conn, time.monotonic()))
+                return
+
+        conn.close()
+
+    def request(self, method, path, payload=None, headers=None):
+        """Send an HTTP request using a pooled connection
+
+        If a reused connection turns out to be stale, the request is sent
+        once again on a fresh connection when it couldn't be written or is
+        idempotent. Requests are refused right away
+        while the circuit breaker of the endpoint is open.
+
+        :param method: HTTP method
+        :type method: str
+        :param path: Path used by within the query
+        :type path: str
+        :param payload: Body sent during the query
+        :type payload: str, optional
+        :param headers: Headers sent during the query
+        :type headers: dict, optional
+        :return: HTTP response and its body
+        :rtype: tuple
+        """
+        if self.breaker:
+            self.breaker.allow()
+        if self.limiter:
+            self.limiter.acquire()
+
+        try:
+            res, data = self._request(method, path, payload, headers)
+        except Exception:
+            if self.breaker:
+                self.breaker.failure()
+            raise
+
+        if self.breaker:
+            self.breaker.record(res.status)
+
+        return res, data
+
+    def _request(self, method, path, payload, headers):
+        conn, reused = self.get_connection()
+        sent = False
+        try:
+            self._write(conn, method, path, payload, headers)
+            sent = True
+            res, data = self._read(conn)
+        except STALE_ERRORS:
+            conn.close()
+            # The server could have processed a request already written,
+            # only idempotent ones are sent again in that case
+            if not reused or (sent and method not in
+                              constants.IDEMPOTENT_METHODS):
+                raise
+            conn = self.new_connection()
+            try:
+                res, data = self._send(conn, method, path, payload, headers)
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        if res.will_close:
+            conn.close()
+        else:
+            self.put_connection(conn)
+
+        return res, data
+
+    def _send(self, conn, method, path, payload, headers):
+        self._write(conn, method, path, payload, headers)
+
+        return self._read(conn)
+
+    def _write(self, conn, method, path, payload, headers):
+        headers = dict(headers or {})
+        headers.setdefault("Accept-Encoding", constants.ACCEPT_ENCODING)
+        conn.request(method, path, payload, headers)
+
+    def _read(self, conn):
+        res = conn.getresponse()
+
+        return res, read(res)
+
+    def close(self):
+        """Close every idle connection of the pool"""
+        with self.lock:
+            while self.idle:
+                conn, _ = self.idle.pop()
+                conn.close()
+
+
+def is_dropped(conn):
+    """Check if an idle connection has been closed by the remote side
+
+    An idle keep-alive socket has nothing to read, it becomes readable
+    when the server closes it.
+
+    :param conn: HTTPS connection
+    :type conn: http.client.HTTPSConnection
+    :return: Whether the connection can't be used anymore
+    :rtype: bool
+    """
+    sock = conn.sock
+    if sock is None:
+        return True
+
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+
+    return bool(readable)
+
+
+def get_decompressor(encoding):
+    """Create a decompressor for a response content encoding
+
+    :param encoding: Content-Encoding header value
+    :type encoding: str
+    :return: Decompressor or None if the body isn't compressed
+    :rtype: zlib.Decompress
+    """
+    encoding = (encoding or "").lower()
+    if encoding == "gzip":
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    elif encoding == "deflate":
+        return zlib.decompressobj()
+
+    return None
+
+
+def read(res):
+    """Read the body of a response and decompress it when needed
+
+    The body is decompressed while it's read, so the compressed body is
+    never held in memory as a whole.
+
+    :param res: HTTP response
+    :type res: http.client.HTTPResponse
+    :return: Response body
+    :rtype: bytes
+    """
+    decompressor = get_decompressor(res.getheader("Content-Encoding"))
+    if decompressor is None:
+        return res.read()
+
+    chunks = []
+    while True:
+        chunk = res.read(constants.READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        chunks.append(decompressor.decompress(chunk))
+    chunks.append(decompressor.flush())
+
+    return b"".join(chunks)
+
+
+def get_pool(conn_type, host, timeout=constants.HTTP_TIMEOUT):
+    """Retrieve the connection pool for a connection type and host
+
+    :param conn_type: Connection type such as "iaas", "rg", "power", etc...
+    :type conn_type: str
+    :param host: Host to connect to
+    :type host: str
+    :param timeout: HTTP read timeout in seconds, overridden by the
+        read_timeout option of sdk.yaml
+    :type timeout: int, optional
+    :return: Connection pool
+    :rtype: ConnectionPool
+    """
+    key = (conn_type, host)
+    with lock:
+        if key not in pools:
+            options = config or {}
+            pools[key] = ConnectionPool(
+                host,
+                maxsize=options.get("pool_maxsize", constants.POOL_MAXSIZE),
+                idle_timeout=options.get("pool_idle_timeout",
+                                         constants.POOL_IDLE_TIMEOUT),
+                timeout=options.get("read_timeout", timeout),
+                limiter=ratelimit.limiter(conn_type, host),
+                breaker=breaker.breaker(conn_type, host),
+                connect_timeout=options.get("connect_timeout",
+                                            constants.CONNECT_TIMEOUT),
+            )
+
+        return pools[key]
+
+
+def close_all():
+    """Close every connection pool"""
+    with lock:
+        for pool in pools.values():
+            pool.close()
+        pools.clear()
+
+
+atexit.register(close_all)
@@ -0,0 +1,137 @@
+import threading
+import time
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import constants
+
+
+config = sdk()
+limiters = {}
+lock = threading.Lock()
+
+
+class TokenBucket():
+    """Limit the rate of requests sent by the threads of the process
+
+    The bucket holds up to `burst` tokens and is refilled with `rate`
+    tokens per second, every request takes a token.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst or rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token if one is available
+
+        :return: 0 if a token has been taken, otherwise seconds to wait
+            before trying again
+        :rtype: float
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens
+                              + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is taken"""
+        delay = self.reserve()
+        while delay:
+            time.sleep(delay)
+            delay = self.reserve()
+
+
+class SharedBucket(TokenBucket):
+    """Limit the rate of requests sent by every process sharing memcached
+
+    Requests are counted per second into memcached, the local bucket is
+    used for `cooldown` seconds when memcached can't be reached.
+    """
+
+    def __init__(self, name, rate, burst=None,
+                 cooldown=constants.RATE_LIMIT_SHARED_COOLDOWN):
+        super().__init__(rate, burst)
+        self.name = name
+        self.cooldown = cooldown
+        self.failed = None
+
+    def reserve(self):
+        failed = self.failed
+        if failed is not None and time.monotonic() - failed < self.cooldown:
+            return super().reserve()
+
+        now = time.time()
+        window = int(now)
+        key = "ratelimit:{}:{}".format(self.name, window)
+        try:
+            client = cache.client()
+            count = client.incr(key, 1, noreply=False)
+            if not count:
+                # First request of this second
+                client.add(key, b"0", expire=constants.RATE_LIMIT_WINDOW_TTL,
+                           noreply=False)
+                count = client.incr(key, 1, noreply=False)
+            if not count:
+                # Errors are ignored by the client of several nodes, which
+                # returns None or False instead of the counter
+                raise OSError("Request counter {} unavailable.".format(key))
+        except Exception as error:
+            # Report the outage once, not on every request
+            if failed is None:
+                print("Error counting requests into cache, local rate "
+                      "limit used. {}".format(error))
+            self.failed = time.monotonic()
+            return super().reserve()
+
+        if failed is not None:
+            print("Counting requests into cache again.")
+            self.failed = None
+
+        if count <= self.rate:
+            return 0
+
+        # Wait for the next second
+        return window + 1 - now
+
+
+def _new_limiter(conn_type, host):
+    options = config or {}
+    rate = (options.get("rate_limits") or {}).get(conn_type)
+    if not rate:
+        return None
+
+    burst = (options.get("rate_limit_burst") or {}).get(conn_type)
+    if options.get("rate_limit_shared") and cache.client():
+        return SharedBucket("{}:{}".format(conn_type, host), rate, burst,
+                            options.get("rate_limit_shared_cooldown",
+                                        constants.RATE_LIMIT_SHARED_COOLDOWN))
+
+    return TokenBucket(rate, burst)
+
+
+def limiter(conn_type, host):
+    """Retrieve the rate limiter of a connection type and host
+
+    :param conn_type: Connection type such as "iaas", "rg", "power", etc...
+    :type conn_type: str
+    :param host: Host to connect to
+    :type host: str
+    :return: Rate limiter or None if the rate is not limited
+    :rtype: TokenBucket
+    """
+    key = (conn_type, host)
+    if key not in limiters:
+        with lock:
+            if key not in limiters:
+                limiters[key] = _new_limiter(conn_type, host)
+
+    return limiters[key]
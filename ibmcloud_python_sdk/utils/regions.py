@@ -0,0 +1,92 @@
+from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.config import region
+from ibmcloud_python_sdk.utils import bulk
+from ibmcloud_python_sdk.vpc import geo
+
+
+class MultiRegion():
+    """Issue the same call against several regions at the same time
+
+    Calls are done from the bulk thread pool, each one within the region
+    context so the requests are sent to the regional endpoints.
+    """
+
+    def __init__(self, regions=None, concurrency=None):
+        self.cfg = params()
+        self.regions = list(regions) if regions else None
+        self.concurrency = concurrency
+
+    def get_regions(self):
+        """Retrieve the regions calls are done against
+
+        Available VPC regions are discovered when no region has been
+        given.
+
+        :return: List of region names
+        :rtype: list
+        """
+        if self.regions:
+            return self.regions
+
+        try:
+            data = geo.Geo().get_regions()
+            if "errors" in data:
+                return data
+
+            self.regions = [r["name"] for r in data["regions"]
+                            if r.get("status", "available") == "available"]
+
+            return self.regions
+
+        except Exception as error:
+            print("Error fetching regions. {}".format(error))
+            raise
+
+    def call(self, func, *args, **kwargs):
+        """Call a function against every region
+
+        :param func: Function to call such as Vpc().get_vpcs
+        :type func: function
+        :return: Result of every region keyed by region name
+        :rtype: dict
+        """
+        regions = self.get_regions()
+        if isinstance(regions, dict):
+            return regions
+
+        def regional(name):
+            with region(name):
+                return func(*args, **kwargs)
+
+        results = bulk.map(regional, regions,
+                           concurrency=self.concurrency or len(regions))
+
+        return dict(zip(regions, results))
+
+    def merge(self, func, key, *args, **kwargs):
+        """Call a function against every region and merge the collections
+
+        Every resource is tagged with its region under the "region" key.
+        Errors of the regions which failed are kept under the
+        "failed_regions" key.
+
+        :param func: Function returning a collection such as Vpc().get_vpcs
+        :type func: function
+        :param key: Key of the resource list such as "vpcs"
+        :type key: str
+        :return: Merged collection
+        :rtype: dict
+        """
+        results = self.call(func, *args, **kwargs)
+        if "errors" in results:
+            return results
+
+        merged = {key: []}
+        for name, data in results.items():
+            if not isinstance(data, dict) or "errors" in data:
+                merged.setdefault("failed_regions", {})[name] = data
+                continue
+            for item in data.get(key, []):
+                merged[key].append(dict(item, region=name))
+
+        return merged
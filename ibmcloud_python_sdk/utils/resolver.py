@@ -0,0 +1,163 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import partial, wraps
+from ibmcloud_python_sdk.config import current_region
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+config = sdk()
+
+
+class NameCache():
+    """Process-local LRU cache mapping resource names to their IDs
+
+    Entries expire after `ttl` seconds and the least recently used entry
+    is evicted once `maxsize` entries are stored.
+    """
+
+    def __init__(self, maxsize=constants.RESOLVE_CACHE_MAXSIZE,
+                 ttl=constants.RESOLVE_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Retrieve the ID cached for a key
+
+        :param key: Cache key
+        :type key: tuple
+        :return: Resource ID or None if not cached or expired
+        :rtype: str
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if time.monotonic() >= expires:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, value):
+        """Store the ID of a resource
+
+        :param key: Cache key
+        :type key: tuple
+        :param value: Resource ID
+        :type value: str
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        """Remove a key from the cache
+
+        :param key: Cache key
+        :type key: tuple
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def invalidate(self, kind):
+        """Remove every entry of a resource type
+
+        :param kind: Resource type, the qualified name of the class owning
+            the lookup functions such as "ibmcloud_python_sdk.vpc.vpc.Vpc"
+        :type kind: str
+        """
+        with self.lock:
+            for key in [k for k in self.entries if k[1] == kind]:
+                del self.entries[key]
+
+    def clear(self):
+        """Remove every entry from the cache"""
+        with self.lock:
+            self.entries.clear()
+
+
+def _new_cache():
+    options = config or {}
+
+    return NameCache(
+        maxsize=options.get("resolve_cache_maxsize",
+                            constants.RESOLVE_CACHE_MAXSIZE),
+        ttl=options.get("resolve_cache_ttl", constants.RESOLVE_CACHE_TTL),
+    )
+
+
+names = _new_cache()
+
+
+def kind(cls):
+    """Retrieve the resource type of a class
+
+    Classes of different services could have the same name such as VPC
+    and Power Image, the module is part of the resource type.
+
+    :param cls: Resource class
+    :type cls: class
+    :return: Qualified name of the class
+    :rtype: str
+    """
+    return "{}.{}".format(cls.__module__, cls.__qualname__)
+
+
+def cache_key(func, value):
+    """Build the cache key of a name looked up by a function
+
+    The key is made of the account and region the lookup is done against,
+    the resource type, the lookup function with its bound arguments (such
+    as the parent VPC of an address prefix) and the name itself.
+
+    :param func: Function retrieving the resource by name
+    :type func: function
+    :param value: Resource name
+    :type value: str
+    :return: Cache key or None if the function can't be identified
+    :rtype: tuple
+    """
+    args = ()
+    if isinstance(func, partial):
+        args = tuple(str(arg) for arg in func.args)
+        func = func.func
+
+    owner = getattr(func, "__self__", None)
+    if owner is None:
+        return None
+
+    cfg = getattr(owner, "cfg", None) or {}
+    account = hashlib.sha256(
+        str(cfg.get("key")).encode()).hexdigest()[:16]
+    # Instances could be used against another region than their own
+    scope = (account, current_region.get() or cfg.get("region"))
+
+    return (scope, kind(type(owner)), func.__name__, args, value)
+
+
+def invalidate(func):
+    """Decorator dropping cached names of a resource type
+
+    Wrap the create_* and delete_* methods of a class so lookups done after
+    a resource has been created or deleted don't use a stale ID.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            names.invalidate(kind(type(self)))
+
+    return wrapper
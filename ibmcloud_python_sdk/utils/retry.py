@@ -0,0 +1,211 @@
+import http.client
+import random
+import ssl
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import metrics
+
+
+config = sdk()
+policies = {}
+lock = threading.Lock()
+
+# Errors raised by the transport which are worth another attempt, such as
+# timeouts, TLS or connection resets.
+RETRY_ERRORS = (
+    OSError,
+    http.client.HTTPException,
+)
+
+
+class RetryPolicy():
+    """Decide if and when a failed request is sent again
+
+    Requests are retried with an exponential backoff with full jitter, or
+    after the delay asked by the Retry-After header. Non idempotent
+    requests such as POST are only retried when the API rejected them
+    without processing them (429 Too Many Requests).
+    """
+
+    def __init__(self, attempts=constants.RETRY_ATTEMPTS,
+                 backoff=constants.RETRY_BACKOFF,
+                 max_backoff=constants.RETRY_MAX_BACKOFF,
+                 statuses=constants.RETRY_STATUSES,
+                 methods=constants.IDEMPOTENT_METHODS):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = set(statuses)
+        self.methods = set(methods)
+
+    def retry_status(self, method, status, attempt):
+        """Check if a request should be sent again after a response
+
+        :param method: HTTP method
+        :type method: str
+        :param status: HTTP status of the response
+        :type status: int
+        :param attempt: Number of attempts already done
+        :type attempt: int
+        :return: Whether the request should be sent again
+        :rtype: bool
+        """
+        if attempt >= self.attempts or status not in self.statuses:
+            return False
+
+        return status == 429 or method in self.methods
+
+    def retry_error(self, method, error, attempt):
+        """Check if a request should be sent again after an error
+
+        :param method: HTTP method
+        :type method: str
+        :param error: Exception raised by the transport
+        :type error: Exception
+        :param attempt: Number of attempts already done
+        :type attempt: int
+        :return: Whether the request should be sent again
+        :rtype: bool
+        """
+        if attempt >= self.attempts or method not in self.methods:
+            return False
+        # An invalid certificate won't get any better
+        if isinstance(error, ssl.SSLCertVerificationError):
+            return False
+
+        return isinstance(error, RETRY_ERRORS)
+
+    def delay(self, attempt, res=None):
+        """Retrieve how long to wait before the next attempt
+
+        :param attempt: Number of attempts already done
+        :type attempt: int
+        :param res: HTTP response of the last attempt
+        :type res: http.client.HTTPResponse, optional
+        :return: Seconds to wait
+        :rtype: float
+        """
+        after = retry_after(res)
+        if after is not None:
+            return min(after, constants.RETRY_MAX_AFTER)
+
+        return random.uniform(0, min(self.backoff * 2 ** (attempt - 1),
+                                     self.max_backoff))
+
+    def request(self, conn, method, path, payload=None, headers=None,
+                info=None):
+        """Send an HTTP request until it succeeds or can't be retried
+
+        The hooks are called around every attempt, so the delays between
+        two attempts are not part of the request latency.
+
+        :param conn: Connection pool
+        :type conn: ConnectionPool
+        :param method: HTTP method
+        :type method: str
+        :param path: Path used by within the query
+        :type path: str
+        :param payload: Body sent during the query
+        :type payload: str, optional
+        :param headers: Headers sent during the query
+        :type headers: dict, optional
+        :param info: Request information given to the hooks, the hooks are
+            not called if not defined
+        :type info: dict, optional
+        :return: HTTP response and its body
+        :rtype: tuple
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                res, data = _send(conn, method, path, payload, headers, info,
+                                  attempt)
+            except Exception as error:
+                if not self.retry_error(method, error, attempt):
+                    raise
+                time.sleep(self.delay(attempt))
+                continue
+
+            if not self.retry_status(method, res.status, attempt):
+                return res, data
+            time.sleep(self.delay(attempt, res))
+
+
+def _send(conn, method, path, payload, headers, info, attempt):
+    if info is None:
+        return conn.request(method, path, payload, headers)
+
+    # Every attempt gets its own request information
+    info = dict(info, attempt=attempt)
+    metrics.emit("before_request", info)
+    start = time.monotonic()
+    try:
+        res, data = conn.request(method, path, payload, headers)
+    except Exception as error:
+        _responded(info, start, payload, None, None, error)
+        raise
+    _responded(info, start, payload, res, data)
+
+    return res, data
+
+
+def _responded(info, start, payload, res, data, error=None):
+    info["status"] = res.status if res is not None else None
+    info["elapsed"] = time.monotonic() - start
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    info["bytes_sent"] = len(payload or b"")
+    info["bytes_received"] = len(data or b"")
+    info["error"] = error
+    metrics.emit("after_response", info)
+
+
+def retry_after(res):
+    """Retrieve the delay asked by the Retry-After header of a response
+
+    :param res: HTTP response
+    :type res: http.client.HTTPResponse
+    :return: Seconds to wait or None if the header is missing or invalid
+    :rtype: float
+    """
+    value = res.getheader("Retry-After") if res is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def policy():
+    """Retrieve the retry policy configured in sdk.yaml
+
+    :return: Retry policy shared by the whole process
+    :rtype: RetryPolicy
+    """
+    if "policy" not in policies:
+        with lock:
+            if "policy" not in policies:
+                options = config or {}
+                policies["policy"] = RetryPolicy(
+                    attempts=options.get("retry_attempts",
+                                         constants.RETRY_ATTEMPTS),
+                    backoff=options.get("retry_backoff",
+                                        constants.RETRY_BACKOFF),
+                    max_backoff=options.get("retry_max_backoff",
+                                            constants.RETRY_MAX_BACKOFF),
+                    statuses=options.get("retry_statuses",
+                                         constants.RETRY_STATUSES),
+                )
+
+    return policies["policy"]
@@ -0,0 +1,86 @@
+import threading
+
+
+class Call():
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight():
+    """Coalesce identical concurrent calls into a single one
+
+    The first caller for a key runs the function, the callers arriving
+    while it's running wait for it and share its result.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def do(self, key, func, *args):
+        """Run a function once for all the concurrent callers of a key
+
+        :param key: Key identifying identical calls
+        :type key: str
+        :param func: Function to run
+        :type func: function
+        :return: Result of the function
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = Call()
+                self.calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.event.set()
+
+    def in_flight(self, key):
+        """Check if a call is running for a key
+
+        :param key: Key identifying identical calls
+        :type key: str
+        :return: Whether a call is running
+        :rtype: bool
+        """
+        with self.lock:
+            return key in self.calls
+
+    def do_in_background(self, key, func, *args):
+        """Run a function from a background thread unless already running
+
+        :param key: Key identifying identical calls
+        :type key: str
+        :param func: Function to run
+        :type func: function
+        """
+        if self.in_flight(key):
+            return
+
+        thread = threading.Thread(target=self._background,
+                                  args=(key, func) + args, daemon=True)
+        thread.start()
+
+    def _background(self, key, func, *args):
+        try:
+            self.do(key, func, *args)
+        except Exception as error:
+            print("Error running background call. {}".format(error))
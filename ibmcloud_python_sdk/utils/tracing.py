@@ -0,0 +1,123 @@
+import inspect
+from functools import wraps
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import metrics
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    # Tracing is optional, spans are only opened when OpenTelemetry is
+    # installed
+    trace = None
+
+
+config = sdk()
+TRACER_NAME = "ibmcloud_python_sdk"
+
+
+def enabled():
+    """Check if SDK operations should be traced
+
+    :return: Whether OpenTelemetry is installed and tracing is enabled
+    :rtype: bool
+    """
+    return trace is not None and (config or {}).get("tracing", True)
+
+
+def _set_errors(span, data):
+    if isinstance(data, dict) and data.get("errors"):
+        errors = data["errors"]
+        # SoftLayer errors from resource_error() are not wrapped in a list
+        if not isinstance(errors, list):
+            errors = [errors]
+        error = errors[0]
+        code = error.get("code") if isinstance(error, dict) else error
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(code)))
+
+
+def _span(cls, func):
+    name = "{}.{}".format(cls.__name__, func.__name__)
+
+    @wraps(func)
+    def traced_method(*args, **kwargs):
+        tracer = trace.get_tracer(TRACER_NAME)
+        with tracer.start_as_current_span(name) as span:
+            span.set_attribute("code.namespace", cls.__module__)
+            span.set_attribute("code.function", name)
+            data = func(*args, **kwargs)
+            _set_errors(span, data)
+
+            return data
+
+    return traced_method
+
+
+def traced(cls):
+    """Open a span around every public method of a class
+
+    Generators such as iter_*() methods are left untouched. The class is
+    returned as is when tracing is disabled.
+
+    :param cls: Resource class
+    :type cls: class
+    :return: Traced class
+    :rtype: class
+    """
+    if not enabled():
+        return cls
+
+    for name, func in list(vars(cls).items()):
+        if (name.startswith("_") or not inspect.isfunction(func)
+                or inspect.isgeneratorfunction(func)):
+            continue
+        setattr(cls, name, _span(cls, func))
+
+    return cls
+
+
+def before_request(info):
+    tracer = trace.get_tracer(TRACER_NAME)
+    span = tracer.start_span("{} {}".format(info["method"],
+                                            info["template"]))
+    span.set_attribute("http.method", info["method"])
+    span.set_attribute("http.route", info["template"])
+    span.set_attribute("net.peer.name", info["host"])
+    span.set_attribute("ibmcloud.service", info["conn_type"])
+    span.set_attribute("ibmcloud.cache", info.get("state", "none"))
+    if "attempt" in info:
+        # Retried requests get a span per attempt
+        span.set_attribute("ibmcloud.attempt", info["attempt"])
+    info["span"] = span
+
+
+def after_response(info):
+    span = info.pop("span", None)
+    if span is None:
+        return
+
+    if info.get("status") is not None:
+        span.set_attribute("http.status_code", info["status"])
+        if info["status"] >= 400:
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+    if info.get("error") is not None:
+        span.record_exception(info["error"])
+        span.set_status(trace.Status(trace.StatusCode.ERROR,
+                                     str(info["error"])))
+    span.end()
+
+
+def on_cache_hit(info):
+    # Requests served from cache get a span as well, without HTTP status
+    before_request(info)
+    after_response(info)
+
+
+def instrument():
+    """Open a child span for every request sent by query_wrapper()"""
+    metrics.register("before_request", before_request)
+    metrics.register("after_response", after_response)
+    metrics.register("on_cache_hit", on_cache_hit)
+
+
+if enabled():
+    instrument()
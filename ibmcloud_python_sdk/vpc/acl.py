@@ -1,14 +1,21 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Acl():
 
     def __init__(self):
@@ -27,8 +34,27 @@ class Acl():
             path = ("/v1/network_acls?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "network_acls", query=qw)
+
+        except Exception as error:
+            print("Error fetching network ACLs. {}".format(error))
+            raise
+
+    def iter_network_acls(self):
+        """Iterate over network ACL list page by page
+
+        :return: Generator of network ACLs
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for network_acls
+            path = ("/v1/network_acls?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "network_acls",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching network ACLs. {}".format(error))
@@ -42,18 +68,8 @@ class Acl():
         :return: Network ACL information
         :rtype: dict
         """
-        by_name = self.get_network_acl_by_name(acl)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_network_acl_by_id(acl)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(acl, self.get_network_acl_by_id,
+                       self.get_network_acl_by_name)
 
     def get_network_acl_by_id(self, id):
         """Retrieve specific network ACL by ID
@@ -85,13 +101,10 @@ class Acl():
         :rtype: dict
         """
         try:
-            # Retrieve network ACLs
-            data = self.get_network_acls()
-            if "errors" in data:
-                return data
-
-            # Loop over network ACLs until filter match
-            for acl in data['network_acls']:
+            # Loop over network ACLs page by page until filter match
+            for acl in self.iter_network_acls():
+                if "errors" in acl:
+                    return acl
                 if acl["name"] == name:
                     # Return data
                     return acl
@@ -112,18 +125,8 @@ class Acl():
         :return: Network ACL rules list
         :rtype: list
         """
-        by_name = self.get_network_acl_rules_by_name(acl)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_network_acl_rules_by_id(acl)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(acl, self.get_network_acl_rules_by_id,
+                       self.get_network_acl_rules_by_name)
 
     def get_network_acl_rules_by_id(self, id):
         """Retrieve rules for a specific network ACL by ID
@@ -139,8 +142,8 @@ class Acl():
                     "&generation={}".format(id, self.cfg["version"],
                                             self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "rules", query=qw)
 
         except Exception as error:
             print("Error fetching rules for network ACL with ID"
@@ -168,8 +171,8 @@ class Acl():
                                             self.cfg["version"],
                                             self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "rules", query=qw)
 
         except Exception as error:
             print("Error fetching network ACL with name {}. {}".format(
@@ -193,18 +196,8 @@ class Acl():
         if "errors" in acl_info:
             return acl_info
 
-        by_name = self.get_network_acl_rule_by_name(acl, rule)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_network_acl_rule_by_id(acl, rule)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(rule, partial(self.get_network_acl_rule_by_id, acl),
+                       partial(self.get_network_acl_rule_by_name, acl))
 
     def get_network_acl_rule_by_id(self, acl, id):
         """Retrieve specific rule for a specific network ACL by ID
@@ -273,6 +266,7 @@ class Acl():
                   "with ID {}. {}".format(name, acl_info["id"], error))
             raise
 
+    @invalidate
     def create_network_acl(self, **kwargs):
         """Create network ACL
 
@@ -339,6 +333,7 @@ class Acl():
             print("Error creating network ACL. {}".format(error))
             raise
 
+    @invalidate
     def create_network_acl_rule(self, **kwargs):
         """Create network ACL rule
 
@@ -404,6 +399,7 @@ class Acl():
             print("Error creating network ACL rule. {}".format(error))
             raise
 
+    @invalidate
     def delete_network_acl(self, acl):
         """Delete network ACL
 
@@ -435,6 +431,7 @@ class Acl():
             print("Error deleting network ACL with {}. {}".format(acl, error))
             raise
 
+    @invalidate
     def delete_network_acl_rule(self, acl, rule):
         """Delete network ACL rule
 
@@ -2,11 +2,17 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Fip():
 
     def __init__(self):
@@ -24,8 +30,27 @@ class Fip():
             path = ("/v1/floating_ips?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "floating_ips", query=qw)
+
+        except Exception as error:
+            print("Error fetching floating IPs. {}".format(error))
+            raise
+
+    def iter_floating_ips(self):
+        """Iterate over floating IP list page by page
+
+        :return: Generator of floating IPs
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for floating_ips
+            path = ("/v1/floating_ips?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "floating_ips",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching floating IPs. {}".format(error))
@@ -39,27 +64,9 @@ class Fip():
         :return: Floating IP information
         :rtype: dict
         """
-        by_name = self.get_floating_ip_by_name(fip)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_floating_ip_by_id(fip)
-                    if "errors" in by_id:
-                        for key_id in by_id["errors"]:
-                            if key_id["code"] == "not_found":
-                                by_addr = self.get_floating_ip_by_address(fip)
-                                if "errors" in by_addr:
-                                    return by_addr
-                                else:
-                                    return by_addr
-                            else:
-                                return by_id
-                    else:
-                        return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(fip, self.get_floating_ip_by_id,
+                       self.get_floating_ip_by_name,
+                       self.get_floating_ip_by_address)
 
     def get_floating_ip_by_id(self, id):
         """Retrieve specific floating IP by ID
@@ -91,13 +98,10 @@ class Fip():
         :rtype: dict
         """
         try:
-            # Retrieve floating IPs
-            data = self.get_floating_ips()
-            if "errors" in data:
-                return data
-
-            # Loop over instances until filter match
-            for fip in data["floating_ips"]:
+            # Loop over floating IPs page by page until filter match
+            for fip in self.iter_floating_ips():
+                if "errors" in fip:
+                    return fip
                 if fip["name"] == name:
                     # Return data
                     return fip
@@ -119,13 +123,10 @@ class Fip():
         :rtype: dict
         """
         try:
-            # Retrieve floating IPs
-            data = self.get_floating_ips()
-            if "errors" in data:
-                return data
-
-            # Loop over instances until filter match
-            for fip in data["floating_ips"]:
+            # Loop over floating IPs page by page until filter match
+            for fip in self.iter_floating_ips():
+                if "errors" in fip:
+                    return fip
                 if fip["address"] == address:
                     # Return data
                     return fip
@@ -139,6 +140,7 @@ class Fip():
             raise
 
     # Reserve floating IP
+    @invalidate
     def reserve_floating_ip(self, **kwargs):
         """Create floating IP
 
@@ -189,6 +191,7 @@ class Fip():
             print("Error reserving floating. {}".format(error))
             raise
 
+    @invalidate
     def release_floating_ip(self, fip):
         """Release floating IP
 
@@ -2,14 +2,20 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import floating_ip
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Gateway():
 
     def __init__(self):
@@ -29,8 +35,28 @@ class Gateway():
             path = ("/v1/public_gateways?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "public_gateways",
+                             query=qw)
+
+        except Exception as error:
+            print("Error fetching public gateways. {}".format(error))
+            raise
+
+    def iter_public_gateways(self):
+        """Iterate over public gateways list page by page
+
+        :return: Generator of public gateways
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for public_gateways
+            path = ("/v1/public_gateways?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "public_gateways",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching public gateways. {}".format(error))
@@ -44,18 +70,8 @@ class Gateway():
         :return: Public gateway information
         :rtype: dict
         """
-        by_name = self.get_public_gateway_by_name(gateway)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_public_gateway_by_id(gateway)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(gateway, self.get_public_gateway_by_id,
+                       self.get_public_gateway_by_name)
 
     def get_public_gateway_by_id(self, id):
         """Retrieve specific public gateway by ID
@@ -87,13 +103,10 @@ class Gateway():
         :rtype: dict
         """
         try:
-            # Retrieve public gateways
-            data = self.get_public_gateways()
-            if "errors" in data:
-                return data
-
-            # Loop over gateways until filter match
-            for gateway in data["public_gateways"]:
+            # Loop over gateways page by page until filter match
+            for gateway in self.iter_public_gateways():
+                if "errors" in gateway:
+                    return gateway
                 if gateway["name"] == name:
                     # Return data
                     return gateway
@@ -106,6 +119,7 @@ class Gateway():
                 name, error))
             raise
 
+    @invalidate
     def create_public_gateway(self, **kwargs):
         """Create public gateway
 
@@ -170,6 +184,7 @@ class Gateway():
             print("Error creating public gateway. {}".format(error))
             raise
 
+    @invalidate
     def delete_public_gateway(self, gateway):
         """Delete public gateway
 
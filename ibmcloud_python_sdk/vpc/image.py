@@ -2,13 +2,20 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
+from ibmcloud_python_sdk.utils.common import set_query
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.vpc import volume
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Image():
 
     def __init__(self):
@@ -27,8 +34,28 @@ class Image():
             path = ("/v1/operating_systems?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "operating_systems",
+                             query=qw)
+
+        except Exception as error:
+            print("Error fetching operating systems. {}".format(error))
+            raise
+
+    def iter_operating_systems(self):
+        """Iterate over operating system list page by page
+
+        :return: Generator of operating systems
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for operating_systems
+            path = ("/v1/operating_systems?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(),
+                                   "operating_systems", query=qw)
 
         except Exception as error:
             print("Error fetching operating systems. {}".format(error))
@@ -66,8 +93,30 @@ class Image():
             path = ("/v1/images?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "images", query=qw)
+
+        except Exception as error:
+            print("Error fetching images. {}".format(error))
+            raise
+
+    def iter_images(self, name=None):
+        """Iterate over image list page by page
+
+        :param name: Filter images by name on the API side
+        :type name: str, optional
+        :return: Generator of images
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for images
+            path = ("/v1/images?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+            if name:
+                path = set_query(path, name=name)
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "images", query=qw)
 
         except Exception as error:
             print("Error fetching images. {}".format(error))
@@ -81,18 +130,7 @@ class Image():
         :return: Image information
         :rtype: dict
         """
-        by_name = self.get_image_by_name(image)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_image_by_id(image)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(image, self.get_image_by_id, self.get_image_by_name)
 
     def get_image_by_id(self, id):
         """Retrieve specific image by ID
@@ -123,13 +161,10 @@ class Image():
         :rtype: dict
         """
         try:
-            # Retrieve images
-            data = self.get_images()
-            if "errors" in data:
-                return data
-
-            # Loop over images until filter match
-            for image in data["images"]:
+            # Loop over images filtered by the API until filter match
+            for image in self.iter_images(name=name):
+                if "errors" in image:
+                    return image
                 if image["name"] == name:
                     # Return data
                     return image
@@ -141,6 +176,7 @@ class Image():
             print("Error fetching image with name {}. {}".format(name, error))
             raise
 
+    @invalidate
     def create_image(self, **kwargs):
         """Create image
 
@@ -207,6 +243,7 @@ class Image():
             print("Error creating image. {}".format(error))
             raise
 
+    @invalidate
     def delete_image(self, image):
         """Delete image
 
@@ -1,7 +1,13 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
+from ibmcloud_python_sdk.utils.common import set_query
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import image
 from ibmcloud_python_sdk.vpc import subnet
@@ -12,8 +18,10 @@ from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.utils.common import check_args
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Instance():
 
     def __init__(self):
@@ -36,7 +44,28 @@ class Instance():
             path = ("/v1/instances?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all("iaas", path, headers(), "instances", query=qw)
+
+        except Exception as error:
+            print("Error fetching instances. {}".format(error))
+            raise
+
+    def iter_instances(self, name=None):
+        """Iterate over instances list page by page
+
+        :param name: Filter instances by name on the API side
+        :type name: str, optional
+        :return: Generator of instances
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/instances?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+            if name:
+                path = set_query(path, name=name)
+
+            yield from query_items("iaas", path, headers(), "instances",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching instances. {}".format(error))
@@ -50,18 +79,8 @@ class Instance():
         :return: Instance information
         :rtype: dict
         """
-        by_name = self.get_instance_by_name(instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_by_id(instance)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(instance, self.get_instance_by_id,
+                       self.get_instance_by_name)
 
     def get_instance_by_id(self, id):
         """Retrieve specific instance by ID
@@ -90,11 +109,10 @@ class Instance():
         :rtype: dict
         """
         try:
-            data = self.get_instances()
-            if "errors" in data:
-                return data
-
-            for instance in data["instances"]:
+            # Loop over instances filtered by the API until filter match
+            for instance in self.iter_instances(name=name):
+                if "errors" in instance:
+                    return instance
                 if instance["name"] == name:
                     return instance
 
@@ -113,18 +131,8 @@ class Instance():
         :return: Instance configuration information
         :rtype: dict
         """
-        by_name = self.get_instance_configuration_by_name(instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_configuration_by_id(instance)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(instance, self.get_instance_configuration_by_id,
+                       self.get_instance_configuration_by_name)
 
     def get_instance_configuration_by_id(self, id):
         """Retrieve initial configuration for a specific instance by ID
@@ -179,18 +187,8 @@ class Instance():
         :return: List of instance's interfaces
         :rtype: list
         """
-        by_name = self.get_instance_interfaces_by_name(instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_interfaces_by_id(instance)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(instance, self.get_instance_interfaces_by_id,
+                       self.get_instance_interfaces_by_name)
 
     def get_instance_interfaces_by_id(self, id):
         """Retrieve network interfaces for a specific instance by ID
@@ -247,19 +245,9 @@ class Instance():
         :return: Instance's interface information
         :rtype: dict
         """
-        by_name = self.get_instance_interface_by_name(instance, interface)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_interface_by_id(instance,
-                                                              interface)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(interface,
+                       partial(self.get_instance_interface_by_id, instance),
+                       partial(self.get_instance_interface_by_name, instance))
 
     def get_instance_interface_by_id(self, instance, id):
         """Retrieve specific network interface for a specific instance by ID
@@ -502,6 +490,7 @@ class Instance():
                 profile, error))
             raise
 
+    @invalidate
     def create_instance(self, **kwargs):
         """Create VSI
 
@@ -713,6 +702,7 @@ class Instance():
             print("Error creating instance. {}".format(error))
             raise
 
+    @invalidate
     def create_instance_action(self, **kwargs):
         """Create instance action
 
@@ -755,6 +745,7 @@ class Instance():
             print("Error creating instance action. {}".format(error))
             raise
 
+    @invalidate
     def create_instance_interface(self, **kwargs):
         """Create instance interface
 
@@ -915,6 +906,7 @@ class Instance():
             print("Error creating volume attachment. {}".format(error))
             raise
 
+    @invalidate
     def delete_instance(self, instance):
         """Delete instance
 
@@ -943,6 +935,7 @@ class Instance():
             print("Error deleting instance {}. {}".format(instance, error))
             raise
 
+    @invalidate
     def delete_instance_interface(self, instance, interface):
         """Delete interface from instance
 
@@ -2,12 +2,18 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Key():
 
     def __init__(self):
@@ -25,8 +31,26 @@ class Key():
             path = ("/v1/keys?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "keys", query=qw)
+
+        except Exception as error:
+            print("Error fetching keys. {}".format(error))
+            raise
+
+    def iter_keys(self):
+        """Iterate over key list page by page
+
+        :return: Generator of keys
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for keys
+            path = ("/v1/keys?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "keys", query=qw)
 
         except Exception as error:
             print("Error fetching keys. {}".format(error))
@@ -40,18 +64,7 @@ class Key():
         :return: Key information
         :rtype: dict
         """
-        by_name = self.get_key_by_name(key)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_key_by_id(key)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(key, self.get_key_by_id, self.get_key_by_name)
 
     def get_key_by_id(self, id):
         """Retrieve specific key by ID
@@ -82,13 +95,10 @@ class Key():
         :rtype: dict
         """
         try:
-            # Retrieve keys
-            data = self.get_keys()
-            if "errors" in data:
-                return data
-
-            # Loop over keys until filter match
-            for key in data["keys"]:
+            # Loop over keys page by page until filter match
+            for key in self.iter_keys():
+                if "errors" in key:
+                    return key
                 if key["name"] == name:
                     # Return data
                     return key
@@ -100,6 +110,7 @@ class Key():
             print("Error fetching key with name {}. {}".format(name, error))
             raise
 
+    @invalidate
     def create_key(self, **kwargs):
         """Create key
 
@@ -150,6 +161,7 @@ class Key():
             print("Error creating key. {}".format(error))
             raise
 
+    @invalidate
     def delete_key(self, key):
         """Delete key
 
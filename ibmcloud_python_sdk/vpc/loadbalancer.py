@@ -1,14 +1,19 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
 from ibmcloud_python_sdk.vpc import subnet
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Loadbalancer():
 
     def __init__(self):
@@ -42,18 +47,7 @@ class Loadbalancer():
         :return: Load balancer information
         :rtype: dict
         """
-        by_name = self.get_lb_by_name(lb)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_by_id(lb)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(lb, self.get_lb_by_id, self.get_lb_by_name)
 
     def get_lb_by_id(self, id):
         """Retrieve specific load balancer by ID
@@ -292,19 +286,9 @@ class Loadbalancer():
         :return: Listerner information
         :rtype: dict
         """
-        by_name = self.get_lb_listener_policy_by_name(lb, listener, policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_listener_policy_by_id(lb, listener,
-                                                              policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        by_id = partial(self.get_lb_listener_policy_by_id, lb, listener)
+        by_name = partial(self.get_lb_listener_policy_by_name, lb, listener)
+        return resolve(policy, by_id, by_name)
 
     def get_lb_listener_policy_by_id(self, lb, listener, id):
         """Retrieve specific policy from listener by ID
@@ -488,18 +472,8 @@ class Loadbalancer():
         :return: Pool information
         :rtype: dict
         """
-        by_name = self.get_lb_pool_by_name(lb, pool)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_pool_by_id(lb, pool)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(pool, partial(self.get_lb_pool_by_id, lb),
+                       partial(self.get_lb_pool_by_name, lb))
 
     def get_lb_pool_by_id(self, lb, id):
         """Retrieve specific pool from load balancer by ID
@@ -705,6 +679,7 @@ class Loadbalancer():
                   " load balancer {}. {}".format(member, pool, lb, error))
             raise
 
+    @invalidate
     def create_lb(self, **kwargs):
         """Create load balancer
 
@@ -785,6 +760,7 @@ class Loadbalancer():
             print("Error creating load balancer. {}".format(error))
             raise
 
+    @invalidate
     def create_listener(self, **kwargs):
         """Create listener
 
@@ -859,6 +835,7 @@ class Loadbalancer():
                 lb_info["id"], error))
             raise
 
+    @invalidate
     def create_policy(self, **kwargs):
         """Create policy
 
@@ -929,6 +906,7 @@ class Loadbalancer():
                   " {}. {}".format(listener_info["id"], lb_info["id"], error))
             raise
 
+    @invalidate
     def create_rule(self, **kwargs):
         """Create rule
 
@@ -1009,6 +987,7 @@ class Loadbalancer():
                                             lb_info["id"], error))
             raise
 
+    @invalidate
     def create_pool(self, **kwargs):
         """Create pool
 
@@ -1079,6 +1058,7 @@ class Loadbalancer():
                 lb_info["id"], error))
             raise
 
+    @invalidate
     def create_member(self, **kwargs):
         """Create member and add member to the pool
 
@@ -1141,6 +1121,7 @@ class Loadbalancer():
                   " {}. {}".format(pool_info["id"], lb_info["id"], error))
             raise
 
+    @invalidate
     def delete_lb(self, lb):
         """Delete load balancer
 
@@ -1173,6 +1154,7 @@ class Loadbalancer():
             print("Error deleting load balancer {}. {}".format(lb, error))
             raise
 
+    @invalidate
     def delete_listener(self, lb, listener):
         """Delete listener from load balancer
 
@@ -1214,6 +1196,7 @@ class Loadbalancer():
                   " {}".format(listener, lb, error))
             raise
 
+    @invalidate
     def delete_policy(self, lb, listener, policy):
         """Delete policy from listener
 
@@ -1264,6 +1247,7 @@ class Loadbalancer():
                   " {}. {}".format(policy, listener, lb, error))
             raise
 
+    @invalidate
     def delete_rule(self, lb, listener, policy, rule):
         """Delete rule from policy
 
@@ -1327,6 +1311,7 @@ class Loadbalancer():
                                                  error))
             raise
 
+    @invalidate
     def delete_pool(self, lb, pool):
         """Delete pool from load balancer
 
@@ -1368,6 +1353,7 @@ class Loadbalancer():
                   " {}".format(pool, lb, error))
             raise
 
+    @invalidate
     def delete_member(self, lb, pool, member):
         """Delete member from pool
 
@@ -1,15 +1,22 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
 from ibmcloud_python_sdk.vpc import instance
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Security():
 
     def __init__(self):
@@ -29,8 +36,28 @@ class Security():
             path = ("/v1/security_groups?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "security_groups",
+                             query=qw)
+
+        except Exception as error:
+            print("Error fetching security groups. {}".format(error))
+            raise
+
+    def iter_security_groups(self):
+        """Iterate over security group list page by page
+
+        :return: Generator of security groups
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for security_groups
+            path = ("/v1/security_groups?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "security_groups",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching security groups. {}".format(error))
@@ -44,18 +71,8 @@ class Security():
         :return: Security group information
         :rtype: dict
         """
-        by_name = self.get_security_group_by_name(security_group)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_security_group_by_id(security_group)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(security_group, self.get_security_group_by_id,
+                       self.get_security_group_by_name)
 
     def get_security_group_by_id(self, id):
         """Retrieve specific security group by ID
@@ -87,13 +104,10 @@ class Security():
         :rtype: dict
         """
         try:
-            # Retrieve security groups
-            data = self.get_security_groups()
-            if "errors" in data:
-                return data
-
-            # Loop over security groups until filter match
-            for sg in data['security_groups']:
+            # Loop over security groups page by page until filter match
+            for sg in self.iter_security_groups():
+                if "errors" in sg:
+                    return sg
                 if sg["name"] == name:
                     # Return data
                     return sg
@@ -144,20 +158,11 @@ class Security():
         :return: Network interface information
         :rtype: dict
         """
-        by_name = self.get_security_group_interface_by_name(security_group,
-                                                            interface)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_security_group_interface_by_id(
-                        security_group, interface)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        by_id = partial(self.get_security_group_interface_by_id,
+                        security_group)
+        by_name = partial(self.get_security_group_interface_by_name,
+                          security_group)
+        return resolve(interface, by_id, by_name)
 
     def get_security_group_interface_by_id(self, security_group, id):
         """Retrieve specific network interface associated to a security group
@@ -357,6 +362,7 @@ class Security():
                   " {}. {}".format(target, args["security_group"], error))
             raise
 
+    @invalidate
     def create_security_group(self, **kwargs):
         """Create security group
 
@@ -417,6 +423,7 @@ class Security():
             print("Error creating security group. {}".format(error))
             raise
 
+    @invalidate
     def create_security_group_rule(self, **kwargs):
         """Create security group rule
 
@@ -497,6 +504,7 @@ class Security():
             print("Error creating security group rule. {}".format(error))
             raise
 
+    @invalidate
     def delete_security_group(self, security_group):
         """Delete security group
 
@@ -565,6 +573,7 @@ class Security():
                   " {}. {}".format(interface, security_group, error))
             raise
 
+    @invalidate
     def delete_security_group_rule(self, security_group, rule):
         """Delete rule from security group
 
@@ -2,6 +2,10 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.vpc import gateway as gw
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import acl
@@ -9,8 +13,10 @@ from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Subnet():
 
     def __init__(self):
@@ -31,8 +37,27 @@ class Subnet():
             path = ("/v1/subnets?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "subnets", query=qw)
+
+        except Exception as error:
+            print("Error fetching subnets. {}".format(error))
+            raise
+
+    def iter_subnets(self):
+        """Iterate over subnet list page by page
+
+        :return: Generator of subnets
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for subnets
+            path = ("/v1/subnets?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "subnets",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching subnets. {}".format(error))
@@ -46,18 +71,7 @@ class Subnet():
         :return: Subnet information
         :rtype: dict
         """
-        by_name = self.get_subnet_by_name(subnet)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_subnet_by_id(subnet)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(subnet, self.get_subnet_by_id, self.get_subnet_by_name)
 
     def get_subnet_by_id(self, id):
         """Retrieve specific subnet by ID
@@ -88,13 +102,10 @@ class Subnet():
         :rtype: dict
         """
         try:
-            # Retrieve subnets
-            data = self.get_subnets()
-            if "errors" in data:
-                return data
-
-            # Loop over subnets until filter match
-            for subnet in data["subnets"]:
+            # Loop over subnets page by page until filter match
+            for subnet in self.iter_subnets():
+                if "errors" in subnet:
+                    return subnet
                 if subnet["name"] == name:
                     # Return data
                     return subnet
@@ -160,6 +171,7 @@ class Subnet():
                 subnet, error))
             raise
 
+    @invalidate
     def create_subnet(self, **kwargs):
         """Create subnet
 
@@ -379,6 +391,7 @@ class Subnet():
                   "subnet {}. {}".format(subnet, error))
             raise
 
+    @invalidate
     def delete_subnet(self, subnet):
         """Delete subnet
 
@@ -2,12 +2,19 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
+from ibmcloud_python_sdk.utils.common import set_query
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Volume():
 
     def __init__(self):
@@ -25,8 +32,27 @@ class Volume():
             path = ("/v1/volume/profiles?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "profiles", query=qw)
+
+        except Exception as error:
+            print("Error fetching volume profiles. {}".format(error))
+            raise
+
+    def iter_volume_profiles(self):
+        """Iterate over volume profile list page by page
+
+        :return: Generator of profiles
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for volume
+            path = ("/v1/volume/profiles?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "profiles",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching volume profiles. {}".format(error))
@@ -65,8 +91,31 @@ class Volume():
             path = ("/v1/volumes?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "volumes", query=qw)
+
+        except Exception as error:
+            print("Error fetching volumes. {}".format(error))
+            raise
+
+    def iter_volumes(self, name=None):
+        """Iterate over volume list page by page
+
+        :param name: Filter volumes by name on the API side
+        :type name: str, optional
+        :return: Generator of volumes
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for volumes
+            path = ("/v1/volumes?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+            if name:
+                path = set_query(path, name=name)
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "volumes",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching volumes. {}".format(error))
@@ -80,18 +129,7 @@ class Volume():
         :return: Volume information
         :rtype: dict
         """
-        by_name = self.get_volume_by_name(volume)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_volume_by_id(volume)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(volume, self.get_volume_by_id, self.get_volume_by_name)
 
     def get_volume_by_id(self, id):
         """Retrieve specific volume by ID
@@ -122,13 +160,10 @@ class Volume():
         :rtype: dict
         """
         try:
-            # Retrieve volumes
-            data = self.get_volumes()
-            if "errors" in data:
-                return data
-
-            # Loop over volumes until filter match
-            for volume in data["volumes"]:
+            # Loop over volumes filtered by the API until filter match
+            for volume in self.iter_volumes(name=name):
+                if "errors" in volume:
+                    return volume
                 if volume["name"] == name:
                     # Return response data
                     return volume
@@ -141,6 +176,7 @@ class Volume():
                                                                   error))
             raise
 
+    @invalidate
     def create_volume(self, **kwargs):
         """Create block volume
 
@@ -205,6 +241,7 @@ class Volume():
             print("Error creating volume. {}".format(error))
             raise
 
+    @invalidate
     def delete_volume(self, volume):
         """Delete volume
 
@@ -1,14 +1,21 @@
 import json
+from functools import partial
 
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Vpc():
 
     def __init__(self):
@@ -26,8 +33,26 @@ class Vpc():
             path = ("/v1/vpcs?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "vpcs", query=qw)
+
+        except Exception as error:
+            print("Error fetching VPCs. {}".format(error))
+            raise
+
+    def iter_vpcs(self):
+        """Iterate over VPC list page by page
+
+        :return: Generator of VPCs
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for vpcs
+            path = ("/v1/vpcs?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "vpcs", query=qw)
 
         except Exception as error:
             print("Error fetching VPCs. {}".format(error))
@@ -41,18 +66,7 @@ class Vpc():
         :return: VPC information
         :rtype: dict
         """
-        by_name = self.get_vpc_by_name(vpc)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpc_by_id(vpc)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(vpc, self.get_vpc_by_id, self.get_vpc_by_name)
 
     def get_vpc_by_id(self, id):
         """Retrieve specific VPC by ID
@@ -83,13 +97,10 @@ class Vpc():
         :rtype: dict
         """
         try:
-            # Retrieve VPCs
-            data = self.get_vpcs()
-            if "errors" in data:
-                return data
-
-            # Loop over VPCs until filter match
-            for vpc in data['vpcs']:
+            # Loop over VPCs page by page until filter match
+            for vpc in self.iter_vpcs():
+                if "errors" in vpc:
+                    return vpc
                 if vpc["name"] == name:
                     # Return data
                     return vpc
@@ -177,8 +188,39 @@ class Vpc():
                                             self.cfg["version"],
                                             self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "address_prefixes",
+                             query=qw)
+
+        except Exception as error:
+            print("Error fetching address prefixes in VPC {}. {}".format(
+                vpc, error))
+            raise
+
+    def iter_address_prefixes(self, vpc):
+        """Iterate over VPC address pool prefix list page by page
+
+        :param vpc: VPC name or ID
+        :type vpc: str
+        :return: Generator of adress prefixes
+        :rtype: generator
+        """
+        # Check if VPC exists and get information
+        vpc_info = self.get_vpc(vpc)
+        if "errors" in vpc_info:
+            yield vpc_info
+            return
+
+        try:
+            # Connect to api endpoint for vpcs
+            path = ("/v1/vpcs/{}/address_prefixes?version={}"
+                    "&generation={}".format(vpc_info["id"],
+                                            self.cfg["version"],
+                                            self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(),
+                                   "address_prefixes", query=qw)
 
         except Exception as error:
             print("Error fetching address prefixes in VPC {}. {}".format(
@@ -195,28 +237,9 @@ class Vpc():
         :return: Address prefix information
         :rtype: dict
         """
-        by_name = self.get_address_prefix_by_name(vpc, prefix)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_address_prefix_by_id(vpc, prefix)
-                    if "errors" in by_id:
-                        for key_id in by_id["errors"]:
-                            if key_id["code"] == "not_found":
-                                by_addr = self.get_address_prefix_by_cidr(
-                                    vpc, prefix)
-                                if "errors" in by_addr:
-                                    return by_addr
-                                else:
-                                    return by_addr
-                            else:
-                                return by_id
-                    else:
-                        return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(prefix, partial(self.get_address_prefix_by_id, vpc),
+                       partial(self.get_address_prefix_by_name, vpc),
+                       partial(self.get_address_prefix_by_cidr, vpc))
 
     def get_address_prefix_by_id(self, vpc, id):
         """Retrieve specific VPC address prefix by ID
@@ -264,13 +287,10 @@ class Vpc():
             return vpc_info
 
         try:
-            # Retrieve address prefixes
-            data = self.get_address_prefixes(vpc_info["id"])
-            if "errors" in data:
-                return data
-
-            # Loop over address prefixes until filter match
-            for prefix in data['address_prefixes']:
+            # Loop over address prefixes page by page until filter match
+            for prefix in self.iter_address_prefixes(vpc_info["id"]):
+                if "errors" in prefix:
+                    return prefix
                 if prefix["name"] == name:
                     # Return data
                     return prefix
@@ -299,13 +319,10 @@ class Vpc():
             return vpc_info
 
         try:
-            # Retrieve address prefixes
-            data = self.get_address_prefixes(vpc_info["id"])
-            if "errors" in data:
-                return data
-
-            # Loop over address prefixes until filter match
-            for prefix in data['address_prefixes']:
+            # Loop over address prefixes page by page until filter match
+            for prefix in self.iter_address_prefixes(vpc_info["id"]):
+                if "errors" in prefix:
+                    return prefix
                 if prefix["cidr"] == cidr:
                     # Return data
                     return prefix
@@ -357,18 +374,8 @@ class Vpc():
         :return: Routing table information
         :rtype: dict
         """
-        by_name = self.get_route_by_name(vpc, route)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_route_by_id(vpc, route)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(route, partial(self.get_route_by_id, vpc),
+                       partial(self.get_route_by_name, vpc))
 
     def get_route_by_id(self, vpc, id):
         """Retrieve specific route from VPC default routing table by ID
@@ -435,6 +442,7 @@ class Vpc():
                 name, vpc, error))
             raise
 
+    @invalidate
     def create_vpc(self, **kwargs):
         """Create VPC (Virtual Private Cloud)
 
@@ -485,6 +493,7 @@ class Vpc():
             print("Error creating VPC. {}".format(error))
             raise
 
+    @invalidate
     def create_address_prefix(self, **kwargs):
         """Create address prefix
 
@@ -544,6 +553,7 @@ class Vpc():
                 args['vpc'], error))
             raise
 
+    @invalidate
     def create_route(self, **kwargs):
         """Create route in VPC default routing table
 
@@ -607,6 +617,7 @@ class Vpc():
                 args['vpc'], error))
             raise
 
+    @invalidate
     def delete_vpc(self, vpc):
         """Delete VPC
 
@@ -638,6 +649,7 @@ class Vpc():
             print("Error deleting VPC {}. {}".format(vpc, error))
             raise
 
+    @invalidate
     def delete_address_prefix(self, vpc, prefix):
         """Delete address prefix
 
@@ -679,6 +691,7 @@ class Vpc():
                 prefix, vpc, error))
             raise
 
+    @invalidate
     def delete_route(self, vpc, route):
         """Delete route from VPC default routing table
 
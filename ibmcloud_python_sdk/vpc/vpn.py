@@ -1,7 +1,12 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import query_items
 from ibmcloud_python_sdk.vpc import subnet
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -9,8 +14,10 @@ from ibmcloud_python_sdk.utils.common import resource_found
 from ibmcloud_python_sdk.utils.common import resource_created
 from ibmcloud_python_sdk.utils.common import check_args
 from ibmcloud_python_sdk.resource import resource_group
+from ibmcloud_python_sdk.utils.tracing import traced
 
 
+@traced
 class Vpn():
 
     def __init__(self):
@@ -29,8 +36,27 @@ class Vpn():
             path = ("/v1/ike_policies?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "ike_policies", query=qw)
+
+        except Exception as error:
+            print("Error fetching IKE policies. {}".format(error))
+            raise
+
+    def iter_ike_policies(self):
+        """Iterate over IKE policy list page by page
+
+        :return: Generator of IKE policies
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for ike_policies
+            path = ("/v1/ike_policies?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "ike_policies",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching IKE policies. {}".format(error))
@@ -44,18 +70,8 @@ class Vpn():
         :return: IKE policy information
         :rtype: dict
         """
-        by_name = self.get_ike_policy_by_name(policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_ike_policy_by_id(policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(policy, self.get_ike_policy_by_id,
+                       self.get_ike_policy_by_name)
 
     def get_ike_policy_by_id(self, id):
         """Retrieve specific IKE policy by ID
@@ -86,13 +102,10 @@ class Vpn():
         :rtype: dict
         """
         try:
-            # Retrieve policies
-            data = self.get_ike_policies()
-            if "errors" in data:
-                return data
-
-            # Loop over policies until filter match
-            for policy in data["ike_policies"]:
+            # Loop over policies page by page until filter match
+            for policy in self.iter_ike_policies():
+                if "errors" in policy:
+                    return policy
                 if policy["name"] == name:
                     # Return data
                     return policy
@@ -143,8 +156,28 @@ class Vpn():
             path = ("/v1/ipsec_policies?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "ipsec_policies",
+                             query=qw)
+
+        except Exception as error:
+            print("Error fetching IPsec policies. {}".format(error))
+            raise
+
+    def iter_ipsec_policies(self):
+        """Iterate over IPsec policy list page by page
+
+        :return: Generator of IPSec policies
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for ipsec_policies
+            path = ("/v1/ipsec_policies?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "ipsec_policies",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching IPsec policies. {}".format(error))
@@ -158,18 +191,8 @@ class Vpn():
         :return: IPSec policy information
         :rtype: dict
         """
-        by_name = self.get_ipsec_policy_by_name(policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_ike_policy_by_id(policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(policy, self.get_ipsec_policy_by_id,
+                       self.get_ipsec_policy_by_name)
 
     def get_ipsec_policy_by_id(self, id):
         """Retrieve specific IPsec policy by ID
@@ -201,13 +224,10 @@ class Vpn():
         :rtype: dict
         """
         try:
-            # Retrieve policies
-            data = self.get_ipsec_policies()
-            if "errors" in data:
-                return data
-
-            # Loop over policies until filter match
-            for policy in data["ipsec_policies"]:
+            # Loop over policies page by page until filter match
+            for policy in self.iter_ipsec_policies():
+                if "errors" in policy:
+                    return policy
                 if policy["name"] == name:
                     # Return data
                     return policy
@@ -258,8 +278,27 @@ class Vpn():
             path = ("/v1/vpn_gateways?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            # Return data from every page
+            return query_all("iaas", path, headers(), "vpn_gateways", query=qw)
+
+        except Exception as error:
+            print("Error fetching VPN gateways. {}".format(error))
+            raise
+
+    def iter_vpn_gateways(self):
+        """Iterate over VPN gateway list page by page
+
+        :return: Generator of gateways
+        :rtype: generator
+        """
+        try:
+            # Connect to api endpoint for vpn_gateways
+            path = ("/v1/vpn_gateways?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            # Yield data page by page
+            yield from query_items("iaas", path, headers(), "vpn_gateways",
+                                   query=qw)
 
         except Exception as error:
             print("Error fetching VPN gateways. {}".format(error))
@@ -273,18 +312,8 @@ class Vpn():
         :return: Gateway information
         :rtype: dict
         """
-        by_name = self.get_vpn_gateway_by_name(gateway)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpn_gateway_by_id(gateway)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve(gateway, self.get_vpn_gateway_by_id,
+                       self.get_vpn_gateway_by_name)
 
     def get_vpn_gateway_by_id(self, id):
         """Retrieve specific VPN gateway by ID
@@ -316,13 +345,10 @@ class Vpn():
         :rtype: dict
         """
         try:
-            # Retrieve gateways
-            data = self.get_vpn_gateways()
-            if "errors" in data:
-                return data
-
-            # Loop over gateways until filter match
-            for gateway in data["vpn_gateways"]:
+            # Loop over gateways page by page until filter match
+            for gateway in self.iter_vpn_gateways():
+                if "errors" in gateway:
+                    return gateway
                 if gateway["name"] == name:
                     # Return data
                     return gateway
@@ -372,19 +398,9 @@ class Vpn():
         :return: Connection information
         :rtype: dict
         """
-        by_name = self.get_vpn_gateway_connection_by_name(gateway, connection)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpn_gateway_connection_by_id(gateway,
-                                                                  connection)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        by_id = partial(self.get_vpn_gateway_connection_by_id, gateway)
+        by_name = partial(self.get_vpn_gateway_connection_by_name, gateway)
+        return resolve(connection, by_id, by_name)
 
     def get_vpn_gateway_connection_by_id(self, gateway, id):
         """Retrieve specific connection for a VPN gateway by ID
@@ -630,6 +646,7 @@ class Vpn():
                                            connection, gateway, error))
             raise
 
+    @invalidate
     def create_ike_policy(self, **kwargs):
         """Create IKE policy
 
@@ -689,6 +706,7 @@ class Vpn():
             print("Error creating IKE policy. {}".format(error))
             raise
 
+    @invalidate
     def create_ipsec_policy(self, **kwargs):
         """Create IPsec policy
 
@@ -745,6 +763,7 @@ class Vpn():
             print("Error creating IPsec policy. {}".format(error))
             raise
 
+    @invalidate
     def create_gateway(self, **kwargs):
         """Create gateway
 
@@ -798,6 +817,7 @@ class Vpn():
             print("Error creating gateway. {}".format(error))
             raise
 
+    @invalidate
     def create_connection(self, **kwargs):
         """Create connection
 
@@ -1014,6 +1034,7 @@ class Vpn():
                                            args["gateway"], error))
             raise
 
+    @invalidate
     def delete_ike_policy(self, policy):
         """Delete IKE policy
 
@@ -1046,6 +1067,7 @@ class Vpn():
             print("Error deleting IKE policy {}. {}".format(policy, error))
             raise
 
+    @invalidate
     def delete_ipsec_policy(self, policy):
         """Delete IPsec policy
 
@@ -1078,6 +1100,7 @@ class Vpn():
             print("Error deleting IPsec policy {}. {}".format(policy, error))
             raise
 
+    @invalidate
     def delete_gateway(self, gateway):
         """Delete VPN gateway
 
@@ -1110,6 +1133,7 @@ class Vpn():
             print("Error deleting VPN gateway {}. {}".format(gateway, error))
             raise
 
+    @invalidate
     def delete_connection(self, gateway, connection):
         """Delete connection
 
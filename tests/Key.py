@@ -30,6 +30,13 @@ class Key(Common):
         }
         return(result)
 
+    @classmethod
+    def iter_return_not_found(self):
+        """
+        Will yield a not_found error
+        """
+        yield self.return_not_found()
+
     @classmethod
     def get_resource_group(self, service, verb, path, headers):
         result = {}
@@ -54,6 +61,13 @@ class Key(Common):
         }
         return(result)
 
+    @classmethod
+    def iter_keys_return_error(self):
+        """
+        Will yield an error (simulate API errors)
+        """
+        yield self.get_keys_return_error()
+
     @classmethod
     def qw_return_error(self, service, verb, path, headers):
         """
@@ -1,12 +1,18 @@
+import threading
+import time
 import unittest
 
+from jwt import encode
 from mock import patch
 
 from ibmcloud_python_sdk.auth import (
+    TokenManager,
     decode_token,
     get_token,
     get_headers,
+    token_info,
 )
+from ibmcloud_python_sdk.utils import common
 
 from tests.Authentication import Authentication
 from tests.Common import Common
@@ -53,4 +59,127 @@ class AuthenticationTestCase(unittest.TestCase):
 
     # def test_get_headers(self):
     #     """ Test get_headers"""
-    #     response = get_headers
\ No newline at end of file
+    #     response = get_headers
+
+
+class Iam(object):
+    """Fake IAM counting the token requests"""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.apikey = 0
+        self.refresh = 0
+
+    def get_token(self, url, key):
+        time.sleep(self.delay)
+        self.apikey += 1
+        token_info.update({"refresh_token": "refresh",
+                           "expiration": time.time() + 3600})
+        return "Bearer apikey-{}".format(self.apikey)
+
+    def refresh_token(self, url, token):
+        self.refresh += 1
+        token_info.update({"refresh_token": "refresh",
+                           "expiration": time.time() + 3600})
+        return "Bearer refresh-{}".format(self.refresh)
+
+
+class TokenManagerTestCase(unittest.TestCase):
+    """Test case for the token manager."""
+
+    def setUp(self):
+        self.iam = Iam()
+        self.patchers = [
+            patch('ibmcloud_python_sdk.auth.get_token', self.iam.get_token),
+            patch('ibmcloud_python_sdk.auth.refresh_token',
+                  self.iam.refresh_token),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.tokens = TokenManager(key="my-key", margin=300)
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_token_cached(self):
+        """Test token is requested once while valid."""
+        self.tokens.get_token()
+        self.assertEqual(self.tokens.get_token(), "Bearer apikey-1")
+        self.assertEqual(self.iam.apikey, 1)
+
+    def test_token_expired(self):
+        """Test expired token is refreshed with the refresh token."""
+        self.tokens.get_token()
+        self.tokens.expires = time.time() - 1
+        self.assertEqual(self.tokens.get_token(), "Bearer refresh-1")
+        self.assertEqual(self.iam.apikey, 1)
+
+    def test_refresh_token_error(self):
+        """Test API key is used when refresh token is rejected."""
+        self.tokens.get_token()
+        self.tokens.expires = time.time() - 1
+        with patch('ibmcloud_python_sdk.auth.refresh_token',
+                   Authentication.return_exception):
+            self.assertEqual(self.tokens.get_token(), "Bearer apikey-2")
+
+    def test_background_refresh(self):
+        """Test token about to expire is returned and refreshed."""
+        self.tokens.get_token()
+        self.tokens.expires = time.time() + 60
+        self.assertEqual(self.tokens.get_token(), "Bearer apikey-1")
+        for _ in range(100):
+            if not self.tokens.refreshing:
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.tokens.token, "Bearer refresh-1")
+
+    def test_single_flight(self):
+        """Test concurrent threads send a single request to IAM."""
+        self.iam.delay = 0.05
+        threads = [threading.Thread(target=self.tokens.get_token)
+                   for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.iam.apikey, 1)
+
+
+class TokenClaimsTestCase(unittest.TestCase):
+    """Test case for the token claims cache."""
+
+    claims = {"iam_id": "IBMid-123456BVZU", "exp": 4102444800,
+              "account": {"bss": "8d143b8b90e135fd8ffe0e5e9c291c9d"}}
+
+    def setUp(self):
+        jwt = encode(self.claims, "secret")
+        if isinstance(jwt, bytes):
+            jwt = jwt.decode()
+        self.token = "Bearer {}".format(jwt)
+        self.tokens = TokenManager(key="my-key")
+
+    @patch('ibmcloud_python_sdk.auth.decode')
+    def test_claims_decoded_once(self, decode):
+        """Test claims are exposed as attributes."""
+        decode.return_value = self.claims
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   lambda url, key: self.token):
+            self.tokens.get_token()
+            self.tokens.get_token()
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(self.tokens.iam_id, "IBMid-123456BVZU")
+        self.assertEqual(self.tokens.account_id,
+                         "8d143b8b90e135fd8ffe0e5e9c291c9d")
+        self.assertEqual(self.tokens.expires, 4102444800)
+
+    @patch('ibmcloud_python_sdk.utils.common.decode')
+    def test_account_id_lookup(self, decode):
+        """Test cache key does not decode the managed token."""
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   lambda url, key: self.token):
+            self.tokens.get_token()
+        account = common._account_id({"Authorization": self.token})
+        self.assertEqual(
+            account, "OGQxNDNiOGI5MGUxMzVmZDhmZmUwZTVlOWMyOTFjOWQ=")
+        decode.assert_not_called()
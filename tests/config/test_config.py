@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk import config
+
+
+CLOUDS = """---
+clouds:
+  default: acc
+  acc:
+    key: my-key
+    region: {}
+    version: 2020-03-10
+    generation: 2
+"""
+
+
+class ConfigTestCase(unittest.TestCase):
+    """Test case for the configuration loading."""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.creds = os.path.join(self.folder, "clouds.yaml")
+        self.write("us-south")
+        self.patcher = patch.dict(os.environ, {"IC_CONFIG_FILE": self.creds})
+        self.patcher.start()
+
+    def tearDown(self):
+        config.unwatch()
+        self.patcher.stop()
+        config.loaded.pop((self.creds, os.environ.get("IC_CONFIG_NAME")),
+                          None)
+        shutil.rmtree(self.folder)
+
+    def write(self, region, mtime=None):
+        with open(self.creds, "w") as creds:
+            creds.write(CLOUDS.format(region))
+        # Make sure the modification time changes between two writes
+        mtime = mtime or time.time() + len(region)
+        os.utime(self.creds, (mtime, mtime))
+
+    def test_params(self):
+        """Test configuration is read from the file."""
+        cfg = config.params()
+        self.assertEqual(cfg["region"], "us-south")
+        self.assertEqual(cfg["is_url"], "us-south.iaas.cloud.ibm.com")
+
+    def test_params_memoized(self):
+        """Test file is parsed only once."""
+        config.params()
+        with patch("ibmcloud_python_sdk.config.yaml.safe_load") as load:
+            cfg = config.params()
+        load.assert_not_called()
+        self.assertEqual(cfg["region"], "us-south")
+
+    def test_params_copy(self):
+        """Test cached configuration can't be altered by callers."""
+        config.params()["region"] = "eu-de"
+        self.assertEqual(config.params()["region"], "us-south")
+
+    def test_reload(self):
+        """Test reload picks up file changes."""
+        config.params()
+        self.write("eu-de")
+        self.assertEqual(config.params()["region"], "us-south")
+        self.assertEqual(config.reload()["region"], "eu-de")
+        self.assertEqual(config.params()["region"], "eu-de")
+
+    def test_watch(self):
+        """Test watcher reloads the configuration in the background."""
+        config.params()
+        config.watch(0.01)
+        self.write("eu-de")
+        for _ in range(100):
+            if config.params()["region"] == "eu-de":
+                break
+            time.sleep(0.01)
+        self.assertEqual(config.params()["region"], "eu-de")
+
+    def test_region(self):
+        """Test region is overridden within the block only."""
+        with config.region("eu-de"):
+            cfg = config.params()
+            self.assertEqual(cfg["region"], "eu-de")
+            self.assertEqual(cfg["is_url"], "eu-de.iaas.cloud.ibm.com")
+            self.assertEqual(cfg["pi_url"], "eu-de.power-iaas.cloud.ibm.com")
+        self.assertEqual(config.params()["region"], "us-south")
+
+    def test_params_environment_memoized(self):
+        """Test environment variables are read only once without file."""
+        os.remove(self.creds)
+        env = {"IC_VERSION": "2020-03-10", "IC_API_KEY": "my-key",
+               "IC_REGION": "us-south", "IC_GENERATION": "2"}
+        with patch.dict(os.environ, env):
+            config.params()
+            with patch("ibmcloud_python_sdk.config._load") as load, \
+                    patch("ibmcloud_python_sdk.config.path.isfile") as isfile:
+                cfg = config.params()
+            load.assert_not_called()
+            isfile.assert_not_called()
+            self.assertEqual(cfg["region"], "us-south")
+            os.environ["IC_REGION"] = "eu-de"
+            self.assertEqual(config.params()["region"], "us-south")
+            self.assertEqual(config.reload()["region"], "eu-de")
+            self.assertEqual(config.params()["region"], "eu-de")
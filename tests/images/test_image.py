@@ -67,7 +67,7 @@ class ImageTestCase(unittest.TestCase):
         self.assertEqual(response['name'], image.name)
 
     @patch('ibmcloud_python_sdk.vpc.image.qw', image.qw)
-    @patch.object(Image, 'get_images', image.return_exception)
+    @patch.object(Image, 'iter_images', image.return_exception)
     def test_get_image_by_name_error_by_exception(self):
         """Test get_image_by_name (by_name return exception)."""
         with self.assertRaises(Exception):
@@ -31,6 +31,19 @@ class InstanceTestCase(unittest.TestCase):
         with self.assertRaises(Exception):
             response = self.instance.get_instances()
 
+# iter_instances
+    @patch('ibmcloud_python_sdk.vpc.instance.qw', instance.qw)
+    def test_iter_instances(self):
+        """Test iter_instances."""
+        response = list(self.instance.iter_instances())
+        self.assertNotEqual(len(response), 0)
+
+    @patch('ibmcloud_python_sdk.vpc.instance.qw', instance.return_exception)
+    def test_iter_instances_error_by_exception(self):
+        """Test iter_instances (error by exception)."""
+        with self.assertRaises(Exception):
+            list(self.instance.iter_instances())
+
 # get_instance
     @patch('ibmcloud_python_sdk.vpc.instance.qw', instance.qw)
     def test_get_instance(self):
@@ -91,6 +104,19 @@ class InstanceTestCase(unittest.TestCase):
         with self.assertRaises(Exception):
             self.instance.get_instance_by_name(instance.name)
 
+    def test_get_instance_by_name_filter(self):
+        """Test get_instance_by_name (filter sent to the API)."""
+        paths = []
+
+        def qw(service, verb, path, headers):
+            paths.append(path)
+            return instance.qw(service, verb, path, headers)
+
+        with patch('ibmcloud_python_sdk.vpc.instance.qw', qw):
+            response = self.instance.get_instance_by_name(instance.name)
+        self.assertEqual(response["name"], instance.name)
+        self.assertIn("name={}".format(instance.name), paths[0])
+
 # get_instance_configuration
     @patch('ibmcloud_python_sdk.vpc.instance.qw', instance.qw)
     def test_get_instance_configuration(self):
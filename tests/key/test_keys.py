@@ -5,6 +5,7 @@ from mock import patch
 
 # import ibmcloud_python_sdk.config
 from ibmcloud_python_sdk.vpc.key import Key
+from ibmcloud_python_sdk.utils.resolver import names
 
 # import tests.Common as common
 
@@ -19,6 +20,8 @@ class KeyTestCase(unittest.TestCase):
                              key.authentication)
         self.patcher.start()
         self.key = Key()
+        # Every test fakes its own API state, don't reuse resolved names
+        names.clear()
 
     def tearDown(self):
         self.patcher.stop()
@@ -43,21 +46,21 @@ class KeyTestCase(unittest.TestCase):
         self.assertEqual(response['name'], key.name)
 
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.qw)
-    @patch.object(Key, 'get_keys', key.return_not_found)
+    @patch.object(Key, 'iter_keys', key.iter_return_not_found)
     def test_get_keys_error_name_not_found(self):
         """Test get_key (name not found)"""
         response = self.key.get_key(key.name)
         self.assertEqual(response['errors'][0]["code"], "not_found")
 
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.qw)
-    @patch.object(Key, 'get_keys', key.get_keys_return_error)
+    @patch.object(Key, 'iter_keys', key.iter_keys_return_error)
     def test_get_keys_error_unpredictable_A(self):
         """Test get_key (unpredictable error (name))"""
         response = self.key.get_key(key.name)
         self.assertEqual(response['errors'][0]["code"], "unpredictable_error")
 
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.qw)
-    # @patch.object(Key, 'get_keys', key.return_not_found)
+    # @patch.object(Key, 'iter_keys', key.iter_return_not_found)
     def test_get_keys_with_id(self):
         """Test get_key (by id))"""
         response = self.key.get_key(key.id)
@@ -65,7 +68,7 @@ class KeyTestCase(unittest.TestCase):
         self.assertEqual(response["id"], key.id)
 
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.qw)
-    @patch.object(Key, 'get_keys', key.return_not_found)
+    @patch.object(Key, 'iter_keys', key.iter_return_not_found)
     @patch.object(Key, 'get_key_by_id', key.return_error)
     def test_get_keys_error_by_id(self):
         """Test get_key (error by id)"""
@@ -73,7 +76,7 @@ class KeyTestCase(unittest.TestCase):
         self.assertEqual(response['errors'][0]["code"], "unpredictable_error")
 
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.qw)
-    @patch.object(Key, 'get_keys', key.return_exception)
+    @patch.object(Key, 'iter_keys', key.return_exception)
     def test_get_keys_error_by_exception(self):
         """Test get_key (error by exception)"""
         with self.assertRaises(Exception):
@@ -81,7 +84,7 @@ class KeyTestCase(unittest.TestCase):
 
 # get_key_by_id
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.return_exception)
-    # @patch.object(Key, 'get_keys', key.return_exception)
+    # @patch.object(Key, 'iter_keys', key.return_exception)
     def test_get_keys_error_by_exception(self):
         """Test get_key (error by exception)"""
         with self.assertRaises(Exception):
@@ -142,14 +145,14 @@ class KeyTestCase(unittest.TestCase):
         self.assertEqual(response, "Forbiden")
 
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.qw)
-    @patch.object(Key, 'get_keys', key.return_not_found)
+    @patch.object(Key, 'iter_keys', key.iter_return_not_found)
     def test_delete_key_error_by_key(self):
         """Test delete_key (error key_not_found)."""
         response = self.key.delete_key(key.name)
         self.assertEqual(response["errors"][0]["code"], "not_found")
 
     @patch('ibmcloud_python_sdk.vpc.key.qw', key.return_exception)
-    @patch.object(Key, 'get_keys', key.return_not_found)
+    @patch.object(Key, 'iter_keys', key.iter_return_not_found)
     def test_delete_key_error_by_exception(self):
         """Test delete_key (error by exception)."""
         with self.assertRaises(Exception):
@@ -0,0 +1,91 @@
+import unittest
+
+from mock import MagicMock, patch
+
+from ibmcloud_python_sdk.utils import breaker
+from ibmcloud_python_sdk.utils.breaker import CircuitBreaker
+from ibmcloud_python_sdk.utils.breaker import CircuitOpenError
+from ibmcloud_python_sdk.utils.pool import ConnectionPool
+from ibmcloud_python_sdk.utils.pool import HTTPSConnection
+
+
+@patch.object(breaker.time, "monotonic", return_value=100.0)
+class TestCircuitBreaker(unittest.TestCase):
+    """Test case for the circuit breaker."""
+
+    def setUp(self):
+        self.breaker = CircuitBreaker("power", threshold=3, reset_timeout=30)
+
+    def test_open(self, monotonic):
+        """Test circuit opens after consecutive failures."""
+        for _ in range(3):
+            self.breaker.allow()
+            self.breaker.failure()
+        self.assertEqual(self.breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.allow()
+
+    def test_success_resets(self, monotonic):
+        """Test a success resets the failure count."""
+        self.breaker.failure()
+        self.breaker.failure()
+        self.breaker.record(200)
+        self.breaker.failure()
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_half_open(self, monotonic):
+        """Test a single probe is let through after the reset timeout."""
+        for _ in range(3):
+            self.breaker.failure()
+        monotonic.return_value = 130.0
+        self.breaker.allow()
+        self.assertEqual(self.breaker.state, "half-open")
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.allow()
+        self.breaker.record(200)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_probe_failure(self, monotonic):
+        """Test a failed probe opens the circuit again."""
+        for _ in range(3):
+            self.breaker.failure()
+        monotonic.return_value = 130.0
+        self.breaker.allow()
+        self.breaker.record(503)
+        self.assertEqual(self.breaker.state, "open")
+        monotonic.return_value = 150.0
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.allow()
+
+
+class TestPoolBreaker(unittest.TestCase):
+    """Test case for the circuit breaker of the connection pool."""
+
+    def test_fail_fast(self):
+        """Test requests are refused once the endpoint keeps failing."""
+        pool = ConnectionPool("example.com",
+                              breaker=CircuitBreaker("example", 2, 30))
+        conn = MagicMock()
+        conn.request.side_effect = TimeoutError()
+        with patch.object(ConnectionPool, "new_connection",
+                          return_value=conn):
+            for _ in range(2):
+                with self.assertRaises(TimeoutError):
+                    pool.request("GET", "/v1/vpcs")
+            with self.assertRaises(CircuitOpenError):
+                pool.request("GET", "/v1/vpcs")
+        self.assertEqual(conn.request.call_count, 2)
+
+    def test_timeouts(self):
+        """Test connect and read timeouts are distinct."""
+        conn = ConnectionPool("example.com", timeout=60,
+                              connect_timeout=5).new_connection()
+        self.assertIsInstance(conn, HTTPSConnection)
+        self.assertEqual((conn.timeout, conn.read_timeout), (5, 60))
+
+    @patch.object(breaker, "config", {"breaker_threshold": 0})
+    def test_disabled(self):
+        """Test circuit breaker could be disabled."""
+        breaker.breakers.clear()
+        self.assertIsNone(breaker.breaker("power", "example.com"))
+        breaker.breakers.clear()
@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk.utils import bulk
+
+
+class Limited(object):
+    """Fake SDK method rate limited for its first calls"""
+
+    def __init__(self, limited):
+        self.limited = limited
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, item):
+        with self.lock:
+            self.calls += 1
+            if self.calls <= self.limited:
+                return {"errors": [{"code": "too_many_requests"}],
+                        "status_code": 429}
+        return {"id": item}
+
+
+class TestBulk(unittest.TestCase):
+    """Test case for the bulk executor."""
+
+    def test_ordered(self):
+        """Test results are returned in the order of the items."""
+        def get(item):
+            time.sleep(0.001 * (10 - item))
+            return {"id": item}
+
+        self.assertEqual(bulk.map(get, range(10), concurrency=4),
+                         [{"id": i} for i in range(10)])
+
+    def test_concurrency(self):
+        """Test no more calls than the concurrency run at once."""
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def get(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(item)
+
+        bulk.map(get, range(20), concurrency=3)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_exception(self):
+        """Test an exception is returned as an error."""
+        def get(item):
+            if item == 1:
+                raise ValueError("boom")
+            return {"id": item}
+
+        result = bulk.map(get, [0, 1, 2])
+        self.assertEqual(result[0], {"id": 0})
+        self.assertEqual(result[1]["errors"][0]["message"], "boom")
+        self.assertIsInstance(result[1]["exception"], ValueError)
+        self.assertEqual(result[2], {"id": 2})
+
+    def test_starmap(self):
+        """Test several arguments are passed to the function."""
+        self.assertEqual(bulk.starmap(lambda a, b: a + b, [(1, 2), (3, 4)]),
+                         [3, 7])
+
+    @patch.object(bulk.time, "sleep")
+    def test_rate_limited(self, sleep):
+        """Test rate limited calls are retried after a backoff."""
+        func = Limited(2)
+        result = bulk.map(func, ["a"], retries=3)
+        self.assertEqual(result, [{"id": "a"}])
+        self.assertEqual(func.calls, 3)
+        self.assertTrue(sleep.called)
+
+    @patch.object(bulk.time, "sleep")
+    def test_rate_limited_exhausted(self, sleep):
+        """Test the rate limit error is returned after the retries."""
+        result = bulk.map(Limited(10), ["a"], retries=1)
+        self.assertTrue(bulk.is_rate_limited(result[0]))
+
+    def test_empty(self):
+        """Test no call is done without items."""
+        self.assertEqual(bulk.map(lambda item: item, []), [])
+
+
+class TestThrottle(unittest.TestCase):
+    """Test case for the bulk throttle."""
+
+    def test_backoff(self):
+        """Test backoff grows and is reset by a success."""
+        throttle = bulk.Throttle(backoff=1, max_backoff=4)
+        for _ in range(5):
+            throttle.limited()
+        self.assertEqual(throttle.failures, 5)
+        self.assertLessEqual(throttle.paused_until - time.monotonic(), 4)
+        throttle.succeeded()
+        self.assertEqual(throttle.failures, 0)
+
+    @patch.object(bulk.time, "sleep")
+    def test_rate(self, sleep):
+        """Test calls are spread according to the rate."""
+        throttle = bulk.Throttle(rate=10)
+        throttle.wait()
+        throttle.wait()
+        self.assertAlmostEqual(sleep.call_args[0][0], 0.1, places=2)
@@ -0,0 +1,204 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk.utils import cache
+
+
+class TestCache(unittest.TestCase):
+    """Test case for the memcached client."""
+
+    def setUp(self):
+        cache.clients.clear()
+
+    def tearDown(self):
+        cache.clients.clear()
+
+    @patch.object(cache, "config", False)
+    def test_not_configured(self):
+        """Test no client is created without memcached configuration."""
+        self.assertFalse(cache.client())
+
+    @patch.object(cache, "config", {"memcached": ["127.0.0.1:1"]})
+    def test_client_shared(self):
+        """Test the same pooled client is returned."""
+        client = cache.client()
+        self.assertIsInstance(client, cache.base.PooledClient)
+        self.assertIs(cache.client(), client)
+
+    @patch.object(cache, "config", {"memcached": ["127.0.0.1:1",
+                                                  "127.0.0.1:2"]})
+    def test_client_hash(self):
+        """Test multiple nodes use a pooled hash client."""
+        client = cache.client()
+        self.assertIsInstance(client, cache.hash.HashClient)
+        self.assertTrue(client.use_pooling)
+
+    @patch.object(cache, "config", {"memcached": ["127.0.0.1:1"]})
+    def test_dead_node(self):
+        """Test a dead node is a cache miss."""
+        self.assertIsNone(cache.get_item("key"))
+        cache.set_item("key", "value")
+
+
+class TestBackends(unittest.TestCase):
+    """Test case for the cache backends."""
+
+    def setUp(self):
+        cache.clients.clear()
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        cache.clients.clear()
+        shutil.rmtree(self.folder)
+
+    @patch.object(cache, "config", {"cache_backend": "memory"})
+    def test_memory(self):
+        """Test memory backend is selected and stores items."""
+        self.assertIsInstance(cache.backend(), cache.MemoryBackend)
+        cache.set_item("key", b"value")
+        self.assertEqual(cache.get_item("key"), b"value")
+        cache.delete_item("key")
+        self.assertIsNone(cache.get_item("key"))
+
+    def test_memory_lru(self):
+        """Test least recently used item is evicted."""
+        backend = cache.MemoryBackend(maxsize=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+        backend.get("a")
+        backend.set("c", b"3", 60)
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("a"), b"1")
+
+    def test_memory_ttl(self):
+        """Test expired item is a cache miss."""
+        backend = cache.MemoryBackend()
+        backend.set("a", b"1", 0)
+        self.assertIsNone(backend.get("a"))
+
+    def test_disk(self):
+        """Test disk backend keeps items between processes."""
+        filename = os.path.join(self.folder, "cache.sqlite")
+        with patch.object(cache, "config", {"cache_backend": "disk",
+                                            "cache_file": filename}):
+            self.assertIsInstance(cache.backend(), cache.DiskBackend)
+            cache.set_item("key", b"value")
+        self.assertEqual(cache.DiskBackend(filename).get("key"), b"value")
+
+    def test_disk_ttl(self):
+        """Test expired item is a cache miss."""
+        backend = cache.DiskBackend(os.path.join(self.folder, "cache.db"))
+        backend.set("a", b"1", -1)
+        self.assertIsNone(backend.get("a"))
+
+    @patch.object(cache, "config", {})
+    def test_disabled(self):
+        """Test caching is disabled by default."""
+        self.assertFalse(cache.backend())
+
+    @patch.object(cache, "config", {"cache_backend": "unknown"})
+    def test_unknown(self):
+        """Test unknown backend raises an exception."""
+        with self.assertRaises(Exception):
+            cache.backend()
+
+
+class TestRules(unittest.TestCase):
+    """Test case for the cache TTL rules."""
+
+    config = {"cache_ttl": 60, "cache_rules": [
+        {"pattern": "/v1/instances", "ttl": 10},
+        {"pattern": "/v1/regions/eu-de", "ttl": 0},
+    ]}
+
+    def setUp(self):
+        cache.clients.clear()
+
+    def tearDown(self):
+        cache.clients.clear()
+
+    @patch.object(cache, "config", config)
+    def test_rule(self):
+        """Test TTL of the first matching rule is used."""
+        self.assertEqual(cache.get_ttl("/v1/instances?version=1"), 10)
+        self.assertEqual(cache.get_ttl("/v1/regions/eu-de"), 0)
+
+    @patch.object(cache, "config", config)
+    def test_default_rule(self):
+        """Test default rules apply after the configured ones."""
+        self.assertEqual(cache.get_ttl("/v1/instance/profiles"), 86400)
+        self.assertEqual(cache.get_ttl("/v1/regions"), 604800)
+        self.assertEqual(cache.get_ttl("/identity/token"), 0)
+
+    @patch.object(cache, "config", config)
+    def test_no_rule(self):
+        """Test cache_ttl is used when no rule matches."""
+        self.assertEqual(cache.get_ttl("/v1/vpcs"), 60)
+
+
+class Memcached(object):
+    """Fake memcached client storing items into a dict"""
+
+    def __init__(self):
+        self.items = {}
+
+    def get(self, key):
+        return self.items.get(key)
+
+    def get_many(self, keys):
+        return {key: self.items[key] for key in keys if key in self.items}
+
+    def set(self, key, value, expire=0):
+        self.items[key] = value
+
+    def set_many(self, values, expire=0):
+        self.items.update(values)
+        return []
+
+    def delete(self, key):
+        self.items.pop(key, None)
+
+
+class TestLargeItems(unittest.TestCase):
+    """Test case for the compression and chunking of large items."""
+
+    def setUp(self):
+        self.backend = cache.MemcachedBackend(chunk_size=10)
+        self.backend.client = Memcached()
+
+    @patch.object(cache, "config", {"cache_compress_threshold": 100})
+    def test_compress(self):
+        """Test large body is compressed."""
+        data = b'{"instances": []}' * 100
+        item = cache.pack(data, 60)
+        self.assertLess(len(item), len(data))
+        self.assertEqual(cache.unpack(item)["data"], data)
+
+    @patch.object(cache, "config", {"cache_compress_threshold": 100})
+    def test_no_compress(self):
+        """Test small body is not compressed."""
+        item = cache.pack(b"{}", 60)
+        self.assertTrue(item.endswith(b"{}"))
+        self.assertEqual(cache.unpack(item)["data"], b"{}")
+
+    def test_chunks(self):
+        """Test large item is split into chunks."""
+        self.backend.set("key", b"0123456789" * 3 + b"0", 60)
+        self.assertEqual(len(self.backend.client.items), 5)
+        self.assertEqual(self.backend.get("key"), b"0123456789" * 3 + b"0")
+
+    def test_chunk_missing(self):
+        """Test item with a missing chunk is a cache miss."""
+        self.backend.set("key", b"0123456789" * 3, 60)
+        chunk = [k for k in self.backend.client.items if k != "key"][0]
+        del self.backend.client.items[chunk]
+        self.assertIsNone(self.backend.get("key"))
+
+    def test_no_chunks(self):
+        """Test small item is stored as is."""
+        self.backend.set("key", b"01234", 60)
+        self.assertEqual(self.backend.client.items, {"key": b"01234"})
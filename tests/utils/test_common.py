@@ -0,0 +1,343 @@
+import json
+import threading
+import time
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils.common import (
+    _collection,
+    is_id,
+    path_template,
+    query_all,
+    query_items,
+    query_pages,
+    query_wrapper,
+    resolve,
+    set_query,
+)
+
+
+class Paginated(object):
+    """Fake query_wrapper() serving a collection split into pages"""
+
+    href = "https://us-south.iaas.cloud.ibm.com/v1/instances?start={}"
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.paths = []
+
+    def __call__(self, service, verb, path, headers):
+        self.paths.append(path)
+        index = int(dict(
+            p.split("=") for p in path.split("?")[1].split("&")
+        ).get("start", 0))
+        data = {"instances": self.pages[index]}
+        if index + 1 < len(self.pages):
+            data["next"] = {"href": self.href.format(index + 1)}
+        return {"data": data}
+
+
+class PaginationTestCase(unittest.TestCase):
+    """Test case for the pagination helpers."""
+
+    def setUp(self):
+        self.query = Paginated([[{"id": 1}, {"id": 2}], [{"id": 3}]])
+        self.path = "/v1/instances?version=2020-03-10&generation=2"
+
+    def test_set_query(self):
+        """Test query string parameters are added or replaced."""
+        self.assertEqual(set_query("/v1/vpcs?start=a&limit=1", start="b"),
+                         "/v1/vpcs?limit=1&start=b")
+
+    def test_query_pages(self):
+        """Test next token is followed with the maximum page size."""
+        pages = list(query_pages("iaas", self.path, query=self.query))
+        self.assertEqual(len(pages), 2)
+        self.assertIn("limit=100", self.query.paths[0])
+        self.assertIn("start=1", self.query.paths[1])
+
+    def test_query_items(self):
+        """Test resources are yielded from every page."""
+        items = query_items("iaas", self.path, None, "instances",
+                            query=self.query)
+        self.assertEqual([i["id"] for i in items], [1, 2, 3])
+
+    def test_query_items_stop_early(self):
+        """Test next page is not requested when iteration stops."""
+        items = query_items("iaas", self.path, None, "instances",
+                            query=self.query)
+        next(items)
+        self.assertEqual(len(self.query.paths), 1)
+
+    def test_query_all(self):
+        """Test pages are merged into a single page."""
+        data = query_all("iaas", self.path, None, "instances",
+                         query=self.query)
+        self.assertEqual(len(data["instances"]), 3)
+        self.assertNotIn("next", data)
+
+    def test_query_all_error(self):
+        """Test API error is returned as is."""
+        def error(service, verb, path, headers):
+            return {"data": {"errors": [{"code": "not_found"}]}}
+        data = query_all("iaas", self.path, None, "instances", query=error)
+        self.assertEqual(data["errors"][0]["code"], "not_found")
+
+    def test_query_pages_same_token(self):
+        """Test pagination stops when the same token is handed back."""
+        def loop(service, verb, path, headers):
+            return {"data": {"resources": [], "next_url": "/v2/r?start=a"}}
+        pages = list(query_pages("rg", "/v2/r", query=loop))
+        self.assertEqual(len(pages), 2)
+
+
+class Lookup(object):
+    """Fake lookup function recording the values it is called with"""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, value):
+        self.calls.append(value)
+        return self.result
+
+
+class TestResolve(unittest.TestCase):
+    """Test case for name/ID resolution helpers."""
+
+    found = {"id": "found"}
+    not_found = {"errors": [{"code": "not_found"}]}
+    vpc_id = "r006-8c8a2c3a-7e2c-4bd4-9c5c-4d5e6f7a8b9c"
+
+    def test_is_id(self):
+        """Test identifiers are recognized."""
+        self.assertTrue(is_id(self.vpc_id))
+        self.assertTrue(is_id("8c8a2c3a-7e2c-4bd4-9c5c-4d5e6f7a8b9c"))
+        self.assertTrue(is_id("0123456789abcdef0123456789abcdef"))
+        self.assertTrue(is_id("crn:v1:bluemix:public:is:us-south"))
+        self.assertTrue(is_id(123456))
+
+    def test_is_not_id(self):
+        """Test names are not recognized as identifiers."""
+        self.assertFalse(is_id("my-vpc"))
+        self.assertFalse(is_id("10.0.0.0/24"))
+
+    def test_resolve_id_first(self):
+        """Test lookup by name is skipped for an identifier."""
+        by_id, by_name = Lookup(self.found), Lookup(self.not_found)
+        self.assertEqual(resolve(self.vpc_id, by_id, by_name), self.found)
+        self.assertEqual(by_name.calls, [])
+
+    def test_resolve_name_first(self):
+        """Test lookup by ID is skipped for a name."""
+        by_id, by_name = Lookup(self.not_found), Lookup(self.found)
+        self.assertEqual(resolve("my-vpc", by_id, by_name), self.found)
+        self.assertEqual(by_id.calls, [])
+
+    def test_resolve_fallback(self):
+        """Test fallback lookups are used when nothing is found."""
+        by_id, by_name = Lookup(self.not_found), Lookup(self.not_found)
+        fallback = Lookup(self.found)
+        self.assertEqual(resolve("10.0.0.0/24", by_id, by_name, fallback),
+                         self.found)
+        self.assertEqual(len(by_id.calls) + len(by_name.calls), 2)
+
+    def test_resolve_error(self):
+        """Test errors other than not found are returned as is."""
+        error = {"errors": [{"code": "forbidden"}]}
+        by_id, by_name = Lookup(self.found), Lookup(error)
+        self.assertEqual(resolve("my-vpc", by_id, by_name), error)
+        self.assertEqual(by_id.calls, [])
+
+
+class Response(object):
+    """Fake HTTP response"""
+
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class Endpoint(object):
+    """Fake connection pool recording the requests sent to the API"""
+
+    def __init__(self):
+        self.requests = []
+        self.status = 200
+        self.etag = None
+
+    def request(self, method, path, payload=None, headers=None):
+        self.requests.append((method, path))
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            return Response(304, {"ETag": self.etag}), b""
+        data = json.dumps({"path": path, "count": len(self.requests)})
+        return Response(self.status, {"ETag": self.etag}), data.encode()
+
+
+class TestQueryWrapperCache(unittest.TestCase):
+    """Test case for the caching done by query_wrapper()."""
+
+    headers = {"Authorization": "Bearer token"}
+
+    def setUp(self):
+        cache.clients.clear()
+        common.accounts["Bearer token"] = "account"
+        self.endpoint = Endpoint()
+        self.patchers = [
+            patch.object(cache, "config", {"cache_backend": "memory",
+                                           "cache_ttl": 60}),
+            patch("ibmcloud_python_sdk.utils.pool.get_pool",
+                  lambda *args: self.endpoint),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        cache.clients.clear()
+
+    def get(self, path):
+        return query_wrapper("iaas", "GET", path, self.headers)["data"]
+
+    def test_cached(self):
+        """Test second GET is served from cache."""
+        self.get("/v1/vpcs")
+        self.assertEqual(self.get("/v1/vpcs")["count"], 1)
+        self.assertEqual(len(self.endpoint.requests), 1)
+
+    def test_not_cached_ttl(self):
+        """Test path with a TTL of 0 is not cached."""
+        self.get("/identity/keys")
+        self.get("/identity/keys")
+        self.assertEqual(len(self.endpoint.requests), 2)
+
+    def test_invalidate(self):
+        """Test DELETE invalidates the item and the collection lists."""
+        item = "/v1/instances/r006-8c8a2c3a-7e2c-4bd4-9c5c-4d5e6f7a8b9c"
+        self.get("/v1/instances?version=2021-06-15")
+        self.get(item)
+        self.get("/v1/vpcs")
+        query_wrapper("iaas", "DELETE", item, self.headers)
+        self.get("/v1/instances?version=2021-06-15")
+        self.get(item)
+        self.get("/v1/vpcs")
+        self.assertEqual([r[1] for r in self.endpoint.requests].count(item),
+                         3)
+        self.assertEqual(len(self.endpoint.requests), 6)
+
+    def test_stale_while_revalidate(self):
+        """Test stale item is served while refreshed in background."""
+        cache.config["cache_stale_ttl"] = 60
+        self.get("/v1/vpcs")
+        with patch.object(cache, "is_fresh",
+                          lambda entry, grace=0: grace > 0):
+            self.assertEqual(self.get("/v1/vpcs")["count"], 1)
+        for _ in range(100):
+            if not common.flights.calls:
+                break
+            time.sleep(0.01)
+        self.assertEqual(len(self.endpoint.requests), 2)
+        self.assertEqual(self.get("/v1/vpcs")["count"], 2)
+
+    def test_etag(self):
+        """Test expired item is revalidated with its ETag."""
+        self.endpoint.etag = '"abc"'
+        self.get("/v1/vpcs")
+        with patch.object(cache, "is_fresh", lambda entry, grace=0: False):
+            data = self.get("/v1/vpcs")
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(len(self.endpoint.requests), 2)
+        # Revalidated item is fresh again
+        self.assertEqual(self.get("/v1/vpcs")["count"], 1)
+        self.assertEqual(len(self.endpoint.requests), 2)
+
+    def test_etag_modified(self):
+        """Test expired item is replaced when it has changed."""
+        self.endpoint.etag = '"abc"'
+        self.get("/v1/vpcs")
+        self.endpoint.etag = '"def"'
+        with patch.object(cache, "is_fresh", lambda entry, grace=0: False):
+            data = self.get("/v1/vpcs")
+        self.assertEqual(data["count"], 2)
+
+    def test_coalesce(self):
+        """Test identical concurrent GET requests are sent once."""
+        def slow(method, path, payload=None, headers=None):
+            time.sleep(0.05)
+            return Endpoint.request(self.endpoint, method, path)
+        self.endpoint.request = slow
+        threads = [threading.Thread(target=self.get, args=("/v1/vpcs",))
+                   for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.endpoint.requests), 1)
+
+    def test_coalesce_per_caller(self):
+        """Test concurrent GET requests of other callers are not shared."""
+        def slow(method, path, payload=None, headers=None):
+            time.sleep(0.05)
+            return Endpoint.request(self.endpoint, method, path)
+        self.endpoint.request = slow
+        common.accounts["Bearer other"] = "account"
+        other = {"Authorization": "Bearer other"}
+        threads = [threading.Thread(target=self.get, args=("/v1/vpcs",)),
+                   threading.Thread(target=query_wrapper, args=(
+                       "iaas", "GET", "/v1/vpcs", other))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.endpoint.requests), 2)
+
+    def test_not_cached_error(self):
+        """Test error responses are not cached."""
+        self.endpoint.status = 404
+        self.get("/v1/vpcs")
+        self.get("/v1/vpcs")
+        self.assertEqual(len(self.endpoint.requests), 2)
+
+
+class TestCollection(unittest.TestCase):
+    """Test case for the collection of a path."""
+
+    def test_collection(self):
+        """Test collection ends before the first identifier."""
+        self.assertEqual(_collection("/v1/instances?limit=10"),
+                         "/v1/instances")
+        self.assertEqual(
+            _collection("/v1/instances/r006-8c8a2c3a-7e2c-4bd4-9c5c-"
+                        "4d5e6f7a8b9c/volume_attachments"),
+            "/v1/instances")
+        self.assertEqual(_collection("/v1/instance/profiles"),
+                         "/v1/instance/profiles")
+
+    def test_path_template(self):
+        """Test identifiers and query string are removed."""
+        self.assertEqual(
+            path_template("/v1/instances/r006-8c8a2c3a-7e2c-4bd4-9c5c-"
+                          "4d5e6f7a8b9c/volume_attachments?version=1"),
+            "/v1/instances/{id}/volume_attachments")
+
+
+class TestQueryWrapperNoCache(unittest.TestCase):
+    """Test case for query_wrapper() without cache backend."""
+
+    def test_opaque_token(self):
+        """Test GET with a token which isn't a JWT is sent."""
+        endpoint = Endpoint()
+        with patch.object(cache, "config", {}), \
+                patch("ibmcloud_python_sdk.utils.pool.get_pool",
+                      lambda *args: endpoint):
+            data = query_wrapper("iaas", "GET", "/v1/vpcs",
+                                 {"Authorization": "Bearer not-a-jwt"})
+        self.assertEqual(data["data"]["count"], 1)
@@ -0,0 +1,154 @@
+import json
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import metrics
+
+
+class Response(object):
+    """Fake HTTP response"""
+
+    def __init__(self, status):
+        self.status = status
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class Endpoint(object):
+    """Fake connection pool answering every request"""
+
+    def __init__(self, status=200):
+        self.status = status
+
+    def request(self, method, path, payload=None, headers=None):
+        return Response(self.status), json.dumps({"path": path}).encode()
+
+
+class TestHooks(unittest.TestCase):
+    """Test case for the query_wrapper() hooks."""
+
+    headers = {"Authorization": "Bearer token"}
+    item = "/v1/instances/r006-8c8a2c3a-7e2c-4bd4-9c5c-4d5e6f7a8b9c"
+
+    def setUp(self):
+        cache.clients.clear()
+        common.accounts["Bearer token"] = "account"
+        metrics.collector.reset()
+        self.events = []
+        for event in metrics.hooks:
+            metrics.register(event, self.record(event))
+        self.patchers = [
+            patch.object(cache, "config", {"cache_backend": "memory",
+                                           "cache_ttl": 60}),
+            patch("ibmcloud_python_sdk.utils.pool.get_pool",
+                  lambda *args: Endpoint()),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        for event, hooks in metrics.hooks.items():
+            for hook in list(hooks):
+                if getattr(hook, "test", False):
+                    metrics.unregister(event, hook)
+        cache.clients.clear()
+        metrics.collector.reset()
+
+    def record(self, event):
+        def hook(info):
+            self.events.append((event, dict(info)))
+        hook.test = True
+        return hook
+
+    def test_events(self):
+        """Test hooks are called for requests and cache hits."""
+        common.query_wrapper("iaas", "GET", self.item, self.headers)
+        common.query_wrapper("iaas", "GET", self.item, self.headers)
+        self.assertEqual([event for event, _ in self.events],
+                         ["on_cache_miss", "before_request", "after_response",
+                          "on_cache_hit"])
+        info = self.events[2][1]
+        self.assertEqual(info["template"], "/v1/instances/{id}")
+        self.assertEqual(info["status"], 200)
+        self.assertGreater(info["bytes_received"], 0)
+
+    def test_retried_attempts(self):
+        """Test hooks are called for every retried attempt."""
+        statuses = [503, 503, 200]
+
+        def request(method, path, payload=None, headers=None):
+            return Response(statuses.pop(0)), b"{}"
+        endpoint = Endpoint()
+        endpoint.request = request
+        with patch("ibmcloud_python_sdk.utils.pool.get_pool",
+                   lambda *args: endpoint), \
+                patch("ibmcloud_python_sdk.utils.retry.time.sleep"):
+            common.query_wrapper("iaas", "PUT", self.item, self.headers,
+                                 "{}")
+        responses = [info for event, info in self.events
+                     if event == "after_response"]
+        self.assertEqual([info["status"] for info in responses],
+                         [503, 503, 200])
+        self.assertEqual([info["attempt"] for info in responses], [1, 2, 3])
+        self.assertEqual(len([event for event, _ in self.events
+                              if event == "before_request"]), 3)
+
+    def test_failing_hook(self):
+        """Test a failing hook doesn't fail the request."""
+        def hook(info):
+            raise ValueError("boom")
+        hook.test = True
+        metrics.register("before_request", hook)
+        data = common.query_wrapper("iaas", "POST", "/v1/vpcs", self.headers,
+                                    "{}")["data"]
+        self.assertEqual(data, {"path": "/v1/vpcs"})
+
+    def test_unknown_event(self):
+        """Test unknown event is refused."""
+        with self.assertRaises(Exception):
+            metrics.register("on_error", print)
+
+
+class TestMetrics(unittest.TestCase):
+    """Test case for the built-in metrics collector."""
+
+    def setUp(self):
+        self.metrics = metrics.Metrics(buckets=[0.1, 1])
+        info = {"conn_type": "iaas", "method": "GET",
+                "template": "/v1/vpcs", "bytes_sent": 0,
+                "bytes_received": 100}
+        self.metrics.after_response(dict(info, status=200, elapsed=0.05))
+        self.metrics.after_response(dict(info, status=None, elapsed=2))
+        self.metrics.on_cache_hit({"conn_type": "iaas",
+                                   "template": "/v1/vpcs", "state": "fresh"})
+        self.metrics.on_cache_miss({"conn_type": "iaas",
+                                    "template": "/v1/vpcs"})
+
+    def test_render(self):
+        """Test metrics are exported in Prometheus text format."""
+        text = self.metrics.render()
+        labels = 'service="iaas",method="GET",path="/v1/vpcs"'
+        self.assertIn("ibmcloud_sdk_requests_total{%s,status=\"200\"} 1"
+                      % labels, text)
+        self.assertIn("ibmcloud_sdk_requests_total{%s,status=\"error\"} 1"
+                      % labels, text)
+        self.assertIn("ibmcloud_sdk_request_duration_seconds_bucket"
+                      "{%s,le=\"0.1\"} 1" % labels, text)
+        self.assertIn("ibmcloud_sdk_request_duration_seconds_bucket"
+                      "{%s,le=\"+Inf\"} 2" % labels, text)
+        self.assertIn("ibmcloud_sdk_request_duration_seconds_count{%s} 2"
+                      % labels, text)
+        self.assertIn('ibmcloud_sdk_response_bytes_total{service="iaas"} 200',
+                      text)
+
+    def test_hit_ratio(self):
+        """Test cache hit ratio."""
+        self.assertEqual(self.metrics.hit_ratio(), 0.5)
+        self.metrics.reset()
+        self.assertIsNone(self.metrics.hit_ratio())
@@ -0,0 +1,179 @@
+import gzip
+import http.client
+import io
+import socket
+import unittest
+import zlib
+
+from mock import MagicMock, patch
+
+from ibmcloud_python_sdk.utils.pool import ConnectionPool
+from ibmcloud_python_sdk.utils.pool import read
+
+
+# Sockets of the fake connections, closed once the tests are done
+sockets = []
+
+
+def tearDownModule():
+    while sockets:
+        sockets.pop().close()
+
+
+def fake_connection(will_close=False, body=b'{"status": "ok"}'):
+    """Build a fake HTTPS connection returning a single response
+
+    The connection has a real socket whose remote side is kept as
+    `conn.peer`, closing it simulates the server closing the connection.
+    """
+    res = MagicMock()
+    res.will_close = will_close
+    res.read.return_value = body
+    conn = MagicMock()
+    conn.getresponse.return_value = res
+    conn.sock, conn.peer = socket.socketpair()
+    sockets.extend([conn.sock, conn.peer])
+    return conn
+
+
+class ConnectionPoolTestCase(unittest.TestCase):
+    """Test case for the connection pool."""
+
+    def setUp(self):
+        self.pool = ConnectionPool("example.com", maxsize=1, idle_timeout=30)
+
+    def test_connection_is_reused(self):
+        """Test keep-alive connection is given back and reused."""
+        conn = fake_connection()
+        with patch.object(ConnectionPool, 'new_connection',
+                          return_value=conn) as new:
+            self.pool.request("GET", "/v1/vpcs")
+            self.pool.request("GET", "/v1/vpcs")
+        self.assertEqual(new.call_count, 1)
+        self.assertEqual(conn.request.call_count, 2)
+
+    def test_connection_closed_by_server(self):
+        """Test connection is not kept when server closes it."""
+        conn = fake_connection(will_close=True)
+        with patch.object(ConnectionPool, 'new_connection',
+                          return_value=conn):
+            self.pool.request("GET", "/v1/vpcs")
+        self.assertEqual(len(self.pool.idle), 0)
+        conn.close.assert_called_once()
+
+    def test_pool_maxsize(self):
+        """Test extra connections are closed when the pool is full."""
+        first, second = fake_connection(), fake_connection()
+        self.pool.put_connection(first)
+        self.pool.put_connection(second)
+        self.assertEqual(len(self.pool.idle), 1)
+        second.close.assert_called_once()
+
+    def test_idle_timeout(self):
+        """Test expired idle connections are discarded."""
+        self.pool.idle_timeout = 0
+        stale = fake_connection()
+        self.pool.put_connection(stale)
+        conn, reused = self.pool.get_connection()
+        self.assertFalse(reused)
+        stale.close.assert_called_once()
+
+    def test_stale_connection_reconnect(self):
+        """Test request is replayed once on a stale reused connection."""
+        stale = fake_connection()
+        stale.request.side_effect = http.client.RemoteDisconnected()
+        fresh = fake_connection()
+        self.pool.put_connection(stale)
+        with patch.object(ConnectionPool, 'new_connection',
+                          return_value=fresh):
+            res, data = self.pool.request("GET", "/v1/vpcs")
+        self.assertEqual(data, b'{"status": "ok"}')
+        stale.close.assert_called_once()
+
+    def test_dropped_connection_discarded(self):
+        """Test idle connection closed by the server is not reused."""
+        dropped = fake_connection()
+        dropped.peer.close()
+        fresh = fake_connection()
+        self.pool.put_connection(dropped)
+        with patch.object(ConnectionPool, 'new_connection',
+                          return_value=fresh):
+            res, data = self.pool.request("POST", "/v1/vpcs", "{}")
+        self.assertEqual(data, b'{"status": "ok"}')
+        dropped.request.assert_not_called()
+        dropped.close.assert_called_once()
+        fresh.request.assert_called_once()
+
+    def test_stale_post_not_replayed(self):
+        """Test POST already written is not replayed on a stale connection."""
+        stale = fake_connection()
+        stale.getresponse.side_effect = http.client.RemoteDisconnected()
+        self.pool.put_connection(stale)
+        with patch.object(ConnectionPool, 'new_connection') as new:
+            with self.assertRaises(http.client.RemoteDisconnected):
+                self.pool.request("POST", "/v1/vpcs", "{}")
+        new.assert_not_called()
+
+    def test_stale_post_not_written_replayed(self):
+        """Test POST which couldn't be written is sent on a new connection."""
+        stale = fake_connection()
+        stale.request.side_effect = BrokenPipeError()
+        fresh = fake_connection()
+        self.pool.put_connection(stale)
+        with patch.object(ConnectionPool, 'new_connection',
+                          return_value=fresh):
+            res, data = self.pool.request("POST", "/v1/vpcs", "{}")
+        self.assertEqual(data, b'{"status": "ok"}')
+        fresh.request.assert_called_once()
+
+    def test_stale_new_connection_raises(self):
+        """Test error is raised when a fresh connection fails."""
+        conn = fake_connection()
+        conn.request.side_effect = ConnectionResetError()
+        with patch.object(ConnectionPool, 'new_connection',
+                          return_value=conn):
+            with self.assertRaises(ConnectionResetError):
+                self.pool.request("GET", "/v1/vpcs")
+
+
+class Response(io.BytesIO):
+    """Fake HTTP response with a body read in chunks"""
+
+    def __init__(self, body, encoding=None):
+        super().__init__(body)
+        self.encoding = encoding
+
+    def getheader(self, name, default=None):
+        if name == "Content-Encoding":
+            return self.encoding
+        return default
+
+
+class ReadTestCase(unittest.TestCase):
+    """Test case for the response decompression."""
+
+    body = b'{"images": []}' * 10000
+
+    def test_gzip(self):
+        """Test gzip body is decompressed."""
+        self.assertEqual(read(Response(gzip.compress(self.body), "gzip")),
+                         self.body)
+
+    def test_deflate(self):
+        """Test deflate body is decompressed."""
+        self.assertEqual(read(Response(zlib.compress(self.body),
+                                       "deflate")), self.body)
+
+    def test_identity(self):
+        """Test plain body is returned as is."""
+        self.assertEqual(read(Response(self.body)), self.body)
+
+    def test_accept_encoding(self):
+        """Test compressed responses are accepted."""
+        conn = fake_connection()
+        pool = ConnectionPool("example.com")
+        with patch.object(ConnectionPool, 'new_connection',
+                          return_value=conn):
+            pool.request("GET", "/v1/images", headers={"Accept": "*/*"})
+        headers = conn.request.call_args[0][3]
+        self.assertEqual(headers["Accept-Encoding"], "gzip, deflate")
@@ -0,0 +1,129 @@
+import unittest
+
+from mock import MagicMock, patch
+
+from ibmcloud_python_sdk.utils import pool
+from ibmcloud_python_sdk.utils import ratelimit
+
+
+class Memcached(object):
+    """Fake memcached client supporting counters"""
+
+    def __init__(self):
+        self.items = {}
+
+    def add(self, key, value, expire=0, noreply=None):
+        self.items.setdefault(key, int(value))
+        return True
+
+    def incr(self, key, value, noreply=False):
+        if key not in self.items:
+            return None
+        self.items[key] += value
+        return self.items[key]
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test case for the token bucket rate limiter."""
+
+    @patch.object(ratelimit.time, "monotonic", return_value=100.0)
+    def test_burst(self, monotonic):
+        """Test burst is allowed then callers wait for a refill."""
+        bucket = ratelimit.TokenBucket(rate=2, burst=3)
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        monotonic.return_value = 100.5
+        self.assertEqual(bucket.reserve(), 0)
+
+    @patch.object(ratelimit.time, "sleep")
+    def test_acquire(self, sleep):
+        """Test acquire waits until a token is available."""
+        bucket = ratelimit.TokenBucket(rate=1000, burst=1)
+        bucket.acquire()
+        bucket.acquire()
+        self.assertTrue(sleep.called)
+
+
+class TestSharedBucket(unittest.TestCase):
+    """Test case for the rate limiter shared through memcached."""
+
+    def setUp(self):
+        self.client = Memcached()
+        self.patcher = patch.object(ratelimit.cache, "client",
+                                    lambda: self.client)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    @patch.object(ratelimit.time, "time", return_value=100.25)
+    def test_window(self, now):
+        """Test requests beyond the rate wait for the next second."""
+        bucket = ratelimit.SharedBucket("iaas", rate=2)
+        self.assertEqual([bucket.reserve(), bucket.reserve()], [0, 0])
+        self.assertAlmostEqual(bucket.reserve(), 0.75)
+        now.return_value = 101.0
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_memcached_down(self):
+        """Test local bucket is used when memcached fails."""
+        self.client = None
+        bucket = ratelimit.SharedBucket("iaas", rate=1)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertGreater(bucket.reserve(), 0)
+
+    def test_memcached_down_cooldown(self):
+        """Test memcached is not queried again during the cool-down."""
+        bucket = ratelimit.SharedBucket("iaas", rate=100, cooldown=60)
+        client = MagicMock()
+        client.incr.side_effect = OSError("down")
+        self.client = client
+        with patch("builtins.print") as output:
+            bucket.reserve()
+            bucket.reserve()
+        self.assertEqual(client.incr.call_count, 1)
+        self.assertEqual(output.call_count, 1)
+        bucket.failed -= 60
+        self.client = Memcached()
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertIsNone(bucket.failed)
+
+    @patch.object(ratelimit.cache, "config", {
+        "memcached": ["127.0.0.1:1", "127.0.0.1:2"],
+        "memcached_connect_timeout": 0.1, "memcached_timeout": 0.1})
+    def test_memcached_nodes_down(self):
+        """Test local bucket is used when every memcached node is down."""
+        self.client = ratelimit.cache._new_client()
+        bucket = ratelimit.SharedBucket("iaas", rate=2)
+        with patch("builtins.print"):
+            delays = [bucket.reserve() for _ in range(3)]
+        self.assertEqual(delays[:2], [0, 0])
+        self.assertGreater(delays[2], 0)
+        self.assertIsNotNone(bucket.failed)
+
+
+class TestLimiter(unittest.TestCase):
+    """Test case for the rate limiter configuration."""
+
+    def setUp(self):
+        ratelimit.limiters.clear()
+        pool.close_all()
+
+    def tearDown(self):
+        ratelimit.limiters.clear()
+        pool.close_all()
+
+    @patch.object(ratelimit, "config", {"rate_limits": {"iaas": 5}})
+    def test_configured(self):
+        """Test limiter is created only for configured endpoints."""
+        limiter = ratelimit.limiter("iaas", "us-south.iaas.cloud.ibm.com")
+        self.assertIsInstance(limiter, ratelimit.TokenBucket)
+        self.assertIs(ratelimit.limiter("iaas", "us-south.iaas.cloud.ibm.com"),
+                      limiter)
+        self.assertIsNone(ratelimit.limiter("rg", "rg.cloud.ibm.com"))
+
+    @patch.object(ratelimit, "config", {"rate_limits": {"iaas": 5}})
+    def test_pool(self):
+        """Test connection pool uses the limiter of its endpoint."""
+        conn = pool.get_pool("iaas", "us-south.iaas.cloud.ibm.com")
+        self.assertEqual(conn.limiter.rate, 5)
@@ -0,0 +1,50 @@
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.utils import regions
+
+
+def get_vpcs():
+    """Fake SDK method returning the VPCs of the current region"""
+    cfg = params()
+    if cfg["region"] == "jp-tok":
+        return {"errors": [{"code": "forbidden"}]}
+    return {"vpcs": [{"name": "vpc", "host": cfg["is_url"]}]}
+
+
+class TestMultiRegion(unittest.TestCase):
+    """Test case for the multi-region client."""
+
+    def test_call(self):
+        """Test the call is done against every regional endpoint."""
+        result = regions.MultiRegion(["us-south", "eu-de"]).call(get_vpcs)
+        self.assertEqual(list(result), ["us-south", "eu-de"])
+        self.assertEqual(result["eu-de"]["vpcs"][0]["host"],
+                         "eu-de.iaas.cloud.ibm.com")
+
+    def test_merge(self):
+        """Test collections are merged and tagged with their region."""
+        result = regions.MultiRegion(["us-south", "eu-de", "jp-tok"]).merge(
+            get_vpcs, "vpcs")
+        self.assertEqual([vpc["region"] for vpc in result["vpcs"]],
+                         ["us-south", "eu-de"])
+        self.assertEqual(list(result["failed_regions"]), ["jp-tok"])
+
+    @patch("ibmcloud_python_sdk.vpc.geo.Geo.get_regions")
+    def test_discover(self, get_regions):
+        """Test available regions are discovered."""
+        get_regions.return_value = {"regions": [
+            {"name": "us-south", "status": "available"},
+            {"name": "br-sao", "status": "unavailable"},
+            {"name": "eu-gb", "status": "available"},
+        ]}
+        result = regions.MultiRegion().call(get_vpcs)
+        self.assertEqual(list(result), ["us-south", "eu-gb"])
+
+    @patch("ibmcloud_python_sdk.vpc.geo.Geo.get_regions")
+    def test_discover_error(self, get_regions):
+        """Test discovery error is returned."""
+        get_regions.return_value = {"errors": [{"code": "forbidden"}]}
+        self.assertIn("errors", regions.MultiRegion().merge(get_vpcs, "vpcs"))
@@ -0,0 +1,135 @@
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk.config import region
+from ibmcloud_python_sdk.utils.common import resolve
+from ibmcloud_python_sdk.utils.resolver import NameCache
+from ibmcloud_python_sdk.utils.resolver import invalidate
+from ibmcloud_python_sdk.utils.resolver import names
+
+
+class Thing(object):
+    """Fake resource class counting the lookups done against the API"""
+
+    cfg = {"key": "secret", "region": "us-south"}
+    things = {"r006-8c8a2c3a-7e2c-4bd4-9c5c-4d5e6f7a8b9c": "my-thing"}
+
+    def __init__(self):
+        self.by_id = 0
+        self.by_name = 0
+
+    def get_thing_by_id(self, id):
+        self.by_id += 1
+        if id in self.things:
+            return {"id": id, "name": self.things[id]}
+        return {"errors": [{"code": "not_found"}]}
+
+    def get_thing_by_name(self, name):
+        self.by_name += 1
+        for id, thing in self.things.items():
+            if thing == name:
+                return {"id": id, "name": thing}
+        return {"errors": [{"code": "not_found"}]}
+
+    def get_thing(self, thing):
+        return resolve(thing, self.get_thing_by_id, self.get_thing_by_name)
+
+    @invalidate
+    def delete_thing(self, thing):
+        self.things = {}
+
+
+class TestNameCache(unittest.TestCase):
+    """Test case for the name resolution cache."""
+
+    def test_lru(self):
+        """Test least recently used entry is evicted."""
+        cache = NameCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+    @patch("ibmcloud_python_sdk.utils.resolver.time.monotonic")
+    def test_ttl(self, monotonic):
+        """Test entry expires after TTL."""
+        cache = NameCache(maxsize=2, ttl=60)
+        monotonic.return_value = 0
+        cache.set("a", 1)
+        monotonic.return_value = 61
+        self.assertIsNone(cache.get("a"))
+
+    def test_disabled(self):
+        """Test nothing is stored when TTL is zero."""
+        cache = NameCache(maxsize=2, ttl=0)
+        cache.set("a", 1)
+        self.assertIsNone(cache.get("a"))
+
+
+class TestResolveCache(unittest.TestCase):
+    """Test case for resolve() backed by the name resolution cache."""
+
+    def setUp(self):
+        names.clear()
+        self.thing = Thing()
+
+    def tearDown(self):
+        names.clear()
+
+    def test_second_lookup_by_id(self):
+        """Test name is resolved only once."""
+        self.thing.get_thing("my-thing")
+        data = self.thing.get_thing("my-thing")
+        self.assertEqual(data["name"], "my-thing")
+        self.assertEqual(self.thing.by_name, 1)
+        self.assertEqual(self.thing.by_id, 1)
+
+    def test_scope(self):
+        """Test names are not shared between accounts."""
+        self.thing.get_thing("my-thing")
+        other = Thing()
+        other.cfg = {"key": "other", "region": "us-south"}
+        other.get_thing("my-thing")
+        self.assertEqual(other.by_name, 1)
+
+    def test_scope_region(self):
+        """Test names are not shared between regions."""
+        self.thing.get_thing("my-thing")
+        with region("eu-de"):
+            self.thing.get_thing("my-thing")
+        self.assertEqual(self.thing.by_name, 2)
+
+    def test_stale_entry(self):
+        """Test cached ID is dropped when the resource is gone."""
+        self.thing.get_thing("my-thing")
+        self.thing.things = {"r006-0000": "my-thing"}
+        data = self.thing.get_thing("my-thing")
+        self.assertEqual(data["id"], "r006-0000")
+        self.assertEqual(self.thing.by_name, 2)
+
+    def test_invalidate(self):
+        """Test delete_* drops cached names of the resource type."""
+        self.thing.get_thing("my-thing")
+        self.thing.delete_thing("my-thing")
+        self.assertEqual(len(names.entries), 0)
+
+    def test_same_class_name(self):
+        """Test names are not shared between services."""
+        Power = type("Thing", (Thing,), {"__module__": "power.thing"})
+        self.thing.get_thing("my-thing")
+        other = Power()
+        other.get_thing("my-thing")
+        self.assertEqual(other.by_name, 1)
+        other.delete_thing("my-thing")
+        self.assertEqual(len(names.entries), 1)
+
+    def test_cached_id_without_name(self):
+        """Test body without name returned for a cached ID is not used."""
+        self.thing.get_thing("my-thing")
+        with patch.object(Thing, "get_thing_by_id",
+                          return_value={"description": "not found"}):
+            self.thing.get_thing("my-thing")
+        self.assertEqual(self.thing.by_name, 2)
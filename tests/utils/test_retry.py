@@ -0,0 +1,113 @@
+import http.client
+import ssl
+import time
+import unittest
+from email.utils import formatdate
+
+from mock import patch
+
+from ibmcloud_python_sdk.utils import retry
+
+
+class Response(object):
+    """Fake HTTP response"""
+
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class Flaky(object):
+    """Fake connection pool answering with a list of outcomes"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def request(self, method, path, payload=None, headers=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome, b"{}"
+
+
+@patch.object(retry.time, "sleep")
+class TestRetryPolicy(unittest.TestCase):
+    """Test case for the retry policy."""
+
+    def setUp(self):
+        self.policy = retry.RetryPolicy(attempts=3, backoff=1, max_backoff=8)
+
+    def test_status(self, sleep):
+        """Test retryable status is retried until success."""
+        conn = Flaky(Response(503), Response(502), Response(200))
+        res, _ = self.policy.request(conn, "GET", "/v1/vpcs")
+        self.assertEqual(res.status, 200)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_attempts(self, sleep):
+        """Test last response is returned once attempts are exhausted."""
+        conn = Flaky(*[Response(503)] * 5)
+        res, _ = self.policy.request(conn, "GET", "/v1/vpcs")
+        self.assertEqual(res.status, 503)
+        self.assertEqual(conn.calls, 3)
+
+    def test_error(self, sleep):
+        """Test connection reset and timeout are retried."""
+        conn = Flaky(ConnectionResetError(), TimeoutError(), Response(200))
+        res, _ = self.policy.request(conn, "GET", "/v1/vpcs")
+        self.assertEqual(res.status, 200)
+
+    def test_error_post(self, sleep):
+        """Test POST is not retried after a transport error."""
+        conn = Flaky(http.client.RemoteDisconnected(), Response(200))
+        with self.assertRaises(http.client.RemoteDisconnected):
+            self.policy.request(conn, "POST", "/v1/vpcs", "{}")
+        self.assertEqual(conn.calls, 1)
+
+    def test_post_throttled(self, sleep):
+        """Test POST is retried after 429 but not after 503."""
+        conn = Flaky(Response(429), Response(201))
+        self.assertEqual(self.policy.request(conn, "POST", "/")[0].status,
+                         201)
+        conn = Flaky(Response(503), Response(201))
+        self.assertEqual(self.policy.request(conn, "POST", "/")[0].status,
+                         503)
+
+    def test_certificate(self, sleep):
+        """Test invalid certificate is not retried."""
+        conn = Flaky(ssl.SSLCertVerificationError(), Response(200))
+        with self.assertRaises(ssl.SSLCertVerificationError):
+            self.policy.request(conn, "GET", "/v1/vpcs")
+
+    def test_retry_after(self, sleep):
+        """Test Retry-After header is honoured."""
+        conn = Flaky(Response(429, {"Retry-After": "7"}), Response(200))
+        self.policy.request(conn, "GET", "/v1/vpcs")
+        sleep.assert_called_once_with(7.0)
+
+    def test_backoff(self, sleep):
+        """Test backoff grows and is capped."""
+        for attempt in range(1, 10):
+            self.assertLessEqual(self.policy.delay(attempt),
+                                 min(2 ** (attempt - 1), 8))
+
+
+class TestRetryAfter(unittest.TestCase):
+    """Test case for the Retry-After header parsing."""
+
+    def test_date(self):
+        """Test HTTP date is converted into seconds."""
+        res = Response(503, {"Retry-After": formatdate(time.time() + 30,
+                                                       usegmt=True)})
+        self.assertAlmostEqual(retry.retry_after(res), 30, delta=2)
+
+    def test_invalid(self):
+        """Test invalid header is ignored."""
+        self.assertIsNone(retry.retry_after(Response(503, {
+            "Retry-After": "soon"})))
+        self.assertIsNone(retry.retry_after(Response(503)))
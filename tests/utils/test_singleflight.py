@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+
+from ibmcloud_python_sdk.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test case for the concurrent calls coalescing."""
+
+    def setUp(self):
+        self.flights = SingleFlight()
+        self.calls = 0
+
+    def slow(self, value):
+        self.calls += 1
+        time.sleep(0.05)
+        return value
+
+    def failing(self):
+        self.calls += 1
+        time.sleep(0.05)
+        raise Exception("error")
+
+    def run_threads(self, target):
+        threads = [threading.Thread(target=target) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_do(self):
+        """Test concurrent callers share a single call."""
+        results = []
+        self.run_threads(
+            lambda: results.append(self.flights.do("key", self.slow, 1)))
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [1] * 10)
+
+    def test_do_error(self):
+        """Test concurrent callers all get the exception."""
+        errors = []
+
+        def target():
+            try:
+                self.flights.do("key", self.failing)
+            except Exception as error:
+                errors.append(error)
+
+        self.run_threads(target)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(errors), 10)
+
+    def test_sequential(self):
+        """Test calls are not coalesced once finished."""
+        self.flights.do("key", self.slow, 1)
+        self.flights.do("key", self.slow, 1)
+        self.assertEqual(self.calls, 2)
+
+    def test_do_in_background(self):
+        """Test background call is skipped when one is running."""
+        self.flights.do_in_background("key", self.slow, 1)
+        time.sleep(0.01)
+        self.flights.do_in_background("key", self.slow, 1)
+        time.sleep(0.1)
+        self.assertEqual(self.calls, 1)
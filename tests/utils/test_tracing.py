@@ -0,0 +1,189 @@
+import contextlib
+import json
+import unittest
+
+from mock import patch
+
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import metrics
+from ibmcloud_python_sdk.utils import tracing
+
+
+class Span(object):
+    """Fake OpenTelemetry span"""
+
+    def __init__(self, name, parent):
+        self.name = name
+        self.parent = parent
+        self.attributes = {}
+        self.status = None
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_status(self, status):
+        self.status = status
+
+    def record_exception(self, error):
+        self.attributes["exception"] = error
+
+    def end(self):
+        self.ended = True
+
+
+class Trace(object):
+    """Fake opentelemetry.trace module recording the spans"""
+
+    class StatusCode(object):
+        ERROR = "ERROR"
+
+    def __init__(self):
+        self.spans = []
+        self.current = []
+
+    def Status(self, code, description=None):
+        return (code, description)
+
+    def get_tracer(self, name):
+        return self
+
+    def start_span(self, name):
+        span = Span(name, self.current[-1] if self.current else None)
+        self.spans.append(span)
+        return span
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name):
+        span = self.start_span(name)
+        self.current.append(span)
+        try:
+            yield span
+        finally:
+            self.current.pop()
+            span.end()
+
+
+class Response(object):
+    """Fake HTTP response"""
+
+    status = 200
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class Endpoint(object):
+    """Fake connection pool answering every request"""
+
+    def request(self, method, path, payload=None, headers=None):
+        return Response(), json.dumps({"name": "vpc"}).encode()
+
+
+class Thing(object):
+
+    def get_thing(self, thing):
+        return common.query_wrapper("iaas", "GET", "/v1/things/{}".format(
+            thing), {"Authorization": "Bearer token"})["data"]
+
+    def get_missing(self):
+        return {"errors": [{"code": "not_found"}]}
+
+    def get_softlayer(self):
+        return common.resource_error(404, "Not found")
+
+    def iter_things(self):
+        yield 1
+
+
+class TestTracing(unittest.TestCase):
+    """Test case for the OpenTelemetry spans."""
+
+    def setUp(self):
+        cache.clients.clear()
+        common.accounts["Bearer token"] = "account"
+        self.trace = Trace()
+        self.patchers = [
+            patch.object(tracing, "trace", self.trace),
+            patch.object(cache, "config", {"cache_backend": "memory",
+                                           "cache_ttl": 60}),
+            patch("ibmcloud_python_sdk.utils.pool.get_pool",
+                  lambda *args: Endpoint()),
+            patch.dict(metrics.hooks, {event: list(hooks) for event, hooks
+                                       in metrics.hooks.items()}),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        tracing.instrument()
+        self.thing = tracing.traced(type("Thing", (Thing,),
+                                         dict(vars(Thing))))()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        cache.clients.clear()
+
+    def test_spans(self):
+        """Test request span is a child of the method span."""
+        self.thing.get_thing("r006-8c8a2c3a-7e2c-4bd4-9c5c-4d5e6f7a8b9c")
+        method, request = self.trace.spans
+        self.assertEqual(method.name, "Thing.get_thing")
+        self.assertIs(request.parent, method)
+        self.assertEqual(request.name, "GET /v1/things/{id}")
+        self.assertEqual(request.attributes["http.status_code"], 200)
+        self.assertEqual(request.attributes["ibmcloud.cache"], "miss")
+        self.assertTrue(request.ended and method.ended)
+
+    def test_cache_hit(self):
+        """Test request served from cache has its own span."""
+        self.thing.get_thing("my-thing")
+        self.thing.get_thing("my-thing")
+        request = self.trace.spans[-1]
+        self.assertEqual(request.attributes["ibmcloud.cache"], "fresh")
+        self.assertNotIn("http.status_code", request.attributes)
+
+    def test_error(self):
+        """Test error returned by a method sets the span status."""
+        self.thing.get_missing()
+        self.assertEqual(self.trace.spans[0].status, ("ERROR", "not_found"))
+
+    def test_error_not_wrapped(self):
+        """Test SoftLayer error returned by a method sets the span status."""
+        data = self.thing.get_softlayer()
+        self.assertEqual(data["errors"]["code"], "not_found")
+        self.assertEqual(self.trace.spans[0].status, ("ERROR", "not_found"))
+
+    def test_retried_attempts(self):
+        """Test every attempt of a retried request has its own span."""
+        statuses = [503, 200]
+
+        def request(method, path, payload=None, headers=None):
+            res = Response()
+            res.status = statuses.pop(0)
+            return res, json.dumps({"name": "vpc"}).encode()
+        endpoint = Endpoint()
+        endpoint.request = request
+        with patch("ibmcloud_python_sdk.utils.pool.get_pool",
+                   lambda *args: endpoint), \
+                patch("ibmcloud_python_sdk.utils.retry.time.sleep"):
+            self.thing.get_thing("my-thing")
+        method, first, second = self.trace.spans
+        self.assertIs(first.parent, method)
+        self.assertIs(second.parent, method)
+        self.assertEqual(first.attributes["http.status_code"], 503)
+        self.assertEqual(first.attributes["ibmcloud.attempt"], 1)
+        self.assertEqual(second.attributes["http.status_code"], 200)
+        self.assertEqual(second.attributes["ibmcloud.attempt"], 2)
+        self.assertTrue(first.ended and second.ended)
+
+    def test_generator(self):
+        """Test generators are not wrapped."""
+        self.assertEqual(list(self.thing.iter_things()), [1])
+        self.assertEqual(self.trace.spans, [])
+
+    def test_disabled(self):
+        """Test classes are left untouched without OpenTelemetry."""
+        with patch.object(tracing, "trace", None):
+            self.assertIs(tracing.traced(Thing), Thing)
+            self.assertFalse(tracing.enabled())